@@ -16,6 +16,13 @@ from .pipeline import (
 
 from .lib import (
     maintain_current_timeline,
+    begin_timeline_switch_session,
+    end_timeline_switch_session,
+    timeline_switch_session,
+    maintain_page_by_name,
+    begin_page_session,
+    end_page_session,
+    page_session,
     get_project_manager,
     get_current_resolve_project,
     get_current_timeline,
@@ -24,16 +31,25 @@ from .lib import (
     export_timeline_otio_to_file,
     export_timeline_otio,
     create_bin,
+    invalidate_bin_cache,
     get_media_pool_item,
+    get_media_pool_index,
+    move_media_pool_items,
     create_media_pool_item,
     create_timeline_item,
+    create_timeline_items,
     get_timeline_item,
     get_clip_resolution_from_media_pool,
+    get_clip_properties,
+    invalidate_clip_properties,
     get_video_track_names,
     get_current_timeline_items,
+    get_timeline_snapshot,
     get_timeline_item_by_name,
     get_timeline_item_ayon_tag,
     set_timeline_item_ayon_tag,
+    AyonTagTransaction,
+    ayon_tag_transaction,
     imprint,
     set_publish_attribute,
     get_publish_attribute,
@@ -42,6 +58,7 @@ from .lib import (
     get_pype_clip_metadata,
     set_project_manager_to_folder_name,
     get_otio_clip_instance_data,
+    get_otio_interval_index,
     get_reformated_path,
     detect_project_fps_mismatch,
     detect_project_resolution_mismatch,
@@ -95,6 +112,13 @@ __all__ = [
 
     # lib
     "maintain_current_timeline",
+    "begin_timeline_switch_session",
+    "end_timeline_switch_session",
+    "timeline_switch_session",
+    "maintain_page_by_name",
+    "begin_page_session",
+    "end_page_session",
+    "page_session",
     "get_project_manager",
     "get_current_resolve_project",
     "get_current_timeline",
@@ -103,16 +127,25 @@ __all__ = [
     "export_timeline_otio_to_file",
     "export_timeline_otio",
     "create_bin",
+    "invalidate_bin_cache",
     "get_media_pool_item",
+    "get_media_pool_index",
+    "move_media_pool_items",
     "create_media_pool_item",
     "create_timeline_item",
+    "create_timeline_items",
     "get_timeline_item",
     "get_clip_resolution_from_media_pool",
+    "get_clip_properties",
+    "invalidate_clip_properties",
     "get_video_track_names",
     "get_current_timeline_items",
+    "get_timeline_snapshot",
     "get_timeline_item_by_name",
     "get_timeline_item_ayon_tag",
     "set_timeline_item_ayon_tag",
+    "AyonTagTransaction",
+    "ayon_tag_transaction",
     "imprint",
     "set_publish_attribute",
     "get_publish_attribute",
@@ -121,6 +154,7 @@ __all__ = [
     "get_pype_clip_metadata",
     "set_project_manager_to_folder_name",
     "get_otio_clip_instance_data",
+    "get_otio_interval_index",
     "get_reformated_path",
     "detect_project_fps_mismatch",
     "detect_project_resolution_mismatch",
@@ -0,0 +1,145 @@
+"""
+Cache of media pool bins by path.
+
+Resolving bin path `Loader/ep01/sq01/sh010` means listing subfolders of
+every level and reading name of every sibling, one IPC round trip each.
+`BinPathCache` remembers folders found or created by AYON by normalized
+path. Cached bin is revalidated by its unique id, name, stale state and
+presence in its parent bin once per operation (see
+`operation_cache.operation_scope`) and trusted for the rest of it, so loads
+of many clips into deep hierarchies walk the media pool only once.
+
+Caches are kept per project for the whole session, see `get_cache`.
+"""
+from . import operation_cache
+
+# Caches by unique id of project
+_CACHES = {}
+
+
+def normalize_bin_path(path):
+    """Return bin path in form used for cache lookups.
+
+    Args:
+        path (str): Bin path separated by forward or backward slashes.
+
+    Returns:
+        str: Path with forward slashes and without empty segments.
+    """
+    return "/".join(
+        segment
+        for segment in path.replace("\\", "/").split("/")
+        if segment
+    )
+
+
+class _BinCacheEntry:
+    __slots__ = ("folder", "unique_id", "parent", "operation_id")
+
+    def __init__(self, folder, unique_id, parent, operation_id):
+        self.folder = folder
+        self.unique_id = unique_id
+        self.parent = parent
+        self.operation_id = operation_id
+
+
+class BinPathCache:
+    """Media pool bins by unique id of root bin and normalized path."""
+
+    def __init__(self):
+        self._entries = {}
+
+    def __len__(self):
+        return len(self._entries)
+
+    def get(self, root_id, path):
+        """Return cached bin if it is still valid.
+
+        Args:
+            root_id (Union[str, None]): Unique id of root bin of the path,
+                None for media pool root bin.
+            path (str): Normalized bin path relative to the root bin.
+
+        Returns:
+            Union[resolve.Folder, None]: Bin if cached and valid.
+        """
+        key = (root_id, path)
+        entry = self._entries.get(key)
+        if entry is None:
+            return None
+
+        operation_id = operation_cache.get_operation_id()
+        if operation_id is not None and entry.operation_id == operation_id:
+            return entry.folder
+
+        if not self._is_valid(root_id, path, entry):
+            self.invalidate()
+            return None
+
+        entry.operation_id = operation_id
+        return entry.folder
+
+    def _is_valid(self, root_id, path, entry):
+        # renamed bins keep their unique id
+        folder = entry.folder
+        if (
+            folder.GetUniqueId() != entry.unique_id
+            or folder.GetName() != path.rsplit("/", 1)[-1]
+            or folder.GetIsFolderStale()
+        ):
+            return False
+
+        # moved bins keep their unique id and name, all bins of the path
+        # have to be still children of their cached parents
+        if "/" in path and self.get(root_id, path.rsplit("/", 1)[0]) is None:
+            return False
+        return any(
+            subfolder.GetUniqueId() == entry.unique_id
+            for subfolder in entry.parent.GetSubFolderList() or []
+        )
+
+    def add(self, root_id, path, folder, parent):
+        """Cache bin found or created on the path.
+
+        Args:
+            root_id (Union[str, None]): Unique id of root bin of the path,
+                None for media pool root bin.
+            path (str): Normalized bin path relative to the root bin.
+            folder (resolve.Folder): Bin on the path.
+            parent (resolve.Folder): Parent bin of the bin.
+        """
+        self._entries[(root_id, path)] = _BinCacheEntry(
+            folder,
+            folder.GetUniqueId(),
+            parent,
+            operation_cache.get_operation_id(),
+        )
+
+    def invalidate(self):
+        """Forget all cached bins."""
+        self._entries.clear()
+
+
+def get_cache(project):
+    """Return bin path cache of project.
+
+    Args:
+        project (resolve.Project): Resolve project.
+
+    Returns:
+        BinPathCache: Cache of project bins.
+    """
+    project_id = project.GetUniqueId()
+    cache = _CACHES.get(project_id)
+    if cache is None:
+        cache = BinPathCache()
+        _CACHES[project_id] = cache
+    return cache
+
+
+def invalidate(project=None):
+    """Drop bin path cache of project or of all projects."""
+    if project is None:
+        _CACHES.clear()
+        return
+    _CACHES.pop(project.GetUniqueId(), None)
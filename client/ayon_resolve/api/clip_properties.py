@@ -0,0 +1,146 @@
+"""
+Snapshots of media pool item clip properties.
+
+Each `GetClipProperty("X")` call is one IPC round trip and exporters and
+loaders read half a dozen properties of every clip. `ClipProperties` reads
+all properties with single `GetClipProperty()` call and keeps parsed values
+of the commonly used ones. Numeric values are parsed on access and raise
+`ValueError` naming the property when Resolve returns a value which is not
+a number, e.g. frames of an audio clip. Snapshots are shared within an
+active operation (see `operation_cache.operation_scope`) and have to be
+invalidated when AYON changes clip properties with `SetClipProperty`.
+"""
+from . import constants, operation_cache
+
+# Name of operation cache with snapshots by unique id of media pool item
+_CACHE_NAME = "clip_properties"
+
+
+class ClipProperties:
+    """Parsed clip properties of a media pool item.
+
+    Text values which are not set are empty strings or None, numeric
+    values which are not set or can't be parsed raise `ValueError`.
+
+    Args:
+        media_pool_item (resolve.MediaPoolItem): Media pool item.
+        properties (Optional[dict]): Already read clip properties.
+    """
+    __slots__ = (
+        "item",
+        "properties",
+        "file_path",
+        "file_name",
+        "clip_type",
+        "duration",
+        "start_tc",
+        "pixel_aspect",
+    )
+
+    def __init__(self, media_pool_item, properties=None):
+        self.item = media_pool_item
+        if properties is None:
+            properties = media_pool_item.GetClipProperty() or {}
+        self.properties = properties
+
+        self.file_path = properties.get("File Path") or ""
+        self.file_name = properties.get("File Name") or ""
+        self.clip_type = properties.get("Type") or ""
+        self.duration = properties.get("Duration") or None
+        self.start_tc = properties.get("Start TC") or None
+
+        # Pixel Aspect Resolution, unknown or undetected PAR is square
+        self.pixel_aspect = constants.PAR_VALUES.get(
+            properties.get("PAR"), 1.0)
+
+    def __repr__(self):
+        return f"<ClipProperties '{self.file_name}'>"
+
+    def get(self, name, default=None):
+        """Return raw value of clip property."""
+        return self.properties.get(name, default)
+
+    def _get_number(self, name, number_type):
+        value = self.properties.get(name)
+        try:
+            return number_type(value)
+        except (TypeError, ValueError):
+            raise ValueError(
+                f"Clip property '{name}' of '{self.file_name}' is not "
+                f"a number: {value!r}"
+            ) from None
+
+    @property
+    def fps(self):
+        return self._get_number("FPS", float)
+
+    @property
+    def start(self):
+        return self._get_number("Start", int)
+
+    @property
+    def end(self):
+        return self._get_number("End", int)
+
+    @property
+    def frames(self):
+        return self._get_number("Frames", int)
+
+    @property
+    def audio_channels(self):
+        return self._get_number("Audio Ch", int)
+
+    @property
+    def resolution(self):
+        """Return width and height of the clip."""
+        value = self.properties.get("Resolution")
+        try:
+            width, height = value.split("x")
+            return int(width), int(height)
+        except (AttributeError, ValueError):
+            raise ValueError(
+                f"Clip property 'Resolution' of '{self.file_name}' is not "
+                f"a resolution: {value!r}"
+            ) from None
+
+    @property
+    def width(self):
+        return self.resolution[0]
+
+    @property
+    def height(self):
+        return self.resolution[1]
+
+
+def get_clip_properties(media_pool_item):
+    """Return clip properties snapshot shared within active operation.
+
+    Snapshot is read for each call if no operation is active.
+
+    Args:
+        media_pool_item (resolve.MediaPoolItem): Media pool item.
+
+    Returns:
+        ClipProperties: Clip properties of the item.
+    """
+    snapshots = operation_cache.get_cache(_CACHE_NAME)
+    if snapshots is None:
+        return ClipProperties(media_pool_item)
+
+    item_id = media_pool_item.GetUniqueId()
+    snapshot = snapshots.get(item_id)
+    if snapshot is None:
+        snapshot = ClipProperties(media_pool_item)
+        snapshots[item_id] = snapshot
+    return snapshot
+
+
+def invalidate(media_pool_item=None):
+    """Drop clip properties snapshot of media pool item or all snapshots."""
+    snapshots = operation_cache.get_cache(_CACHE_NAME)
+    if not snapshots:
+        return
+    if media_pool_item is None:
+        snapshots.clear()
+        return
+    snapshots.pop(media_pool_item.GetUniqueId(), None)
@@ -0,0 +1,162 @@
+"""
+Project-wide index of timeline items using media pool items.
+
+Resolve can only tell how many times a media pool item is used, finding
+the timeline items means walking all timelines and tracks and asking every
+timeline item for its media pool item. `ClipUsageIndex` does the walk once
+and is kept for the project, so removing many containers walks the project
+only once. Whether a media pool item is used at all is still decided by its
+`Usage` clip property which counts also usage in compound clips and nested
+timelines. Timeline items found in the index are verified against it and
+the index is built again when they don't match.
+"""
+import collections
+
+TRACK_TYPES = ("video", "audio")
+
+# Usage indexes by unique id of project
+_INDEXES = {}
+
+
+class ClipUsageIndex:
+    """Timeline items by unique id of their media pool item.
+
+    Args:
+        project (resolve.Project): Project to index.
+    """
+
+    def __init__(self, project):
+        self.project = project
+        self._timelines_by_id = {}
+        # media pool item id -> list of (timeline id, timeline item)
+        self._usage = collections.defaultdict(list)
+        self.build()
+
+    def build(self):
+        """Walk all timelines of the project and collect item usage."""
+        self._timelines_by_id.clear()
+        self._usage.clear()
+        timeline_count = int(self.project.GetTimelineCount() or 0)
+        for timeline_index in range(1, timeline_count + 1):
+            timeline = self.project.GetTimelineByIndex(timeline_index)
+            timeline_id = timeline.GetUniqueId()
+            self._timelines_by_id[timeline_id] = timeline
+
+            # Consider audio and video tracks
+            for track_type in TRACK_TYPES:
+                track_count = int(timeline.GetTrackCount(track_type) or 0)
+                for track_index in range(1, track_count + 1):
+                    timeline_items = timeline.GetItemListInTrack(
+                        track_type, track_index) or []
+                    for timeline_item in timeline_items:
+                        media_pool_item = timeline_item.GetMediaPoolItem()
+                        if not media_pool_item:
+                            continue
+                        self._usage[media_pool_item.GetUniqueId()].append(
+                            (timeline_id, timeline_item))
+
+    def get_timeline(self, timeline_id):
+        """Return timeline by its unique id."""
+        return self._timelines_by_id.get(timeline_id)
+
+    def get_usage(self, media_pool_item):
+        """Return timeline items using the media pool item.
+
+        Args:
+            media_pool_item (resolve.MediaPoolItem): Media pool item.
+
+        Returns:
+            list[tuple[resolve.Timeline, resolve.TimelineItem]]: Timeline
+                with the timeline item.
+        """
+        return [
+            (self._timelines_by_id[timeline_id], timeline_item)
+            for timeline_id, timeline_item
+            in self._usage.get(media_pool_item.GetUniqueId(), [])
+        ]
+
+    def get_usage_count(self, media_pool_item):
+        """Return number of timeline items using the media pool item."""
+        return len(self._usage.get(media_pool_item.GetUniqueId(), []))
+
+    def find_usage(self, media_pool_item, usage):
+        """Return timeline items using the media pool item.
+
+        Index is built again if the items don't match `Usage` clip property
+        of the media pool item, or some of them don't use it anymore.
+
+        Args:
+            media_pool_item (resolve.MediaPoolItem): Media pool item.
+            usage (int): Value of `Usage` clip property.
+
+        Returns:
+            list[tuple[resolve.Timeline, resolve.TimelineItem]]: Timeline
+                with the timeline item.
+        """
+        if not self._is_usage_valid(media_pool_item, usage):
+            self.build()
+        return self.get_usage(media_pool_item)
+
+    def _is_usage_valid(self, media_pool_item, usage):
+        item_id = media_pool_item.GetUniqueId()
+        used_items = self._usage.get(item_id, [])
+        if len(used_items) != usage:
+            return False
+        for _timeline_id, timeline_item in used_items:
+            used_media_pool_item = timeline_item.GetMediaPoolItem()
+            if (
+                not used_media_pool_item
+                or used_media_pool_item.GetUniqueId() != item_id
+            ):
+                return False
+        return True
+
+    def remove_timeline_item(self, media_pool_item, timeline_item):
+        """Forget deleted timeline item.
+
+        Args:
+            media_pool_item (resolve.MediaPoolItem): Media pool item used
+                by the timeline item.
+            timeline_item (resolve.TimelineItem): Deleted timeline item.
+        """
+        usage = self._usage.get(media_pool_item.GetUniqueId())
+        if not usage:
+            return
+        item_id = timeline_item.GetUniqueId()
+        for index, (_timeline_id, used_item) in enumerate(usage):
+            if used_item.GetUniqueId() == item_id:
+                del usage[index]
+                break
+
+    def remove_media_pool_item(self, media_pool_item):
+        """Forget deleted media pool item and all its usage."""
+        self._usage.pop(media_pool_item.GetUniqueId(), None)
+
+
+def get_index(project):
+    """Return clip usage index of the project, built on first use.
+
+    Args:
+        project (resolve.Project): Project to index.
+
+    Returns:
+        ClipUsageIndex: Usage index of the project.
+    """
+    project_id = project.GetUniqueId()
+    index = _INDEXES.get(project_id)
+    if index is None:
+        index = ClipUsageIndex(project)
+        _INDEXES[project_id] = index
+    return index
+
+
+def get_cached_index(project):
+    """Return clip usage index only if it was already built.
+
+    Args:
+        project (resolve.Project): Indexed project.
+
+    Returns:
+        Union[ClipUsageIndex, None]: Usage index of the project.
+    """
+    return _INDEXES.get(project.GetUniqueId())
@@ -11,7 +11,8 @@ LEGACY_OPENPYPE_MARKER_NAME = "OpenPypeData"
 AYON_MARKER_NAME = "AYONData"
 AYON_MARKER_DURATION = 1
 AYON_MARKER_COLOR = "Mint"
-TEMP_MARKER_FRAME = None
+# Prefix of custom data identifying markers written by AYON
+AYON_MARKER_CUSTOM_DATA = "AYONData"
 
 # Ayon default timeline
 AYON_TIMELINE_NAME = "AYONTimeline"
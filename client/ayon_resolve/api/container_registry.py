@@ -0,0 +1,188 @@
+"""
+Registry of loaded containers.
+
+Listing containers means reading and decoding AYON metadata of every media
+pool clip and AYON marker of every timeline item. `ContainerRegistry` keeps
+the containers found by the last full listing, indexed by object unique id,
+representation id and loader name. Loaders update it when they load, update
+or remove containers and media pool containers are revalidated with single
+call per container instead of listing the media pool again. The media pool
+is listed again only when the media pool index sees bins or clips changed
+outside of AYON.
+
+Registries are kept per project for the whole session, see `get_registry`.
+"""
+import collections
+
+# Sources of containers
+MEDIA_POOL = "media_pool"
+TIMELINE = "timeline"
+
+# Registries by unique id of project
+_REGISTRIES = {}
+
+
+class ContainerRegistry:
+    """Containers of a project by object unique id."""
+
+    def __init__(self):
+        # object id -> (source, container)
+        self._containers = {}
+        self._ids_by_representation = collections.defaultdict(set)
+        self._ids_by_loader = collections.defaultdict(set)
+        self._built_sources = set()
+
+    def __len__(self):
+        return len(self._containers)
+
+    def is_built(self, source):
+        """Return whether all containers of the source were collected."""
+        return source in self._built_sources
+
+    def set_source(self, source, containers):
+        """Replace all containers of the source.
+
+        Args:
+            source (str): Source of the containers.
+            containers (Iterable[tuple[str, dict]]): Object unique id with
+                container data.
+        """
+        for object_id in [
+            object_id
+            for object_id, (container_source, _) in self._containers.items()
+            if container_source == source
+        ]:
+            self.remove(object_id)
+
+        for object_id, container in containers:
+            self.add(object_id, container, source)
+        self._built_sources.add(source)
+
+    def add(self, object_id, container, source):
+        """Add or replace container of an object.
+
+        Args:
+            object_id (str): Unique id of the containerized object.
+            container (dict): Container data.
+            source (str): Source of the container.
+        """
+        self.remove(object_id)
+        self._containers[object_id] = (source, container)
+        self._ids_by_representation[container["representation"]].add(
+            object_id)
+        self._ids_by_loader[container["loader"]].add(object_id)
+
+    def remove(self, object_id):
+        """Remove container of an object.
+
+        Returns:
+            Union[dict, None]: Removed container data.
+        """
+        item = self._containers.pop(object_id, None)
+        if item is None:
+            return None
+
+        _source, container = item
+        _discard_from_mapping(
+            self._ids_by_representation, container["representation"],
+            object_id
+        )
+        _discard_from_mapping(
+            self._ids_by_loader, container["loader"], object_id)
+        return container
+
+    def get(self, object_id):
+        """Return container of an object."""
+        item = self._containers.get(object_id)
+        return item[1] if item else None
+
+    def get_by_representation(self, representation_id, loader=None):
+        """Return containers of representation.
+
+        Args:
+            representation_id (str): Representation id.
+            loader (Optional[str]): Keep only containers of the loader.
+
+        Returns:
+            list[dict]: Container data.
+        """
+        object_ids = self._ids_by_representation.get(representation_id, set())
+        if loader is not None:
+            object_ids = object_ids & self._ids_by_loader.get(loader, set())
+        return [self._containers[object_id][1] for object_id in object_ids]
+
+    def get_by_loader(self, loader):
+        """Return containers of loader."""
+        return [
+            self._containers[object_id][1]
+            for object_id in self._ids_by_loader.get(loader, set())
+        ]
+
+    def iter_containers(self, source=None):
+        """Iterate containers in order they were added.
+
+        Args:
+            source (Optional[str]): Keep only containers of the source.
+
+        Yields:
+            dict: Container data.
+        """
+        for container_source, container in list(self._containers.values()):
+            if source is None or container_source == source:
+                yield container
+
+    def validate(self, source, is_valid):
+        """Drop containers whose object does not exist anymore.
+
+        Args:
+            source (str): Source of containers to validate.
+            is_valid (Callable[[str, dict], bool]): Called with object id and
+                container, returns whether the object still exists.
+
+        Returns:
+            int: Number of dropped containers.
+        """
+        invalid_ids = [
+            object_id
+            for object_id, (container_source, container)
+            in list(self._containers.items())
+            if container_source == source
+            and not is_valid(object_id, container)
+        ]
+        for object_id in invalid_ids:
+            self.remove(object_id)
+        return len(invalid_ids)
+
+
+def get_registry(project):
+    """Return container registry of project.
+
+    Args:
+        project (resolve.Project): Project of the containers.
+
+    Returns:
+        ContainerRegistry: Registry of the project.
+    """
+    project_id = project.GetUniqueId()
+    registry = _REGISTRIES.get(project_id)
+    if registry is None:
+        registry = ContainerRegistry()
+        _REGISTRIES[project_id] = registry
+    return registry
+
+
+def invalidate(project=None):
+    """Drop container registry of project or of all projects."""
+    if project is None:
+        _REGISTRIES.clear()
+        return
+    _REGISTRIES.pop(project.GetUniqueId(), None)
+
+
+def _discard_from_mapping(mapping, key, value):
+    values = mapping.get(key)
+    if not values:
+        return
+    values.discard(value)
+    if not values:
+        del mapping[key]
@@ -1,7 +1,9 @@
 import re
 import os
+import copy
+import shutil
 import json
-import uuid
+import collections
 import contextlib
 import tempfile
 from typing import List, Dict, Any
@@ -19,8 +21,22 @@ from ayon_core.pipeline.context_tools import (
 )
 from ayon_core.pipeline.tempdir import create_custom_tempdir
 
-from . import constants
+from . import (
+    bin_cache,
+    clip_properties,
+    clip_usage,
+    constants,
+    markers,
+    media_pool_index,
+    operation_cache,
+    page_manager,
+    timeline_scheduler,
+    timeline_snapshot,
+    tracing,
+)
 from ..otio import davinci_export as otio_export
+from ..otio import interval_index as otio_interval_index
+from ..otio import timeline_cache as otio_timeline_cache
 
 log = Logger.get_logger(__name__)
 
@@ -31,28 +47,22 @@ def get_timeline_media_pool_item(timeline, root=None) -> object:
 
     Args:
         timeline (resolve.Timeline): timeline object
-        root (resolve.Folder): root folder / bin object
+        root (resolve.Folder): bin the timeline was created or imported in,
+            searched first for timelines created since the media pool was
+            indexed, current bin if not provided
 
     Returns:
         resolve.MediaPoolItem: media pool item from timeline
     """
+    # DaVinci Resolve 20+ can return the media pool item directly.
+    if getattr(timeline, "GetMediaPoolItem", None) is not None:
+        media_pool_item = timeline.GetMediaPoolItem()
+        if media_pool_item:
+            return media_pool_item
 
-    # Due to limitations in the Resolve API we can't get
-    # the media pool item directly from the timeline.
-    # We can find it by name, however names are not
-    # enforced to be unique across bins. So, we give it
-    # unique name.
-    original_name = timeline.GetName()
-    identifier = str(uuid.uuid4().hex)
-    try:
-        timeline.SetName(identifier)
-        for item in iter_all_media_pool_clips(root=root):
-            if item.GetName() != identifier:
-                continue
-            return item
-    finally:
-        # Revert to original name
-        timeline.SetName(original_name)
+    # Older versions can't get the media pool item from the timeline, it
+    # is found by its name in media pool index.
+    return get_media_pool_index().get_timeline_item(timeline, folder=root)
 
 
 @contextlib.contextmanager
@@ -60,8 +70,15 @@ def maintain_current_timeline(to_timeline: object,
                               from_timeline: object = None):
     """Maintain current timeline selection during context
 
+    Timeline is switched only if it is not current already. While timeline
+    switch session is active (see `timeline_switch_session`) the original
+    timeline is restored once at the end of the session instead.
+
     Attributes:
-        from_timeline (resolve.Timeline)[optional]:
+        to_timeline (resolve.Timeline or resolve.MediaPoolItem): timeline
+            or its media pool item
+        from_timeline (resolve.Timeline)[optional]: timeline made current
+            on exit, current timeline by default
     Example:
         >>> print(from_timeline.GetName())
         timeline1
@@ -76,39 +93,71 @@ def maintain_current_timeline(to_timeline: object,
         timeline1
     """
     project = get_current_resolve_project()
-    working_timeline = from_timeline or project.GetCurrentTimeline()
 
     # search timeline withing project timelines in case the
     # to_timeline is MediaPoolItem
-    # Note: this is a hacky way of identifying if object is timeline since
-    #   mediapool item is not having AddTrack attribute. API is not providing
-    #   any other way to identify the object type. And hasattr is returning
-    #   false info.
-    if "AddTrack" not in dir(to_timeline):
-        tcount = project.GetTimelineCount()
-        for idx in range(0, int(tcount)):
-            timeline = project.GetTimelineByIndex(idx + 1)
-            if timeline.GetName() == to_timeline.GetName():
-                to_timeline = timeline
-                break
+    timeline = timeline_scheduler.resolve_timeline(project, to_timeline)
+    if timeline is None:
+        raise ValueError(f"Failed to switch to timeline: {to_timeline}")
 
-    try:
-        # switch to the input timeline
-        result = project.SetCurrentTimeline(to_timeline)
-        if not result:
-            raise ValueError(f"Failed to switch to timeline: {to_timeline}")
+    with timeline_scheduler.maintain_current_timeline(
+        project, from_timeline
+    ) as switch:
+        switch(timeline)
+        yield timeline
+
+
+def begin_timeline_switch_session():
+    """Start coalescing of timeline switches.
+
+    Timelines made current by `maintain_current_timeline` are not restored
+    until `end_timeline_switch_session` is called.
+    """
+    timeline_scheduler.begin_session()
+
+
+def end_timeline_switch_session():
+    """Restore timeline current before the session started.
+
+    Returns:
+        int: number of timeline switches made during the session
+    """
+    if not timeline_scheduler.is_session_active():
+        return 0
+    return timeline_scheduler.end_session(get_current_resolve_project())
+
+
+@contextlib.contextmanager
+def timeline_switch_session():
+    """Coalesce timeline switches made within the context.
+
+    Example:
+        >>> with timeline_switch_session():
+        ...     for timeline_mp_item in timeline_mp_items:
+        ...         with maintain_current_timeline(timeline_mp_item):
+        ...             render(timeline_mp_item)
+    """
+    # nested in an active session
+    if timeline_scheduler.is_session_active():
+        yield
+        return
 
-        current_timeline = project.GetCurrentTimeline()
-        yield current_timeline
+    begin_timeline_switch_session()
+    try:
+        yield
     finally:
-        # put the original working timeline to context
-        project.SetCurrentTimeline(working_timeline)
+        end_timeline_switch_session()
 
 
 @contextlib.contextmanager
 def maintain_page_by_name(page_name):
     """Maintain specific page by name.
 
+    Page is opened only if it is not open already. Requests are reference
+    counted, nested requests of other pages go back to the outer page on
+    exit and the original page is restored when the outermost request
+    exits, or at the end of page session (see `page_session`).
+
     Args:
         page_name (str): name of the page
 
@@ -118,15 +167,49 @@ def maintain_page_by_name(page_name):
         Deliver page is open
     """
     from . import bmdvr
-    current_page = bmdvr.GetCurrentPage()
 
-    if not bmdvr.OpenPage(page_name):
-        raise ValueError(f"Could not open page {page_name}")
+    with page_manager.get_page_manager().maintain_page(bmdvr, page_name):
+        yield
+
+
+def begin_page_session():
+    """Keep pages open by `maintain_page_by_name` until session ends."""
+    from . import bmdvr
+
+    page_manager.get_page_manager().begin_session(bmdvr)
+
+
+def end_page_session():
+    """Restore page open before the session started.
+
+    Returns:
+        int: number of page switches made during the session
+    """
+    from . import bmdvr
+
+    return page_manager.get_page_manager().end_session(bmdvr)
+
+
+@contextlib.contextmanager
+def page_session():
+    """Keep pages open within the context, restore original page once.
 
+    Example:
+        >>> with page_session():
+        ...     for timeline_item in timeline_items:
+        ...         with maintain_page_by_name("Deliver"):
+        ...             render(timeline_item)
+    """
+    # nested in an active session
+    if page_manager.get_page_manager().session_active:
+        yield
+        return
+
+    begin_page_session()
     try:
         yield
     finally:
-        bmdvr.OpenPage(current_page)
+        end_page_session()
 
 
 def get_project_manager():
@@ -139,7 +222,7 @@ def get_project_manager():
     if not project_manager:
         project_manager = bmdvr.GetProjectManager()
 
-    return project_manager
+    return tracing.trace(project_manager, "ProjectManager")
 
 
 def get_media_storage():
@@ -151,7 +234,7 @@ def get_media_storage():
     from . import bmdvr, media_storage
     if not media_storage:
         media_storage = bmdvr.GetMediaStorage()
-    return media_storage
+    return tracing.trace(media_storage, "MediaStorage")
 
 
 def get_current_resolve_project():
@@ -211,10 +294,24 @@ def get_new_timeline(timeline_name: str = None):
     media_pool = resolve_project.GetMediaPool()
     new_timeline = media_pool.CreateEmptyTimeline(
         timeline_name or constants.AYON_TIMELINE_NAME)
+    _index_new_timeline(resolve_project, new_timeline)
     resolve_project.SetCurrentTimeline(new_timeline)
     return new_timeline
 
 
+def _index_new_timeline(project, timeline, folder=None):
+    """Add media pool item of timeline created by AYON to the index.
+
+    Timelines are created in the current bin. Only already built index is
+    updated, otherwise the timeline would look like a change made outside
+    of AYON and the whole index would be built again.
+    """
+    index = media_pool_index.get_cached_index(project)
+    if index is not None and timeline:
+        index.update_folder(
+            folder or project.GetMediaPool().GetCurrentFolder())
+
+
 def create_bin(name: str,
                root: object = None,
                set_as_current: bool = True) -> object:
@@ -225,6 +322,9 @@ def create_bin(name: str,
     If the input name is with forward or backward slashes then it will create
     all parents and return the last child bin object
 
+    Resolved bins are cached by path (see `bin_cache`), repeated calls for
+    the same path do not walk the media pool again.
+
     Args:
         name (str): name of folder / bin, or hierarchycal name "parent/name"
         root (resolve.Folder)[optional]: root folder / bin object
@@ -235,31 +335,59 @@ def create_bin(name: str,
         object: resolve.Folder
     """
     # get all variables
-    media_pool = get_current_resolve_project().GetMediaPool()
-    root_bin = root or media_pool.GetRootFolder()
-
-    # create hierarchy of bins in case there is slash in name
-    if "/" in name.replace("\\", "/"):
-        child_bin = None
-        for bname in name.split("/"):
-            child_bin = create_bin(bname,
-                                   root=child_bin or root_bin,
-                                   set_as_current=set_as_current)
-        if child_bin:
-            return child_bin
-    else:
-        # Find existing folder or create it
-        for subfolder in root_bin.GetSubFolderList():
-            if subfolder.GetName() == name:
-                created_bin = subfolder
-                break
-        else:
-            created_bin = media_pool.AddSubFolder(root_bin, name)
-
-        if set_as_current:
-            media_pool.SetCurrentFolder(created_bin)
-
-        return created_bin
+    project = get_current_resolve_project()
+    media_pool = project.GetMediaPool()
+    cache = bin_cache.get_cache(project)
+    root_id = root.GetUniqueId() if root else None
+    path = bin_cache.normalize_bin_path(name) or name
+
+    # find deepest cached bin of the hierarchy
+    names = path.split("/")
+    created_bin = None
+    depth = len(names)
+    while depth:
+        created_bin = cache.get(root_id, "/".join(names[:depth]))
+        if created_bin is not None:
+            break
+        depth -= 1
+
+    if created_bin is None:
+        created_bin = root or media_pool.GetRootFolder()
+
+    # create rest of hierarchy of bins in case there is slash in name
+    for index in range(depth, len(names)):
+        parent_bin = created_bin
+        created_bin = _get_or_create_sub_bin(
+            project, parent_bin, names[index])
+        cache.add(
+            root_id, "/".join(names[:index + 1]), created_bin, parent_bin)
+
+    # only the resulting bin is made current, not each bin of the hierarchy
+    if set_as_current:
+        media_pool.SetCurrentFolder(created_bin)
+
+    return created_bin
+
+
+def _get_or_create_sub_bin(project, parent_bin, name):
+    """Find existing sub-folder of the bin by name or create it."""
+    for subfolder in parent_bin.GetSubFolderList():
+        if subfolder.GetName() == name:
+            return subfolder
+
+    created_bin = project.GetMediaPool().AddSubFolder(parent_bin, name)
+    index = media_pool_index.get_cached_index(project)
+    if index and created_bin:
+        index.add_folder(created_bin, parent_bin)
+    return created_bin
+
+
+def invalidate_bin_cache():
+    """Forget media pool bins cached by `create_bin`.
+
+    Should be called when bins are deleted, renamed or moved.
+    """
+    bin_cache.invalidate(get_current_resolve_project())
 
 
 def remove_media_pool_item(media_pool_item: object) -> bool:
@@ -273,9 +401,55 @@ def remove_media_pool_item(media_pool_item: object) -> bool:
     """
     resolve_project = get_current_resolve_project()
     media_pool = resolve_project.GetMediaPool()
+    media_pool_index.get_index(resolve_project).remove([media_pool_item])
+    usage_index = clip_usage.get_cached_index(resolve_project)
+    if usage_index is not None:
+        usage_index.remove_media_pool_item(media_pool_item)
     return media_pool.DeleteClips([media_pool_item])
 
 
+def get_clip_usage_index(project: object = None, build: bool = True):
+    """Get index of timeline items by media pool item they use.
+
+    Index is kept for the project and verified by `get_clip_usage`.
+
+    Args:
+        project (resolve.Project)[optional]: current project by default
+        build (bool)[optional]: build the index if it was not built yet,
+            otherwise only already built index is returned
+
+    Returns:
+        clip_usage.ClipUsageIndex: usage index of the project or None
+            if not built and `build` is False
+    """
+    project = project or get_current_resolve_project()
+    if not build:
+        return clip_usage.get_cached_index(project)
+    return clip_usage.get_index(project)
+
+
+def get_clip_usage(media_pool_item: object,
+                   project: object = None) -> list:
+    """Get timeline items using media pool item.
+
+    `Usage` clip property is read first, project timelines are indexed
+    only if the media pool item is used.
+
+    Args:
+        media_pool_item (resolve.MediaPoolItem): resolve's object
+        project (resolve.Project)[optional]: current project by default
+
+    Returns:
+        list[tuple[resolve.Timeline, resolve.TimelineItem]]: timeline
+            with the timeline item
+    """
+    usage = int(media_pool_item.GetClipProperty("Usage"))
+    if not usage:
+        return []
+    project = project or get_current_resolve_project()
+    return clip_usage.get_index(project).find_usage(media_pool_item, usage)
+
+
 def create_media_pool_item(files: list,
                            root: object = None) -> object:
     """ Create media pool item.
@@ -290,7 +464,6 @@ def create_media_pool_item(files: list,
     # get all variables
     resolve_project = get_current_resolve_project()
     media_pool = resolve_project.GetMediaPool()
-    root_bin = root or media_pool.GetRootFolder()
 
     # make sure files list is not empty and first available file exists
     filepath = next((f for f in files if os.path.isfile(f)), None)
@@ -298,7 +471,7 @@ def create_media_pool_item(files: list,
         raise FileNotFoundError("No file found in input files list")
 
     # try to search in bin if the clip does not exist
-    existing_mpi = get_media_pool_item(filepath, root_bin)
+    existing_mpi = get_media_pool_item(filepath, root)
 
     if existing_mpi:
         return existing_mpi
@@ -309,6 +482,9 @@ def create_media_pool_item(files: list,
     if not media_pool_items:
         return False
 
+    media_pool_index.get_index(resolve_project).add(
+        media_pool_items, media_pool.GetCurrentFolder())
+
     # return only first found
     return media_pool_items.pop()
 
@@ -317,6 +493,10 @@ def get_media_pool_item(filepath, root: object = None) -> object:
     """
     Return clip if found in folder with use of input file path.
 
+    Only clips directly in the folder are searched. The clip is looked up
+    by path in the media pool index, on a miss the clips of the folder are
+    indexed again, so media imported there outside of AYON are found too.
+
     Args:
         filepath (str): absolute path to a file
         root (resolve.Folder)[optional]: root folder / bin object
@@ -324,17 +504,75 @@ def get_media_pool_item(filepath, root: object = None) -> object:
     Returns:
         object: resolve.MediaPoolItem
     """
+    index = get_media_pool_index()
+    root = root or index.media_pool.GetRootFolder()
+
+    media_pool_item = index.get_by_path(filepath, root)
+    if media_pool_item is None:
+        index.update_folder(root)
+        media_pool_item = index.get_by_path(filepath, root)
+    return media_pool_item
+
+
+def move_media_pool_items(media_pool_items: list, folder: object) -> bool:
+    """Move media pool items to another bin.
+
+    Args:
+        media_pool_items (list[resolve.MediaPoolItem]): resolve's objects
+        folder (resolve.Folder): target bin
+
+    Returns:
+        bool: True if success
+    """
     resolve_project = get_current_resolve_project()
     media_pool = resolve_project.GetMediaPool()
-    root = root or media_pool.GetRootFolder()
-    fname = os.path.basename(filepath)
-
-    for _mpi in root.GetClipList():
-        _mpi_name = _mpi.GetClipProperty("File Name")
-        _mpi_name = get_reformated_path(_mpi_name, first=True)
-        if fname in _mpi_name:
-            return _mpi
-    return None
+    if not media_pool.MoveClips(media_pool_items, folder):
+        return False
+    media_pool_index.get_index(resolve_project).move(
+        media_pool_items, folder)
+    return True
+
+
+def get_clip_properties(media_pool_item: object) -> object:
+    """Get parsed clip properties of media pool item.
+
+    All properties are read with single call and shared within active
+    operation (see `operation_cache.operation_scope`).
+
+    Args:
+        media_pool_item (resolve.MediaPoolItem): resolve's object
+
+    Returns:
+        clip_properties.ClipProperties: clip properties snapshot
+    """
+    return clip_properties.get_clip_properties(media_pool_item)
+
+
+def invalidate_clip_properties(media_pool_item: object = None):
+    """Drop cached clip properties after they were changed.
+
+    Args:
+        media_pool_item (resolve.MediaPoolItem)[optional]: resolve's object,
+            all cached clip properties are dropped if not provided
+    """
+    clip_properties.invalidate(media_pool_item)
+    # cached otio timelines don't see changes of media
+    otio_timeline_cache.clear()
+
+
+def get_media_pool_index(refresh: bool = False) -> object:
+    """Get index of current project media pool items and bins.
+
+    Args:
+        refresh (bool)[optional]: rebuild the index to pick up changes
+            made outside of AYON, see also
+            `media_pool_index.MediaPoolIndex.is_stale`
+
+    Returns:
+        media_pool_index.MediaPoolIndex: index of media pool
+    """
+    return media_pool_index.get_index(
+        get_current_resolve_project(), refresh=refresh)
 
 
 def create_timeline_item(
@@ -357,33 +595,83 @@ def create_timeline_item(
     Returns:
         object: resolve.TimelineItem
     """
-    # get all variables
+    return create_timeline_items(
+        [{
+            "media_pool_item": media_pool_item,
+            "timeline_in": timeline_in,
+            "source_start": source_start,
+            "source_end": source_end,
+        }],
+        timeline,
+    )[0]
+
+
+def create_timeline_items(
+        item_specs: list,
+        timeline: object = None,
+) -> list:
+    """
+    Add media pool items to current or defined timeline at once.
+
+    Timeline is made current only once and all items are appended with
+    single `AppendToTimeline` call.
+
+    Args:
+        item_specs (list[dict]): Items to create, possible keys:
+            media_pool_item (resolve.MediaPoolItem): resolve's object
+            timeline_in (Optional[int]): timeline input frame
+            source_start (Optional[int]): media source input frame
+            source_end (Optional[int]): media source output frame
+            track_index (Optional[int]): index of track, active track
+                is used if not provided
+            media_type (Optional[int]): 1 for video only, 2 for audio only
+        timeline (resolve.Timeline)[optional]: resolve's object
+
+    Returns:
+        list[object]: resolve.TimelineItem for each item spec in order.
+
+    Raises:
+        AssertionError: If any of the items was not created.
+    """
+    if not item_specs:
+        return []
+
     resolve_project = get_current_resolve_project()
     media_pool = resolve_project.GetMediaPool()
-    clip_name = media_pool_item.GetClipProperty("File Name")
     timeline = timeline or get_current_timeline()
+    fps = None
+
+    clips_data = []
+    timecodes = []
+    frame_ranges = []
+    for item_spec in item_specs:
+        timeline_in = item_spec.get("timeline_in")
+        source_start = item_spec.get("source_start")
+        source_end = item_spec.get("source_end")
+
+        # timing variables
+        if all([
+            timeline_in is not None,
+            source_start is not None,
+            source_end is not None
+        ]):
+            if fps is None:
+                fps = timeline.GetSetting("timelineFrameRate")
+            duration = source_end - source_start
+            timecode_in = frames_to_timecode(timeline_in, fps)
+            timecode_out = frames_to_timecode(timeline_in + duration, fps)
+            frame_range = (timeline_in, timeline_in + duration)
+        else:
+            timecode_in = None
+            timecode_out = None
+            frame_range = None
+        timecodes.append((timecode_in, timecode_out))
+        frame_ranges.append(frame_range)
 
-    # timing variables
-    if all([
-        timeline_in is not None,
-        source_start is not None,
-        source_end is not None
-    ]):
-        fps = timeline.GetSetting("timelineFrameRate")
-        duration = source_end - source_start
-        timecode_in = frames_to_timecode(timeline_in, fps)
-        timecode_out = frames_to_timecode(timeline_in + duration, fps)
-    else:
-        timecode_in = None
-        timecode_out = None
-
-    # if timeline was used then switch it to current timeline
-    with maintain_current_timeline(timeline):
         # Add input mediaPoolItem to clip data
         clip_data = {
-            "mediaPoolItem": media_pool_item,
+            "mediaPoolItem": item_spec["media_pool_item"],
         }
-
         if source_start:
             clip_data["startFrame"] = source_start
         if source_end:
@@ -393,26 +681,98 @@ def create_timeline_item(
             #  item if there's already an existing clip at that time on the
             #  active track.
             clip_data["recordFrame"] = timeline_in
+        if item_spec.get("track_index") is not None:
+            clip_data["trackIndex"] = item_spec["track_index"]
+        if item_spec.get("media_type") is not None:
+            clip_data["mediaType"] = item_spec["media_type"]
+        clips_data.append(clip_data)
 
+    # if timeline was used then switch it to current timeline
+    with maintain_current_timeline(timeline):
         # add to timeline
-        output_timeline_item = media_pool.AppendToTimeline([clip_data])[0]
-
-        # Adding the item may fail whilst Resolve will still return a
-        # TimelineItem instance - however all `Get*` calls return None
-        # Hence, we check whether the result is valid
-        if output_timeline_item.GetDuration() is None:
-            output_timeline_item = None
-
-    assert output_timeline_item, AssertionError((
-        "Clip name '{}' wasn't created on the timeline: '{}' \n\n"
-        "Please check if correct track position is activated, \n"
-        "or if a clip is not already at the timeline in \n"
-        "position: '{}' out: '{}'. \n\n"
-        "Clip data: {}"
-    ).format(
-        clip_name, timeline.GetName(), timecode_in, timecode_out, clip_data
+        appended_items = media_pool.AppendToTimeline(clips_data) or []
+        timeline_snapshot.invalidate(timeline)
+
+    output_timeline_items = _match_appended_timeline_items(
+        clips_data, appended_items)
+
+    failed = [
+        index
+        for index, timeline_item in enumerate(output_timeline_items)
+        if timeline_item is None
+    ]
+    assert not failed, AssertionError("\n\n".join(
+        (
+            "Clip name '{}' wasn't created on the timeline: '{}' \n\n"
+            "Please check if correct track position is activated, \n"
+            "or if a clip is not already at the timeline in \n"
+            "position: '{}' out: '{}'. \n\n"
+            "Clips in the range: {}\n\n"
+            "Clip data: {}"
+        ).format(
+            clips_data[index]["mediaPoolItem"].GetClipProperty("File Name"),
+            timeline.GetName(),
+            timecodes[index][0],
+            timecodes[index][1],
+            _get_item_names_in_range(timeline, frame_ranges[index]),
+            clips_data[index],
+        )
+        for index in failed
     ))
-    return output_timeline_item
+    return output_timeline_items
+
+
+def _get_item_names_in_range(timeline, frame_range):
+    """Return names of video items overlapping frame range of timeline."""
+    if frame_range is None:
+        return []
+    snapshot = get_timeline_snapshot(timeline)
+    return [
+        record.name
+        for record in snapshot.get_items_in_range(
+            *frame_range, track_type="video")
+    ]
+
+
+def _match_appended_timeline_items(clips_data, appended_items):
+    """Match timeline items returned by `AppendToTimeline` to clip data.
+
+    Adding an item may fail whilst Resolve will still return a TimelineItem
+    instance - however all `Get*` calls return None. Resolve may also leave
+    the failed items out of the result, valid items are then matched by
+    their media pool item in order.
+
+    Args:
+        clips_data (list[dict]): Clip data passed to `AppendToTimeline`.
+        appended_items (list[resolve.TimelineItem]): Returned items.
+
+    Returns:
+        list[Union[resolve.TimelineItem, None]]: Timeline item for each
+            clip data, None for items which were not created.
+    """
+    if len(appended_items) == len(clips_data):
+        return [
+            timeline_item
+            if timeline_item and timeline_item.GetDuration() is not None
+            else None
+            for timeline_item in appended_items
+        ]
+
+    items_by_media_id = collections.defaultdict(collections.deque)
+    for timeline_item in appended_items:
+        if not timeline_item or timeline_item.GetDuration() is None:
+            continue
+        media_pool_item = timeline_item.GetMediaPoolItem()
+        if media_pool_item:
+            items_by_media_id[media_pool_item.GetUniqueId()].append(
+                timeline_item)
+
+    output = []
+    for clip_data in clips_data:
+        media_id = clip_data["mediaPoolItem"].GetUniqueId()
+        timeline_items = items_by_media_id.get(media_id)
+        output.append(timeline_items.popleft() if timeline_items else None)
+    return output
 
 
 def get_timeline_item(media_pool_item: object,
@@ -427,25 +787,36 @@ def get_timeline_item(media_pool_item: object,
     Returns:
         object: resolve.TimelineItem
     """
-    clip_name = media_pool_item.GetClipProperty("File Name")
-    output_timeline_item = None
-    timeline = timeline or get_current_timeline()
+    snapshot = get_timeline_snapshot(timeline)
+    if not snapshot:
+        return None
 
-    with maintain_current_timeline(timeline):
-        # search the timeline for the added clip
+    # items using the media pool item itself are found without reading
+    # clip properties of any other media
+    records = snapshot.get_items_by_media_pool_item_id(
+        media_pool_item.GetUniqueId(), track_type="video")
+    if records:
+        return records[-1].item
 
-        for ti_data in get_current_timeline_items():
-            ti_clip_item = ti_data["clip"]["item"]
-            ti_media_pool_item = ti_clip_item.GetMediaPoolItem()
+    # search the timeline for the added clip
+    clip_name = media_pool_item.GetClipProperty("File Name")
+    output_timeline_item = None
+    file_names = {}
+    for record in snapshot.iter_items():
+        # Skip items that do not have a media pool item, like for example
+        # an "Adjustment Clip" or a "Fusion Composition" from the effects
+        # toolbox
+        if not record.media_pool_item:
+            continue
 
-            # Skip items that do not have a media pool item, like for example
-            # an "Adjustment Clip" or a "Fusion Composition" from the effects
-            # toolbox
-            if not ti_media_pool_item:
-                continue
+        # several timeline items can share the same media pool item
+        file_name = file_names.get(record.media_pool_item_id)
+        if file_name is None:
+            file_name = record.media_pool_item.GetClipProperty("File Name")
+            file_names[record.media_pool_item_id] = file_name
 
-            if clip_name in ti_media_pool_item.GetClipProperty("File Name"):
-                output_timeline_item = ti_clip_item
+        if clip_name in file_name:
+            output_timeline_item = record.item
 
     return output_timeline_item
 
@@ -469,57 +840,75 @@ def get_video_track_names() -> list:
     return tracks
 
 
+def get_timeline_snapshot(timeline: object = None):
+    """Get snapshot of timeline tracks and items.
+
+    Snapshot is shared with other callers while
+    `operation_cache.operation_scope` is active.
+
+    Args:
+        timeline (resolve.Timeline)[optional]: resolve's object, current
+            or any timeline is used if not provided
+
+    Returns:
+        timeline_snapshot.TimelineSnapshot: snapshot or None if project
+            has no timeline
+    """
+    timeline = timeline or get_current_timeline() or get_any_timeline()
+    if not timeline:
+        return None
+
+    return timeline_snapshot.get_snapshot(
+        get_current_resolve_project(), timeline)
+
+
 def get_current_timeline_items(
         filter: bool = False,
         track_type: str = None,
         track_name: str = None,
-        selecting_color: str = None) -> List[Dict[str, Any]]:
-    """Get all available current timeline track items"""
+        selecting_color: str = None,
+        snapshot: object = None) -> List[Dict[str, Any]]:
+    """Get all available current timeline track items
+
+    Args:
+        filter (bool)[optional]: keep only items with selecting color
+        track_type (str)[optional]: "video" (default) or "audio"
+        track_name (str)[optional]: keep only tracks with name contained
+            in the value
+        selecting_color (str)[optional]: color of selected items
+        snapshot (timeline_snapshot.TimelineSnapshot)[optional]: snapshot
+            to read items from instead of the current timeline
+
+    Returns:
+        list[dict]: timeline item data with project, timeline, track and
+            clip keys
+    """
     track_type = track_type or "video"
     selecting_color = selecting_color or constants.SELECTED_CLIP_COLOR
-    resolve_project = get_current_resolve_project()
 
-    # get timeline anyhow
-    timeline = get_current_timeline() or get_any_timeline()
-    if not timeline:
+    snapshot = snapshot or get_timeline_snapshot()
+    if not snapshot:
         return []
 
     selected_clips = []
-
-    # get all tracks count filtered by track type
-    selected_track_count = timeline.GetTrackCount(track_type)
-
-    # loop all tracks and get items
-    _clips = {}
-    for track_index in range(1, (int(selected_track_count) + 1)):
-        _track_name = timeline.GetTrackName(track_type, track_index)
-
-        # filter out all unmatched track names
-        if track_name and _track_name not in track_name:
+    for record in snapshot.iter_items(track_type, track_name):
+        if filter and selecting_color not in record.color:
             continue
 
-        timeline_items = timeline.GetItemListInTrack(track_type, track_index)
-        _clips[track_index] = timeline_items
-
-        _data = {
-            "project": resolve_project,
-            "timeline": timeline,
+        selected_clips.append({
+            "project": snapshot.project,
+            "timeline": snapshot.timeline,
             "track": {
-                "name": _track_name,
-                "index": track_index,
-                "type": track_type,
-            }
-        }
-        # get track item object and its color
-        for clip_index, ti in enumerate(_clips[track_index]):
-            data = _data.copy()
-            data["clip"] = {
-                "item": ti,
-                "index": clip_index
-            }
-            ti_color = ti.GetClipColor()
-            if filter and selecting_color in ti_color or not filter:
-                selected_clips.append(data)
+                "name": record.track.name,
+                "index": record.track.index,
+                "type": record.track.type,
+            },
+            "clip": {
+                "item": record.item,
+                "index": record.index,
+                "record": record,
+            },
+        })
     return selected_clips
 
 
@@ -533,23 +922,29 @@ def get_timeline_item_by_name(name: str) -> object:
         object: resolve.TimelineItem
 
     """
-    for _ti_data in get_current_timeline_items():
-        _ti_clip = _ti_data["clip"]["item"]
-        tag_data = get_timeline_item_ayon_tag(_ti_clip)
+    snapshot = get_timeline_snapshot()
+    if not snapshot:
+        return None
+
+    for record in snapshot.iter_items():
+        tag_data = get_timeline_item_ayon_tag(
+            record.item, item_id=record.unique_id)
         tag_name = tag_data.get("namespace")
         if not tag_name:
             continue
         if tag_name in name:
-            return _ti_clip
+            return record.item
     return None
 
 
-def get_timeline_item_ayon_tag(timeline_item):
+def get_timeline_item_ayon_tag(timeline_item, item_id=None):
     """
     Get ayon track item tag created by creator or loader plugin.
 
     Args:
         timeline_item (resolve.TimelineItem): resolve object
+        item_id (str)[optional]: unique id of the timeline item, parsed
+            tag is cached by it
 
     Returns:
         dict: ayon tag data
@@ -558,7 +953,7 @@ def get_timeline_item_ayon_tag(timeline_item):
     return_tag = None
 
     if constants.AYON_MARKER_WORKFLOW:
-        return_tag = get_ayon_marker(timeline_item)
+        return_tag = get_ayon_marker(timeline_item, item_id=item_id)
     else:
         media_pool_item = timeline_item.GetMediaPoolItem()
 
@@ -574,6 +969,101 @@ def get_timeline_item_ayon_tag(timeline_item):
     return return_tag
 
 
+class AyonTagTransaction:
+    """Read-modify-write of timeline item's ayon tag.
+
+    The tag is read once on creation, any number of updates is applied
+    in memory and `commit` writes the tag back with single delete and add
+    of the marker (or single `SetMetadata` in compound clip workflow).
+
+    Args:
+        timeline_item (resolve.TimelineItem): resolve's object
+        item_id (str)[optional]: unique id of the timeline item, cached
+            tag is used and updated if provided
+
+    Example:
+        >>> with ayon_tag_transaction(timeline_item) as tag:
+        ...     tag.update({"folderPath": "/shots/sq020sh0280"})
+        ...     tag.update(publish=True)
+    """
+
+    def __init__(self, timeline_item, item_id=None):
+        self.timeline_item = timeline_item
+        self.item_id = item_id
+        self.marker = None
+        self._changed = False
+
+        if constants.AYON_MARKER_WORKFLOW:
+            self.marker = markers.find_ayon_marker(
+                timeline_item, item_id=item_id)
+            # cached marker data are shared
+            tag_data = copy.deepcopy(self.marker.data) if self.marker else {}
+        else:
+            tag_data = get_timeline_item_ayon_tag(timeline_item)
+
+        self._exists = bool(tag_data)
+        self.data = tag_data or {}
+
+    def update(self, data=None, **kwargs):
+        """Update tag data in memory.
+
+        Args:
+            data (dict)[optional]: data to update the tag with
+            **kwargs: additional keys to set
+        """
+        self.data.update(data or {}, **kwargs)
+        self._changed = True
+
+    def commit(self):
+        """Write tag data if changed.
+
+        Returns:
+            dict: tag data
+        """
+        if not self._changed:
+            return self.data
+
+        if constants.AYON_MARKER_WORKFLOW:
+            # marker is not updatable, it is replaced
+            if self.marker:
+                self.marker = self.marker.replace(self.data)
+            else:
+                self.marker = markers.add_ayon_marker(
+                    self.timeline_item, self.data, item_id=self.item_id)
+
+        elif self._exists:
+            media_pool_item = self.timeline_item.GetMediaPoolItem()
+            media_pool_item.SetMetadata(
+                constants.AYON_TAG_NAME, json.dumps(self.data))
+        else:
+            # if ayon tag available then update with input data
+            # add it to the input track item
+            self.timeline_item.SetMetadata(
+                constants.AYON_TAG_NAME, json.dumps(self.data))
+
+        self._exists = True
+        self._changed = False
+        return self.data
+
+
+@contextlib.contextmanager
+def ayon_tag_transaction(timeline_item, item_id=None):
+    """Batch updates of timeline item's ayon tag into single write.
+
+    Tag is written back when the context exits without an error.
+
+    Args:
+        timeline_item (resolve.TimelineItem): resolve's object
+        item_id (str)[optional]: unique id of the timeline item
+
+    Yields:
+        AyonTagTransaction: transaction with current tag data
+    """
+    transaction = AyonTagTransaction(timeline_item, item_id=item_id)
+    yield transaction
+    transaction.commit()
+
+
 def set_timeline_item_ayon_tag(timeline_item, data=None):
     """
     Set ayon track item tag to input timeline_item.
@@ -584,36 +1074,12 @@ def set_timeline_item_ayon_tag(timeline_item, data=None):
     Returns:
         dict: json loaded data
     """
-    data = data or {}
-
-    # get available ayon tag if any
-    tag_data = get_timeline_item_ayon_tag(timeline_item)
+    with ayon_tag_transaction(timeline_item) as tag:
+        tag.update(data)
+    return tag.data
 
-    if constants.AYON_MARKER_WORKFLOW:
-        # delete tag as it is not updatable
-        if tag_data:
-            delete_ayon_marker(timeline_item)
 
-        tag_data.update(data)
-        set_ayon_marker(timeline_item, tag_data)
-    else:
-        if tag_data:
-            media_pool_item = timeline_item.GetMediaPoolItem()
-            # it not tag then create one
-            tag_data.update(data)
-            media_pool_item.SetMetadata(
-                constants.AYON_TAG_NAME, json.dumps(tag_data))
-        else:
-            tag_data = data
-            # if ayon tag available then update with input data
-            # add it to the input track item
-            timeline_item.SetMetadata(
-                constants.AYON_TAG_NAME, json.dumps(tag_data))
-
-    return tag_data
-
-
-def imprint(timeline_item, data=None):
+def imprint(timeline_item, data=None, item_id=None):
     """
     Adding `AYON data` into a timeline item track item tag.
 
@@ -622,6 +1088,7 @@ def imprint(timeline_item, data=None):
     Arguments:
         timeline_item (resolve.TimelineItem): resolve's object
         data (dict): Any data which needs to be imprinted
+        item_id (str)[optional]: unique id of the timeline item
 
     Examples:
         data = {
@@ -630,12 +1097,11 @@ def imprint(timeline_item, data=None):
             'productName': 'renderMain'
         }
     """
-    data = data or {}
-
-    set_timeline_item_ayon_tag(timeline_item, data)
+    with ayon_tag_transaction(timeline_item, item_id=item_id) as tag:
+        tag.update(data)
 
-    # add publish attribute
-    set_publish_attribute(timeline_item, True)
+        # add publish attribute
+        tag.update(publish=True)
 
 
 def set_publish_attribute(timeline_item, value):
@@ -644,10 +1110,8 @@ def set_publish_attribute(timeline_item, value):
     Attribute:
         timeline_item (resolve.TimelineItem): resolve's object
     """
-    tag_data = get_timeline_item_ayon_tag(timeline_item)
-    tag_data["publish"] = value
-    # set data to the publish attribute
-    set_timeline_item_ayon_tag(timeline_item, tag_data)
+    with ayon_tag_transaction(timeline_item) as tag:
+        tag.update(publish=value)
 
 
 def get_publish_attribute(timeline_item):
@@ -661,46 +1125,79 @@ def get_publish_attribute(timeline_item):
 
 
 def set_ayon_marker(timeline_item, tag_data):
-    source_start = timeline_item.GetLeftOffset()
-    item_duration = timeline_item.GetDuration()
-    frame = int(source_start + (item_duration / 2))
-
-    # marker attributes
-    frameId = (frame / 10) * 10
-    color = constants.AYON_MARKER_COLOR
-    name = constants.AYON_MARKER_NAME
-    note = json.dumps(tag_data)
-    duration = (constants.AYON_MARKER_DURATION / 10) * 10
-
-    timeline_item.AddMarker(
-        frameId,
-        color,
-        name,
-        note,
-        duration
-    )
+    """Add ayon marker with tag data to timeline item.
 
+    Args:
+        timeline_item (resolve.TimelineItem): resolve's object
+        tag_data (dict): data stored as marker note
+
+    Returns:
+        markers.MarkerHandle: handle of the added marker
+    """
+    return markers.add_ayon_marker(timeline_item, tag_data)
+
+
+def get_ayon_marker(
+        timeline_item, tag_name=constants.AYON_MARKER_NAME, item_id=None):
+    """Get data of ayon marker on timeline item.
+
+    Args:
+        timeline_item (resolve.TimelineItem): resolve's object
+        tag_name (str)[optional]: name of the marker
+        item_id (str)[optional]: unique id of the timeline item, parsed
+            marker is cached by it
+
+    Returns:
+        dict: tag data, empty if no marker was found
+    """
+    marker = markers.find_ayon_marker(
+        timeline_item, tag_name, item_id=item_id)
+    if not marker:
+        return {}
+    # cached marker data are shared
+    if item_id is not None:
+        return copy.deepcopy(marker.data)
+    return marker.data
+
+
+def invalidate_ayon_markers(item_id: str = None):
+    """Drop cached ayon markers after they were changed without item id.
+
+    Args:
+        item_id (str)[optional]: unique id of the changed timeline item,
+            all cached markers are revalidated on next read if not provided
+    """
+    markers.invalidate_tag_cache(item_id)
+
+
+def delete_ayon_marker(
+        timeline_item, tag_name=constants.AYON_MARKER_NAME, item_id=None):
+    """Delete ayon marker from timeline item.
+
+    Args:
+        timeline_item (resolve.TimelineItem): resolve's object
+        tag_name (str)[optional]: name of the marker
+        item_id (str)[optional]: unique id of the timeline item
+
+    Returns:
+        bool: True if a marker was deleted
+    """
+    marker = markers.find_ayon_marker(
+        timeline_item, tag_name, item_id=item_id)
+    return marker.delete() if marker else False
 
-def get_ayon_marker(timeline_item, tag_name=constants.AYON_MARKER_NAME):
-    timeline_item_markers = timeline_item.GetMarkers() or []
-    for marker_frame in timeline_item_markers:
-        note = timeline_item_markers[marker_frame]["note"]
-        color = timeline_item_markers[marker_frame]["color"]
-        name = timeline_item_markers[marker_frame]["name"]
-        print(f"_ marker data: {marker_frame} | {name} | {color} | {note}")
-        if (
-            name == tag_name
-            and color == constants.AYON_MARKER_COLOR
-        ):
-            constants.TEMP_MARKER_FRAME = marker_frame
-            return json.loads(note)
 
-    return {}
+def delete_ayon_markers(timeline_item, item_id=None):
+    """Delete all ayon colored markers from timeline item.
 
+    Args:
+        timeline_item (resolve.TimelineItem): resolve's object
+        item_id (str)[optional]: unique id of the timeline item
 
-def delete_ayon_marker(timeline_item):
-    timeline_item.DeleteMarkerAtFrame(constants.TEMP_MARKER_FRAME)
-    constants.TEMP_MARKER_FRAME = None
+    Returns:
+        bool: True if any marker was deleted
+    """
+    return markers.delete_ayon_markers(timeline_item, item_id=item_id)
 
 
 def create_compound_clip(clip_data, name, folder):
@@ -730,15 +1227,15 @@ def create_compound_clip(clip_data, name, folder):
     clip_attributes = get_clip_attributes(clip_item)
 
     mp_item = clip_item.GetMediaPoolItem()
-    _mp_props = mp_item.GetClipProperty
+    mp_props = get_clip_properties(mp_item)
 
-    mp_first_frame = int(_mp_props("Start"))
-    mp_last_frame = int(_mp_props("End"))
+    mp_first_frame = mp_props.start
+    mp_last_frame = mp_props.end
 
     # initialize basic source timing for otio
     ci_l_offset = clip_item.GetLeftOffset()
     ci_duration = clip_item.GetDuration()
-    rate = float(_mp_props("FPS"))
+    rate = mp_props.fps
 
     # source rational times
     mp_in_rc = otio.opentime.RationalTime((ci_l_offset), rate)
@@ -764,6 +1261,7 @@ def create_compound_clip(clip_data, name, folder):
     else:
         # Create empty timeline in current folder and give name:
         cct = mp.CreateEmptyTimeline(name)
+        _index_new_timeline(resolve_project, cct, folder)
 
         # check if clip doesn't exist already:
         clips = folder.GetClipList()
@@ -795,7 +1293,8 @@ def create_compound_clip(clip_data, name, folder):
     cct.SetMetadata(constants.AYON_TAG_NAME, clip_attributes)
 
     # reset start timecode of the compound clip
-    cct.SetClipProperty("Start TC", _mp_props("Start TC"))
+    cct.SetClipProperty("Start TC", mp_props.start_tc)
+    clip_properties.invalidate(cct)
 
     # swap clips on timeline
     swap_clips(clip_item, cct, in_frame, out_frame)
@@ -825,6 +1324,7 @@ def swap_clips(from_clip, to_clip, to_in_frame, to_out_frame):
     mediapool_item_from_timeline = from_clip.GetMediaPoolItem()
     _idt = mediapool_item_from_timeline.GetClipProperty('IDT')
     to_clip.SetClipProperty('IDT', _idt)
+    clip_properties.invalidate(to_clip)
 
     _clip_prop = to_clip.GetClipProperty
     to_clip_name = _clip_prop("File Name")
@@ -838,6 +1338,7 @@ def swap_clips(from_clip, to_clip, to_in_frame, to_out_frame):
     if not take:
         return False
 
+    timeline_snapshot.invalidate()
     for take_index in range(1, (int(from_clip.GetTakesCount()) + 1)):
         take_item = from_clip.GetTakeByIndex(take_index)
         take_mp_item = take_item["mediaPoolItem"]
@@ -976,40 +1477,89 @@ def get_clip_resolution_from_media_pool(timeline_item_data):
     Returns:
         resolution_info (dict): The parsed resolution data.
     """
-    clip_item = timeline_item_data["clip"]["item"]
-    media_pool_item = clip_item.GetMediaPoolItem()
-    clip_properties = media_pool_item.GetClipProperty()
-
+    record = timeline_item_data["clip"]["record"]
+    properties = get_clip_properties(record.media_pool_item)
     try:
-        width, height = clip_properties["Resolution"].split("x")
-    except (KeyError, ValueError):
+        width, height = properties.resolution
+    except ValueError:
         width = height = None
+    pixel_aspect = properties.pixel_aspect
 
-    try:
-        clip_par = clip_properties["PAR"]  # Pixel Aspect Resolution
-        pixel_aspect = constants.PAR_VALUES[clip_par]
+    return {"width": width, "height": height, "pixelAspect": pixel_aspect}
 
-    except (KeyError, ValueError):  # Unknown or undetected PAR
-        pixel_aspect = 1.0
 
-    return {"width": width, "height": height, "pixelAspect": pixel_aspect}
+def create_otio_time_range_from_timeline_item(timeline_item, timeline, fps):
+    """Return range of timeline item in its track.
+
+    Args:
+        timeline_item (resolve.TimelineItem): resolve's object
+        timeline (resolve.Timeline): timeline of the item
+        fps (float): timeline frame rate
+
+    Returns:
+        otio.opentime.TimeRange: range relative to timeline start
+    """
+    frame_start = int(timeline_item.GetStart() - timeline.GetStartFrame())
+    frame_duration = int(timeline_item.GetDuration())
+    return otio_export.create_otio_time_range(
+        frame_start, frame_duration, fps)
 
 
 def create_otio_time_range_from_timeline_item_data(timeline_item_data):
-    timeline_item = timeline_item_data["clip"]["item"]
+    record = timeline_item_data["clip"]["record"]
     resolve_project = timeline_item_data["project"]
     timeline = timeline_item_data["timeline"]
     timeline_start = timeline.GetStartFrame()
 
-    frame_start = int(timeline_item.GetStart() - timeline_start)
-    frame_duration = int(timeline_item.GetDuration())
+    frame_start = int(record.start - timeline_start)
+    frame_duration = int(record.duration)
     fps = resolve_project.GetSetting("timelineFrameRate")
 
     return otio_export.create_otio_time_range(
         frame_start, frame_duration, fps)
 
 
-def get_otio_clip_instance_data(otio_timeline, timeline_item_data):
+def get_otio_interval_index(otio_timeline):
+    """Get interval index of otio timeline clips.
+
+    Index is shared within active operation (see
+    `operation_cache.operation_scope`). Publishing builds the index once
+    for the context otio timeline, see `CollectResolveProject`.
+
+    Args:
+        otio_timeline (otio.schema.Timeline): otio object
+
+    Returns:
+        interval_index.TimelineIntervalIndex: index of otio clips
+    """
+    indexes = operation_cache.get_cache("otio_interval_index")
+    if indexes is None:
+        return otio_interval_index.TimelineIntervalIndex(otio_timeline)
+
+    # keep the timeline referenced so its id is not reused
+    cached = indexes.get(id(otio_timeline))
+    if cached is None or cached[0] is not otio_timeline:
+        cached = (
+            otio_timeline,
+            otio_interval_index.TimelineIntervalIndex(otio_timeline)
+        )
+        indexes[id(otio_timeline)] = cached
+    return cached[1]
+
+
+def _iter_otio_clips_with_range(otio_timeline):
+    """Iterate otio clips of timeline with their range in parent track."""
+    try:  # opentimelineio >= 0.16.0
+        all_clips = otio_timeline.find_clips()
+    except AttributeError:  # legacy
+        all_clips = otio_timeline.each_clip()
+
+    for otio_clip in all_clips:
+        yield otio_clip, otio_clip.range_in_parent()
+
+
+def get_otio_clip_instance_data(
+        otio_timeline, timeline_item_data, interval_index=None):
     """
     Return otio objects for timeline, track and clip
 
@@ -1017,28 +1567,30 @@ def get_otio_clip_instance_data(otio_timeline, timeline_item_data):
         timeline_item_data (dict): timeline_item_data from list returned by
                                 resolve.get_current_timeline_items()
         otio_timeline (otio.schema.Timeline): otio object
+        interval_index (interval_index.TimelineIntervalIndex)[optional]:
+            already built index of the otio timeline clips
 
     Returns:
         dict: otio clip object
 
     """
 
-    timeline_item = timeline_item_data["clip"]["item"]
-    track_name = timeline_item_data["track"]["name"]
+    timeline_item_name = timeline_item_data["clip"]["record"].name
     timeline_range = create_otio_time_range_from_timeline_item_data(
         timeline_item_data)
 
-    try:  # opentimelineio >= 0.16.0
-        all_clips = otio_timeline.find_clips()
-    except AttributeError:  # legacy
-        all_clips = otio_timeline.each_clip()
+    if interval_index is not None:
+        candidates = interval_index.iter_covering(timeline_range)
+    elif operation_cache.is_active():
+        # index is built once and shared by lookups of all items
+        candidates = get_otio_interval_index(
+            otio_timeline).iter_covering(timeline_range)
+    else:
+        # single lookup would not pay off building of the index
+        candidates = _iter_otio_clips_with_range(otio_timeline)
 
-    for otio_clip in all_clips:
-        track_name = otio_clip.parent().name
-        parent_range = otio_clip.range_in_parent()
-        if track_name not in track_name:
-            continue
-        if otio_clip.name not in timeline_item.GetName():
+    for otio_clip, parent_range in candidates:
+        if otio_clip.name not in timeline_item_name:
             continue
         if is_overlapping_otio_ranges(
                 parent_range, timeline_range, strict=True):
@@ -1081,12 +1633,32 @@ def _get_otio_temp_file(timeline=None) -> str:
     )
 
 
-def export_timeline_otio_to_file(timeline, filepath):
+def _get_otio_cache_dir(timeline):
+    """Get directory of exported OTIO tracks cache of timeline.
+
+    Args:
+        timeline (resolve.Timeline): resolve's timeline
+
+    Returns:
+        str: cache directory path in custom staging dir
+    """
+    custom_temp_dir = create_custom_tempdir(get_current_project_name(), None)
+    return os.path.join(
+        custom_temp_dir or tempfile.gettempdir(),
+        "resolve_otio_cache",
+        timeline.GetUniqueId(),
+    )
+
+
+def export_timeline_otio_to_file(timeline, filepath, track_items=None):
     """Export timeline as otio filepath.
 
     Args:
         timeline (resolve.Timeline): resolve's timeline
         filepath (str): otio file path
+        track_items (dict)[optional]: timeline items by track collected
+            by `timeline_cache.get_timeline_fingerprint`, read from the
+            timeline by AYON exporter if not provided
 
     Returns:
         str: temporary otio filepath
@@ -1107,7 +1679,9 @@ def export_timeline_otio_to_file(timeline, filepath):
         )
         otio_timeline = otio_export.create_otio_timeline(
             get_current_resolve_project(),
-            timeline=timeline
+            timeline=timeline,
+            cache_dir=_get_otio_cache_dir(timeline),
+            track_items=track_items,
         )
         otio_export.write_to_file(otio_timeline, filepath)
 
@@ -1115,26 +1689,44 @@ def export_timeline_otio_to_file(timeline, filepath):
 def export_timeline_otio(timeline):
     """ Export timeline as otio.
 
+    Timelines exported by AYON exporter are cached within active operation,
+    see `otio.timeline_cache`.
+
     Args:
         timeline (resolve.Timeline): resolve's timeline
 
     Returns:
         otio_timeline (otio.Timeline): Otio timeline.
     """
-    # DaVinci Resolve <= 18.5
-    # Legacy export (slower) through AYON.
-    if not hasattr(timeline, "Export"):
-        return otio_export.create_otio_timeline(
-            get_current_resolve_project(),
-            timeline=timeline
-        )
-
     # DaVinci Resolve >= 18.5
-    # Force export through a temporary file (native)
-    temp_otio_file = _get_otio_temp_file(timeline=timeline)
-    export_timeline_otio_to_file(timeline, temp_otio_file)
-    otio_timeline = otio.adapters.read_from_file(temp_otio_file)
+    # Force export through a temporary file (native), single call is
+    # cheaper than any fingerprint of the timeline
+    if hasattr(timeline, "Export"):
+        temp_otio_file = _get_otio_temp_file(timeline=timeline)
+        try:
+            export_timeline_otio_to_file(timeline, temp_otio_file)
+            return otio.adapters.read_from_file(temp_otio_file)
+        finally:
+            shutil.rmtree(
+                os.path.dirname(temp_otio_file), ignore_errors=True)
 
+    # DaVinci Resolve <= 18.5
+    # Legacy export (slower) through AYON.
+    timeline_id = timeline.GetUniqueId()
+    fingerprint, track_items = otio_timeline_cache.get_timeline_fingerprint(
+        timeline)
+    otio_timeline = otio_timeline_cache.get(timeline_id, fingerprint)
+    if otio_timeline is not None:
+        log.debug("Using otio export of the timeline from this operation.")
+        return otio_timeline
+
+    otio_timeline = otio_export.create_otio_timeline(
+        get_current_resolve_project(),
+        timeline=timeline,
+        cache_dir=_get_otio_cache_dir(timeline),
+        track_items=track_items,
+    )
+    otio_timeline_cache.add(timeline_id, fingerprint, otio_timeline)
     return otio_timeline
 
 
@@ -0,0 +1,320 @@
+"""
+Lookup and editing of AYON tag markers on timeline items.
+
+Markers written by AYON carry unique custom data, so once a marker was
+found it can be re-read, updated or deleted with `MarkerHandle` without
+scanning item markers again or remembering its frame in a global state.
+
+Parsed markers are cached by live unique id of the timeline item
+(`GetUniqueId`, not "clip_index" stored in the tag which is copied with
+the clip) together with a fingerprint of item markers. Cached markers are
+trusted for the rest of an active operation (see
+`operation_cache.operation_scope`) once they were read or written, a later
+operation revalidates them with single `GetMarkers` call and parses the
+notes again only if the fingerprint changed.
+
+Only markers named `AYON_MARKER_NAME` or `LEGACY_OPENPYPE_MARKER_NAME` are
+parsed, other markers of the AYON color and markers with note which is not
+valid JSON are ignored.
+"""
+import json
+import uuid
+
+from . import constants, operation_cache
+
+# Parsed AYON markers by unique id of timeline item
+_TAG_CACHE = {}
+# Names of markers holding AYON tag data
+_TAG_MARKER_NAMES = (
+    constants.AYON_MARKER_NAME,
+    constants.LEGACY_OPENPYPE_MARKER_NAME,
+)
+
+
+class MarkerHandle:
+    """Reference to a tag marker of a timeline item.
+
+    Args:
+        timeline_item (resolve.TimelineItem): Item owning the marker.
+        frame (float): Marker frame.
+        marker (dict): Marker info as returned by `GetMarkers`.
+        item_id (Optional[str]): Unique id of the timeline item.
+        data (Optional[dict]): Parsed marker note, read from the note if
+            not provided.
+    """
+    __slots__ = (
+        "timeline_item", "item_id", "frame", "name", "color",
+        "custom_data", "note", "data",
+    )
+
+    def __init__(
+            self, timeline_item, frame, marker, item_id=None, data=None):
+        self.timeline_item = timeline_item
+        self.item_id = item_id
+        self.frame = frame
+        self.name = marker["name"]
+        self.color = marker["color"]
+        self.custom_data = marker.get("customData") or ""
+        self.note = marker["note"]
+        self.data = json.loads(self.note) if data is None else data
+
+    def __repr__(self):
+        return f"<MarkerHandle '{self.name}' {self.frame} {self.custom_data}>"
+
+    @property
+    def is_ayon_tagged(self):
+        """Whether the marker has AYON custom data."""
+        return self.custom_data.startswith(constants.AYON_MARKER_CUSTOM_DATA)
+
+    def delete(self):
+        """Delete the marker from timeline item.
+
+        Returns:
+            bool: Whether the marker was deleted.
+        """
+        if self.is_ayon_tagged:
+            result = self.timeline_item.DeleteMarkerByCustomData(
+                self.custom_data)
+        else:
+            result = self.timeline_item.DeleteMarkerAtFrame(self.frame)
+        _cache_marker(self.item_id, self.name, None)
+        return bool(result)
+
+    def replace(self, tag_data):
+        """Replace the marker by a new one holding the tag data.
+
+        Markers are not updatable, the marker is deleted and added again at
+        the same frame.
+
+        Args:
+            tag_data (dict): Data stored as marker note.
+
+        Returns:
+            MarkerHandle: Handle of the new marker.
+        """
+        self.delete()
+        return add_ayon_marker(
+            self.timeline_item,
+            tag_data,
+            frame=self.frame,
+            item_id=self.item_id,
+        )
+
+
+class _TagCacheEntry:
+    """Parsed AYON markers of a single timeline item."""
+    __slots__ = ("fingerprint", "handles", "operation_id")
+
+    def __init__(self, fingerprint, handles, operation_id):
+        self.fingerprint = fingerprint
+        # marker handles by marker name
+        self.handles = handles
+        # id of operation in which the markers were last read or written
+        self.operation_id = operation_id
+
+
+def new_custom_data():
+    """Return unique custom data for new AYON marker."""
+    return f"{constants.AYON_MARKER_CUSTOM_DATA}:{uuid.uuid4().hex}"
+
+
+def find_ayon_marker(
+        timeline_item, tag_name=constants.AYON_MARKER_NAME, item_id=None):
+    """Return handle of AYON tag marker on timeline item.
+
+    All markers are read with single call, legacy markers without custom
+    data are found as well.
+
+    Markers are cached when unique id of the timeline item is provided,
+    handle data must not be modified by the caller in that case.
+
+    Args:
+        timeline_item (resolve.TimelineItem): Timeline item.
+        tag_name (Optional[str]): Name of the tag marker.
+        item_id (Optional[str]): Unique id of the timeline item.
+
+    Returns:
+        Union[MarkerHandle, None]: Marker handle if found.
+    """
+    if item_id is None:
+        timeline_item_markers = timeline_item.GetMarkers() or {}
+        for marker_frame, marker in timeline_item_markers.items():
+            if (
+                marker["name"] != tag_name
+                or marker["color"] != constants.AYON_MARKER_COLOR
+            ):
+                continue
+            handle = _create_handle(timeline_item, marker_frame, marker)
+            if handle is not None:
+                return handle
+        return None
+
+    operation_id = operation_cache.get_operation_id()
+    entry = _TAG_CACHE.get(item_id)
+    if (
+        entry is None
+        or operation_id is None
+        or entry.operation_id != operation_id
+    ):
+        timeline_item_markers = timeline_item.GetMarkers() or {}
+        fingerprint = _get_fingerprint(timeline_item_markers)
+        if entry is None or entry.fingerprint != fingerprint:
+            entry = _TagCacheEntry(
+                fingerprint,
+                _parse_ayon_markers(
+                    timeline_item, timeline_item_markers, item_id),
+                operation_id,
+            )
+            _TAG_CACHE[item_id] = entry
+        entry.operation_id = operation_id
+
+    handle = entry.handles.get(tag_name)
+    if handle is not None:
+        # Resolve returns new object of the item on each call, handle is
+        # bound to the latest one
+        handle.timeline_item = timeline_item
+    return handle
+
+
+def add_ayon_marker(timeline_item, tag_data, frame=None, item_id=None):
+    """Add AYON tag marker to timeline item.
+
+    Args:
+        timeline_item (resolve.TimelineItem): Timeline item.
+        tag_data (dict): Data stored as marker note.
+        frame (Optional[float]): Marker frame, middle of the item if not
+            provided.
+        item_id (Optional[str]): Unique id of the timeline item, cached
+            markers of the item are updated if provided.
+
+    Returns:
+        MarkerHandle: Handle of the added marker.
+    """
+    if frame is None:
+        source_start = timeline_item.GetLeftOffset()
+        item_duration = timeline_item.GetDuration()
+        frame = (int(source_start + (item_duration / 2)) / 10) * 10
+
+    marker = {
+        "color": constants.AYON_MARKER_COLOR,
+        "name": constants.AYON_MARKER_NAME,
+        "note": json.dumps(tag_data),
+        "duration": (constants.AYON_MARKER_DURATION / 10) * 10,
+        "customData": new_custom_data(),
+    }
+    timeline_item.AddMarker(
+        frame,
+        marker["color"],
+        marker["name"],
+        marker["note"],
+        marker["duration"],
+        marker["customData"],
+    )
+    handle = MarkerHandle(timeline_item, frame, marker, item_id=item_id)
+    _cache_marker(item_id, handle.name, handle)
+    return handle
+
+
+def delete_ayon_markers(timeline_item, item_id=None):
+    """Delete all AYON colored markers from timeline item.
+
+    Args:
+        timeline_item (resolve.TimelineItem): Timeline item.
+        item_id (Optional[str]): Unique id of the timeline item.
+
+    Returns:
+        bool: Whether any marker was deleted.
+    """
+    result = bool(
+        timeline_item.DeleteMarkersByColor(constants.AYON_MARKER_COLOR))
+    invalidate_tag_cache(item_id)
+    return result
+
+
+def invalidate_tag_cache(item_id=None):
+    """Drop cached markers after markers were edited outside of handles.
+
+    Args:
+        item_id (Optional[str]): Unique id of the edited timeline item.
+            All cached markers are revalidated on next read if not
+            provided.
+    """
+    if item_id is not None:
+        _TAG_CACHE.pop(item_id, None)
+        return
+    for entry in _TAG_CACHE.values():
+        entry.operation_id = None
+
+
+def _cache_marker(item_id, tag_name, handle):
+    """Store marker written by AYON to the cache.
+
+    Cached marker is trusted for the rest of active operation, fingerprint
+    is reset so the markers are parsed again in next operation.
+    """
+    if item_id is None:
+        # item of the marker is unknown, revalidate all cached markers
+        invalidate_tag_cache()
+        return
+
+    entry = _TAG_CACHE.get(item_id)
+    if entry is None:
+        entry = _TagCacheEntry(None, {}, None)
+        _TAG_CACHE[item_id] = entry
+
+    entry.fingerprint = None
+    entry.operation_id = operation_cache.get_operation_id()
+    if handle is None:
+        entry.handles.pop(tag_name, None)
+    else:
+        entry.handles[tag_name] = handle
+
+
+def _get_fingerprint(timeline_item_markers):
+    """Return cheap fingerprint of AYON markers on timeline item.
+
+    Args:
+        timeline_item_markers (dict): Markers by frame from `GetMarkers`.
+
+    Returns:
+        tuple: Marker count with frame, name, length and hash of note of
+            each AYON colored marker.
+    """
+    return (len(timeline_item_markers),) + tuple(
+        (frame, marker["name"], len(marker["note"]), hash(marker["note"]))
+        for frame, marker in sorted(timeline_item_markers.items())
+        if marker["color"] == constants.AYON_MARKER_COLOR
+    )
+
+
+def _parse_ayon_markers(timeline_item, timeline_item_markers, item_id):
+    """Return handles of AYON tag markers by marker name.
+
+    The first valid marker of each name is used, same as `find_ayon_marker`
+    does when reading markers directly.
+    """
+    handles = {}
+    for marker_frame, marker in timeline_item_markers.items():
+        if (
+            marker["color"] != constants.AYON_MARKER_COLOR
+            or marker["name"] not in _TAG_MARKER_NAMES
+            or marker["name"] in handles
+        ):
+            continue
+        handle = _create_handle(
+            timeline_item, marker_frame, marker, item_id=item_id)
+        if handle is not None:
+            handles[marker["name"]] = handle
+    return handles
+
+
+def _create_handle(timeline_item, frame, marker, item_id=None):
+    """Return handle of tag marker or None if its note is not tag data."""
+    try:
+        data = json.loads(marker["note"])
+    except ValueError:
+        return None
+    if not isinstance(data, dict):
+        return None
+    return MarkerHandle(
+        timeline_item, frame, marker, item_id=item_id, data=data)
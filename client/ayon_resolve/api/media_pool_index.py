@@ -0,0 +1,493 @@
+"""
+Project-wide index of media pool items and bins.
+
+Resolve has no lookup of media pool items by file path, so finding an
+already imported clip means walking bins and reading clip properties of
+every clip, one IPC round trip each. `MediaPoolIndex` walks the media pool
+once and then answers lookups by file path, media id, unique id or name
+from memory. AYON imports, deletions and moves update the index in place.
+
+Indexes are kept per project for the whole session, see `get_index`.
+"""
+import os
+import re
+import collections
+
+from ayon_core.lib import Logger
+
+log = Logger.get_logger(__name__)
+
+# Resolve notation of image sequences `plate.[1001-1100].exr`
+_SEQUENCE_RANGE_PATTERN = re.compile(r"\[(\d+)-(\d+)\]")
+_PRINTF_PATTERN = re.compile(r"%(\d*)d")
+
+# Indexes by unique id of project
+_INDEXES = {}
+
+
+def normalize_media_path(path):
+    """Return media path in form used for index lookups."""
+    return os.path.normcase(os.path.normpath(path)).replace("\\", "/")
+
+
+def get_media_path_keys(path):
+    """Return index keys of media path.
+
+    Image sequence paths in Resolve notation `plate.[1001-1100].exr` are
+    also keyed as first frame path `plate.1001.exr` and as printf pattern
+    `plate.%04d.exr` used for imports.
+
+    Args:
+        path (str): Path of media file or image sequence.
+
+    Returns:
+        list[str]: Normalized keys, the path itself first.
+    """
+    if not path:
+        return []
+
+    path = normalize_media_path(path)
+    keys = [path]
+    match = _SEQUENCE_RANGE_PATTERN.search(path)
+    if match:
+        head, tail = path[:match.start()], path[match.end():]
+        first_frame = match.group(1)
+        keys.append(f"{head}{first_frame}{tail}")
+        keys.append(f"{head}%0{len(first_frame)}d{tail}")
+    return keys
+
+
+class MediaPoolItemRecord:
+    """Indexed values of a media pool item."""
+    __slots__ = (
+        "item",
+        "media_id",
+        "unique_id",
+        "name",
+        "file_path",
+        "file_name",
+        "clip_type",
+        "folder_id",
+    )
+
+    def __init__(self, item, folder_id, properties=None):
+        self.item = item
+        self.folder_id = folder_id
+        self.media_id = item.GetMediaId()
+        self.unique_id = item.GetUniqueId()
+        self.name = item.GetName()
+
+        # single round trip for all clip properties
+        properties = properties or item.GetClipProperty() or {}
+        self.file_path = properties.get("File Path") or ""
+        self.file_name = properties.get("File Name") or ""
+        self.clip_type = properties.get("Type") or ""
+
+    def __repr__(self):
+        return f"<MediaPoolItemRecord '{self.name}' {self.media_id}>"
+
+    @property
+    def path_keys(self):
+        return get_media_path_keys(self.file_path)
+
+
+class FolderRecord:
+    """Indexed values of a media pool folder (bin)."""
+    __slots__ = ("folder", "unique_id", "name", "path", "parent_id")
+
+    def __init__(self, folder, path, parent_id=None):
+        self.folder = folder
+        self.unique_id = folder.GetUniqueId()
+        self.name = folder.GetName()
+        self.path = f"{path}/{self.name}" if path else self.name
+        self.parent_id = parent_id
+
+    @classmethod
+    def from_unknown_parent(cls, folder):
+        """Create record of bin which was not indexed with its parent."""
+        record = cls(folder, None)
+        record.path = None
+        return record
+
+    def __repr__(self):
+        return f"<FolderRecord '{self.path}'>"
+
+
+class MediaPoolIndex:
+    """Lookup of media pool items and bins of a project.
+
+    Args:
+        media_pool (resolve.MediaPool): Media pool to index.
+    """
+
+    def __init__(self, media_pool):
+        self.media_pool = media_pool
+        self._records = {}
+        self._media_ids_by_unique_id = {}
+        self._media_ids_by_path = collections.defaultdict(list)
+        self._media_ids_by_name = collections.defaultdict(list)
+        self._folders = {}
+        self._folder_ids_by_path = {}
+        self._media_ids_by_timeline_id = {}
+        self.root_id = None
+        self.build()
+
+    def build(self):
+        """Walk all bins breadth first and index their clips and folders."""
+        self._records.clear()
+        self._media_ids_by_unique_id.clear()
+        self._media_ids_by_path.clear()
+        self._media_ids_by_name.clear()
+        self._folders.clear()
+        self._folder_ids_by_path.clear()
+
+        root = self.media_pool.GetRootFolder()
+        root_record = self._add_folder(root, path=None)
+        self.root_id = root_record.unique_id
+
+        queue = collections.deque([(root, root_record)])
+        while queue:
+            folder, folder_record = queue.popleft()
+            for clip in folder.GetClipList() or []:
+                self._add_record(
+                    MediaPoolItemRecord(clip, folder_record.unique_id))
+
+            for subfolder in folder.GetSubFolderList() or []:
+                subfolder_record = self._add_folder(
+                    subfolder, folder_record.path, folder_record.unique_id)
+                queue.append((subfolder, subfolder_record))
+
+        log.debug(
+            f"Indexed {len(self._records)} media pool items "
+            f"in {len(self._folders)} bins."
+        )
+
+    def is_stale(self):
+        """Return whether bins or their clips changed since the last build.
+
+        Only bins and clip counts of each bin are compared with the index,
+        no clip is read, so media imported, deleted or moved outside of
+        AYON are noticed for a few calls per bin.
+
+        Returns:
+            bool: True if the index should be built again.
+        """
+        clip_counts = collections.Counter(
+            record.folder_id for record in self._records.values())
+        folder_ids = set()
+        queue = collections.deque([self.media_pool.GetRootFolder()])
+        while queue:
+            folder = queue.popleft()
+            folder_id = folder.GetUniqueId()
+            if folder_id not in self._folders:
+                return True
+            folder_ids.add(folder_id)
+            clip_count = len(folder.GetClipList() or [])
+            if clip_count != clip_counts.get(folder_id, 0):
+                return True
+            queue.extend(folder.GetSubFolderList() or [])
+
+        # bins deleted outside of AYON
+        return len(folder_ids) != len(self._folders)
+
+    def __len__(self):
+        return len(self._records)
+
+    def _add_folder(self, folder, path, parent_id=None):
+        return self._add_folder_record(FolderRecord(folder, path, parent_id))
+
+    def _add_folder_record(self, record):
+        self._folders[record.unique_id] = record
+        if record.path is not None:
+            self._folder_ids_by_path[record.path] = record.unique_id
+        return record
+
+    def _add_record(self, record):
+        self._discard(record.media_id)
+        self._records[record.media_id] = record
+        self._media_ids_by_unique_id[record.unique_id] = record.media_id
+        self._media_ids_by_name[record.name].append(record.media_id)
+        for key in record.path_keys:
+            self._media_ids_by_path[key].append(record.media_id)
+
+    def _discard(self, media_id):
+        record = self._records.pop(media_id, None)
+        if record is None:
+            return None
+
+        self._media_ids_by_unique_id.pop(record.unique_id, None)
+        _remove_from_list_mapping(
+            self._media_ids_by_name, record.name, media_id)
+        for key in record.path_keys:
+            _remove_from_list_mapping(self._media_ids_by_path, key, media_id)
+        return record
+
+    def _get_valid_record(self, media_ids):
+        """Return first record which still exists in the media pool.
+
+        Items deleted from the media pool outside of AYON return no media
+        id anymore, those are dropped from the index.
+        """
+        for media_id in list(media_ids):
+            record = self._records.get(media_id)
+            if record is None:
+                continue
+            if record.item.GetMediaId() == media_id:
+                return record
+            self._discard(media_id)
+        return None
+
+    def _get_folder_record(self, folder):
+        if folder is None:
+            return self._folders.get(self.root_id)
+        record = self._folders.get(folder.GetUniqueId())
+        if record is None:
+            # bin created outside of AYON since last build, its path stays
+            # unknown until the next build
+            record = self._add_folder_record(
+                FolderRecord.from_unknown_parent(folder))
+        return record
+
+    def iter_records(self):
+        """Iterate records of all indexed media pool items."""
+        yield from list(self._records.values())
+
+    def get_record(self, media_pool_item):
+        """Return record of media pool item."""
+        return self._records.get(media_pool_item.GetMediaId())
+
+    def get_by_media_id(self, media_id):
+        """Return media pool item by media id."""
+        record = self._get_valid_record([media_id])
+        return record.item if record else None
+
+    def get_by_unique_id(self, unique_id):
+        """Return media pool item by unique id."""
+        media_id = self._media_ids_by_unique_id.get(unique_id)
+        if media_id is None:
+            return None
+        return self.get_by_media_id(media_id)
+
+    def get_by_name(self, name):
+        """Return first media pool item with name."""
+        record = self._get_valid_record(self._media_ids_by_name.get(name, []))
+        return record.item if record else None
+
+    def get_by_path(self, path, folder=None):
+        """Return media pool item of media file or image sequence.
+
+        Args:
+            path (str): File path, image sequence in Resolve `[1001-1100]`
+                or printf `%04d` notation, or path to first frame.
+            folder (Optional[resolve.Folder]): Limit search to items
+                directly in the bin.
+
+        Returns:
+            Union[resolve.MediaPoolItem, None]: Media pool item if found.
+        """
+        folder_id = None
+        if folder is not None:
+            folder_id = folder.GetUniqueId()
+
+        for key in get_media_path_keys(path):
+            media_ids = self._media_ids_by_path.get(key)
+            if not media_ids:
+                continue
+            if folder_id is not None:
+                media_ids = [
+                    media_id for media_id in media_ids
+                    if self._records[media_id].folder_id == folder_id
+                ]
+            record = self._get_valid_record(media_ids)
+            if record:
+                return record.item
+        return None
+
+    def get_timeline_item(self, timeline, folder=None):
+        """Return media pool item of timeline without touching it.
+
+        Media pool items of timelines have the same name as the timeline and
+        timeline names are unique in a project. Timelines created since the
+        last build are picked up by indexing new clips of the bin they were
+        created in, whole index is rebuilt only if they are not found there.
+
+        Args:
+            timeline (resolve.Timeline): Timeline object.
+            folder (Optional[resolve.Folder]): Bin the timeline was created
+                or imported in, current bin if not provided.
+
+        Returns:
+            Union[resolve.MediaPoolItem, None]: Media pool item if found.
+        """
+        timeline_id = timeline.GetUniqueId()
+        media_id = self._media_ids_by_timeline_id.get(timeline_id)
+        if media_id is not None:
+            record = self._get_valid_record([media_id])
+            if record:
+                return record.item
+            self._media_ids_by_timeline_id.pop(timeline_id)
+
+        timeline_name = timeline.GetName()
+        record = self._get_timeline_record(timeline_name)
+        if record is None:
+            self.update_folder(folder or self.media_pool.GetCurrentFolder())
+            record = self._get_timeline_record(timeline_name)
+        if record is None:
+            self.build()
+            record = self._get_timeline_record(timeline_name)
+        if record is None:
+            return None
+
+        self._media_ids_by_timeline_id[timeline_id] = record.media_id
+        return record.item
+
+    def _get_timeline_record(self, timeline_name):
+        media_ids = [
+            media_id
+            for media_id in self._media_ids_by_name.get(timeline_name, [])
+            if self._records[media_id].clip_type == "Timeline"
+        ]
+        return self._get_valid_record(media_ids)
+
+    def get_records_in_folder(self, folder=None):
+        """Return records of media pool items directly in the bin.
+
+        Args:
+            folder (Optional[resolve.Folder]): Bin of the items, root bin
+                if not provided.
+
+        Returns:
+            list[MediaPoolItemRecord]: Records of the items.
+        """
+        folder_id = folder.GetUniqueId() if folder else self.root_id
+        return [
+            record for record in self._records.values()
+            if record.folder_id == folder_id
+        ]
+
+    def is_valid_record(self, record):
+        """Return whether item of the record still exists in media pool."""
+        return self._get_valid_record([record.media_id]) is record
+
+    def get_folder_by_path(self, path):
+        """Return bin by its path, e.g. `Master/Loader/sh010`."""
+        folder_id = self._folder_ids_by_path.get(path)
+        if folder_id is None:
+            return None
+        return self._folders[folder_id].folder
+
+    def add_folder(self, folder, parent):
+        """Add bin created by AYON to the index."""
+        parent_record = self._get_folder_record(parent)
+        if parent_record.path is None:
+            self._add_folder_record(FolderRecord.from_unknown_parent(folder))
+            return
+        self._add_folder(folder, parent_record.path, parent_record.unique_id)
+
+    def update_folder(self, folder=None):
+        """Index clips added to the bin since the last build.
+
+        Only media ids of clips in the bin are read, values are read only
+        for new clips. Used for clips created by Resolve on behalf of AYON,
+        e.g. timelines, which are not returned by the API, and for clips
+        imported or moved to the bin outside of AYON.
+
+        Args:
+            folder (Optional[resolve.Folder]): Bin of the clips, root bin
+                if not provided.
+        """
+        folder_record = self._get_folder_record(folder)
+        for clip in folder_record.folder.GetClipList() or []:
+            record = self._records.get(clip.GetMediaId())
+            if record is None:
+                self._add_record(
+                    MediaPoolItemRecord(clip, folder_record.unique_id))
+            else:
+                record.folder_id = folder_record.unique_id
+
+    def add(self, media_pool_items, folder=None):
+        """Add media pool items imported by AYON to the index.
+
+        Args:
+            media_pool_items (list[resolve.MediaPoolItem]): Imported items.
+            folder (Optional[resolve.Folder]): Bin of the items, root bin
+                if not provided.
+        """
+        folder_record = self._get_folder_record(folder)
+        for media_pool_item in media_pool_items:
+            if media_pool_item:
+                self._add_record(
+                    MediaPoolItemRecord(
+                        media_pool_item, folder_record.unique_id))
+
+    def update(self, media_pool_item):
+        """Re-read values of media pool item, e.g. after `ReplaceClip`."""
+        record = self.get_record(media_pool_item)
+        folder_id = record.folder_id if record else self.root_id
+        self._add_record(MediaPoolItemRecord(media_pool_item, folder_id))
+
+    def remove(self, media_pool_items):
+        """Remove media pool items deleted by AYON from the index."""
+        for media_pool_item in media_pool_items:
+            record = self.get_record(media_pool_item)
+            if record:
+                self._discard(record.media_id)
+
+    def move(self, media_pool_items, folder):
+        """Move media pool items moved by AYON to another bin."""
+        folder_record = self._get_folder_record(folder)
+        for media_pool_item in media_pool_items:
+            record = self.get_record(media_pool_item)
+            if record:
+                record.folder_id = folder_record.unique_id
+
+
+def _remove_from_list_mapping(mapping, key, value):
+    values = mapping.get(key)
+    if not values:
+        return
+    if value in values:
+        values.remove(value)
+    if not values:
+        del mapping[key]
+
+
+def get_index(project, refresh=False):
+    """Return media pool index of project, build it on first use.
+
+    Args:
+        project (resolve.Project): Resolve project.
+        refresh (Optional[bool]): Rebuild the index to pick up changes
+            made outside of AYON.
+
+    Returns:
+        MediaPoolIndex: Index of project media pool.
+    """
+    project_id = project.GetUniqueId()
+    index = _INDEXES.get(project_id)
+    if index is None:
+        index = MediaPoolIndex(project.GetMediaPool())
+        _INDEXES[project_id] = index
+    elif refresh:
+        index.build()
+    return index
+
+
+def get_cached_index(project):
+    """Return media pool index of project only if it was already built.
+
+    Args:
+        project (resolve.Project): Resolve project.
+
+    Returns:
+        Union[MediaPoolIndex, None]: Index of project media pool.
+    """
+    return _INDEXES.get(project.GetUniqueId())
+
+
+def invalidate(project=None):
+    """Drop media pool index of project or of all projects."""
+    if project is None:
+        _INDEXES.clear()
+        return
+    _INDEXES.pop(project.GetUniqueId(), None)
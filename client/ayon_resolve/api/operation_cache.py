@@ -0,0 +1,83 @@
+"""
+Caches shared by all Resolve API reads of a single operation.
+
+An operation is a unit of work like creator's `create`, publisher reset or
+inventory action during which the Resolve project is edited only by AYON
+itself. Values read from Resolve inside `operation_scope` can be trusted
+until the outermost scope exits, afterwards they have to be read again or
+revalidated because the user may have edited the project meanwhile.
+"""
+import contextlib
+
+_OPERATION = {
+    "depth": 0,
+    "id": 0,
+    "caches": {},
+}
+
+
+@contextlib.contextmanager
+def operation_scope():
+    """Share values read from Resolve between all calls within the context.
+
+    Scopes can be nested, cached values are dropped when the outermost one
+    exits.
+
+    Example:
+        >>> with operation_scope():
+        ...     selected = lib.get_current_timeline_items(filter=True)
+        ...     audio = lib.get_current_timeline_items(track_type="audio")
+    """
+    if not _OPERATION["depth"]:
+        _OPERATION["id"] += 1
+    _OPERATION["depth"] += 1
+    try:
+        yield
+    finally:
+        _OPERATION["depth"] -= 1
+        if not _OPERATION["depth"]:
+            _OPERATION["caches"].clear()
+
+
+def is_active():
+    """Return whether an operation scope is active."""
+    return bool(_OPERATION["depth"])
+
+
+def get_operation_id():
+    """Return id of active operation.
+
+    Returns:
+        Union[int, None]: Id unique for each outermost scope, None if no
+            scope is active.
+    """
+    if not _OPERATION["depth"]:
+        return None
+    return _OPERATION["id"]
+
+
+def get_cache(name):
+    """Return cache shared within active operation.
+
+    Args:
+        name (str): Name of the cache.
+
+    Returns:
+        Union[dict, None]: Cache dictionary, None if no scope is active.
+    """
+    if not _OPERATION["depth"]:
+        return None
+    return _OPERATION["caches"].setdefault(name, {})
+
+
+def invalidate(name=None):
+    """Drop cached values of active operation.
+
+    Args:
+        name (Optional[str]): Name of the cache, all caches are dropped if
+            not provided.
+    """
+    if name is None:
+        _OPERATION["caches"].clear()
+        return
+    _OPERATION["caches"].pop(name, None)
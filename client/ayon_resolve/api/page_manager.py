@@ -0,0 +1,116 @@
+"""
+Reference-counted switching of Resolve pages.
+
+Opening a page redraws whole Resolve UI. Render operations used to open
+Deliver page and go back for every clip and nested track edits bounced
+between Edit and Deliver pages. `PageManager` keeps a stack of requested
+pages, opens a page only when it is not open already and while a page
+session is active (see `lib.page_session`, publish renders run in one)
+the page is not restored when the outermost request ends, the original
+page is restored once at the end of the session.
+"""
+import contextlib
+
+from ayon_core.lib import Logger
+
+log = Logger.get_logger(__name__)
+
+
+class PageManager:
+    """Stack of requested Resolve pages."""
+
+    def __init__(self):
+        self._requested_pages = []
+        self._current_page = None
+        self._original_page = None
+        self._session = False
+        self.switches = 0
+
+    @property
+    def session_active(self):
+        return self._session
+
+    def _open_page(self, resolve, page_name):
+        if self._current_page == page_name:
+            return
+        if not resolve.OpenPage(page_name):
+            raise ValueError(f"Could not open page {page_name}")
+        self._current_page = page_name
+        self.switches += 1
+
+    def _reset(self):
+        self._current_page = None
+        self._original_page = None
+
+    @contextlib.contextmanager
+    def maintain_page(self, resolve, page_name):
+        """Keep page open during the context.
+
+        Args:
+            resolve (resolve.Resolve): Resolve application object.
+            page_name (str): Name of the page.
+        """
+        if not self._requested_pages and not self._session:
+            # the artist may have changed the page since the last request
+            self._reset()
+        if self._current_page is None:
+            self._current_page = resolve.GetCurrentPage()
+            self._original_page = self._current_page
+
+        self._requested_pages.append(page_name)
+        try:
+            self._open_page(resolve, page_name)
+            yield
+        finally:
+            self._requested_pages.pop()
+            if self._requested_pages:
+                self._open_page(resolve, self._requested_pages[-1])
+            elif not self._session:
+                self._open_page(resolve, self._original_page)
+                self._reset()
+
+    def begin_session(self, resolve):
+        """Keep last requested page open until `end_session` is called.
+
+        Session left active by an interrupted run is dropped without
+        restoring its original page.
+
+        Args:
+            resolve (resolve.Resolve): Resolve application object.
+        """
+        if self._session:
+            log.debug("Dropping unfinished page session.")
+        if not self._requested_pages:
+            # the artist may have changed the page since the last request
+            self._current_page = resolve.GetCurrentPage()
+            self._original_page = self._current_page
+        self._session = True
+        self.switches = 0
+
+    def end_session(self, resolve):
+        """Restore page open before the session started.
+
+        Args:
+            resolve (resolve.Resolve): Resolve application object.
+
+        Returns:
+            int: Number of page switches made during the session.
+        """
+        if not self._session:
+            return 0
+
+        self._session = False
+        if not self._requested_pages and self._original_page:
+            self._open_page(resolve, self._original_page)
+            self._reset()
+        switches = self.switches
+        self.switches = 0
+        return switches
+
+
+_PAGE_MANAGER = PageManager()
+
+
+def get_page_manager():
+    """Return page manager shared by all page switches."""
+    return _PAGE_MANAGER
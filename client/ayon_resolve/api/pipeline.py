@@ -31,6 +31,7 @@ from ayon_core.host import (
 )
 
 from . import constants
+from . import container_registry
 from . import lib
 from .utils import (
     get_resolve_module,
@@ -135,6 +136,9 @@ class ResolveHost(HostBase, IWorkfileHost, ILoadHost, IPublishHost):
     def get_containers(self):
         return ls()
 
+    def get_container_registry(self):
+        return get_container_registry()
+
     def get_context_data(self):
         # TODO: implement to support persisting context attributes
         return {}
@@ -228,11 +232,114 @@ def containerise(timeline_item,
     if data:
         data_imprint.update(data)
 
-    lib.set_timeline_item_ayon_tag(timeline_item, data_imprint)
+    with lib.ayon_tag_transaction(timeline_item) as tag:
+        tag.update(data_imprint)
+
+    container = _get_timeline_container(timeline_item, tag.data)
+    if container:
+        get_container_registry().add(
+            timeline_item.GetUniqueId(),
+            container,
+            container_registry.TIMELINE,
+        )
 
     return timeline_item
 
 
+def get_container_registry():
+    """Return registry of containers in current project.
+
+    Returns:
+        container_registry.ContainerRegistry: Registry of the project.
+    """
+    return container_registry.get_registry(lib.get_current_resolve_project())
+
+
+def register_media_pool_container(media_pool_item, data=None, record=None):
+    """Add container of media pool item to the container registry.
+
+    Args:
+        media_pool_item (resolve.MediaPoolItem): Loaded media pool item.
+        data (dict)[optional]: AYON metadata of the item, read from the
+            item if not provided
+        record (media_pool_index.MediaPoolItemRecord)[optional]: indexed
+            values of the item
+
+    Returns:
+        Union[dict, None]: Container data if the item is a container.
+    """
+    container = parse_media_pool_container(
+        media_pool_item, data, record=record)
+    if container:
+        get_container_registry().add(
+            container["name"], container, container_registry.MEDIA_POOL)
+    return container
+
+
+def unregister_container(object_id):
+    """Remove container of removed object from the container registry.
+
+    Args:
+        object_id (str): Unique id of media pool item or timeline item.
+    """
+    get_container_registry().remove(object_id)
+
+
+def parse_media_pool_container(media_pool_item, data=None, record=None):
+    """Return container data from media pool item's metadata.
+
+    Args:
+        media_pool_item (resolve.MediaPoolItem): A loaded media pool item.
+        data (Union[dict, str])[optional]: AYON metadata of the item, read
+            from the item if not provided
+        record (media_pool_index.MediaPoolItemRecord)[optional]: indexed
+            values of the item
+
+    Returns:
+        Union[dict, None]: The container data.
+    """
+    if data is None:
+        data = media_pool_item.GetMetadata(constants.AYON_TAG_NAME)
+    if not data:
+        return None
+
+    if isinstance(data, str):
+        try:
+            data = json.loads(data)
+        except json.JSONDecodeError:
+            log.warning(
+                f"Failed to parse json data from media pool item: "
+                f"{media_pool_item.GetName()}"
+            )
+            return None
+
+    # treat data as container
+    # There might be cases where clip's metadata are having additional
+    # because it needs to store 'load' and 'publish' data. In that case
+    # we need to get only 'load' data
+    if data.get("load"):
+        data = data["load"]
+
+    # If not all required data, skip it
+    required = ['schema', 'id', 'loader', 'representation']
+    if not all(key in data for key in required):
+        return None
+
+    if record is None:
+        name = media_pool_item.GetName()
+        unique_id = media_pool_item.GetUniqueId()
+    else:
+        name = record.name
+        unique_id = record.unique_id
+
+    container = {key: data[key] for key in required}
+    container["objectName"] = name  # Get path in folders
+    container["namespace"] = name
+    container["name"] = unique_id
+    container["_item"] = media_pool_item
+    return container
+
+
 def ls():
     """List available containers.
 
@@ -244,68 +351,82 @@ def ls():
     and the Maya equivalent, which is in `avalon.maya.pipeline`
     """
 
-    # Media Pool instances from Load Media loader
-    for clip in lib.iter_all_media_pool_clips():
-        data = clip.GetMetadata(constants.AYON_TAG_NAME)
-        if not data:
-            continue
+    registry = get_container_registry()
 
-        try:
-            data = json.loads(data)
-        except json.JSONDecodeError:
-            log.warning(
-                f"Failed to parse json data from media pool item: "
-                f"{clip.GetName()}"
-            )
-            continue
-
-        # treat data as container
-        # There might be cases where clip's metadata are having additional
-        # because it needs to store 'load' and 'publish' data. In that case
-        # we need to get only 'load' data
-        if data.get("load"):
-            data = data["load"]
-
-        # If not all required data, skip it
-        required = ['schema', 'id', 'loader', 'representation']
-        if not all(key in data for key in required):
-            continue
-
-        container = {key: data[key] for key in required}
-        container["objectName"] = clip.GetName()  # Get path in folders
-        container["namespace"] = clip.GetName()
-        container["name"] = clip.GetUniqueId()
-        container["_item"] = clip
-        yield container
+    # Media Pool instances from Load Media loader
+    # Registry is updated by loaders, it is trusted and only revalidated
+    # unless clips or bins were changed outside of AYON.
+    media_pool_index = lib.get_media_pool_index()
+    if media_pool_index.is_stale():
+        media_pool_index.build()
+        # bins might have been renamed, moved or deleted as well
+        lib.invalidate_bin_cache()
+        registry.set_source(
+            container_registry.MEDIA_POOL,
+            _collect_media_pool_containers(media_pool_index),
+        )
+    elif registry.is_built(container_registry.MEDIA_POOL):
+        registry.validate(
+            container_registry.MEDIA_POOL,
+            lambda _, container: bool(container["_item"].GetMediaId()),
+        )
+    else:
+        registry.set_source(
+            container_registry.MEDIA_POOL,
+            _collect_media_pool_containers(media_pool_index),
+        )
 
     # Timeline instances from Load Clip loader
+    # Timeline items are copied and edited by artists, they are always
+    # collected again from current timeline.
+    registry.set_source(
+        container_registry.TIMELINE, _collect_timeline_containers())
+
+    for container in registry.iter_containers():
+        yield dict(container)
+
+
+def _collect_media_pool_containers(media_pool_index):
+    for record in media_pool_index.iter_records():
+        container = parse_media_pool_container(record.item, record=record)
+        if container:
+            yield record.unique_id, container
+
+
+def _collect_timeline_containers():
     # get all track items from current timeline
     all_timeline_items = lib.get_current_timeline_items(filter=False)
 
     for timeline_item_data in all_timeline_items:
         timeline_item = timeline_item_data["clip"]["item"]
-        container = parse_container(timeline_item)
+        item_id = timeline_item_data["clip"]["record"].unique_id
+        container = parse_container(timeline_item, item_id=item_id)
         if container:
-            yield container
+            yield item_id, container
 
 
-def parse_container(timeline_item, validate=True):
+def parse_container(timeline_item, validate=True, item_id=None):
     """Return container data from timeline_item's marker data.
 
     Args:
         timeline_item (resolve.TimelineItem): A containerized track item.
         validate (bool)[optional]: validating with avalon scheme
+        item_id (str)[optional]: unique id of the timeline item
 
     Returns:
         dict: The container schema data for input containerized track item.
 
     """
     # convert tag metadata to normal keys names
-    data = lib.get_timeline_item_ayon_tag(timeline_item)
+    data = lib.get_timeline_item_ayon_tag(timeline_item, item_id=item_id)
 
     if validate and data and data.get("schema"):
         schema.validate(data)
 
+    return _get_timeline_container(timeline_item, data)
+
+
+def _get_timeline_container(timeline_item, data):
     if not isinstance(data, dict):
         return
 
@@ -339,16 +460,23 @@ def update_container(timeline_item, data=None):
     """
     data = data or {}
 
-    container = lib.get_timeline_item_ayon_tag(timeline_item)
-
-    for _key, _value in container.items():
-        try:
-            container[_key] = data[_key]
-        except KeyError:
-            pass
-
     log.info("Updating container: `{}`".format(timeline_item))
-    return bool(lib.set_timeline_item_ayon_tag(timeline_item, container))
+    with lib.ayon_tag_transaction(timeline_item) as tag:
+        # update only keys already present in container
+        tag.update({
+            key: data[key]
+            for key in tag.data
+            if key in data
+        })
+
+    container = _get_timeline_container(timeline_item, tag.data)
+    if container:
+        get_container_registry().add(
+            timeline_item.GetUniqueId(),
+            container,
+            container_registry.TIMELINE,
+        )
+    return bool(tag.data)
 
 
 @contextlib.contextmanager
@@ -380,8 +508,8 @@ def on_pyblish_instance_toggled(instance, old_value, new_value):
     log.info("instance toggle: {}, old_value: {}, new_value:{} ".format(
         instance, old_value, new_value))
 
-    from ayon_resolve.api import set_publish_attribute
-
     # Whether instances should be passthrough based on new value
     timeline_item = instance.data["item"]
-    set_publish_attribute(timeline_item, new_value)
+    with lib.ayon_tag_transaction(timeline_item) as tag:
+        tag.update(publish=new_value)
+
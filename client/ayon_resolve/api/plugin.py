@@ -1,8 +1,10 @@
 import copy
 import re
 import uuid
+from collections import defaultdict
 
 import qargparse
+from ayon_api import get_representations
 
 from ayon_core.pipeline.constants import AVALON_INSTANCE_ID
 from ayon_core.pipeline import (
@@ -35,6 +37,8 @@ class ClipLoader:
         """
         self.__dict__.update(loader_obj.__dict__)
         self.context = context
+        # data of each loader, multiple loaders are used by `load_batch`
+        self.data = {}
         self.active_project = lib.get_current_resolve_project()
 
         # try to get value from options or evaluate key value for `handles`
@@ -130,6 +134,62 @@ class ClipLoader:
         Arguments:
             files (list[str]): list of files to load into timeline
         """
+        return self.load_batch([(self, files)])[0]
+
+    @staticmethod
+    def load_batch(loaders_files):
+        """Load clips of multiple loaders into their timelines at once.
+
+        Items of all loaders targeting the same timeline are created with
+        single `lib.create_timeline_items` call. Clips loaded sequentially
+        are placed one after another in order of the loaders.
+
+        Arguments:
+            loaders_files (list[tuple[ClipLoader, list[str]]]): Loaders
+                with list of files each of them loads into timeline.
+
+        Returns:
+            list[object]: resolve.TimelineItem in order of the loaders.
+        """
+        specs_by_timeline_id = {}
+        for index, (loader, files) in enumerate(loaders_files):
+            spec = loader.get_timeline_item_spec(files)
+            timeline_id = loader.active_timeline.GetUniqueId()
+            specs_by_timeline_id.setdefault(
+                timeline_id, (loader.active_timeline, [])
+            )[1].append((index, loader, spec))
+
+        timeline_items = [None] * len(loaders_files)
+        for timeline, indexed_specs in specs_by_timeline_id.values():
+            sequential_offset = 0
+            for _, loader, spec in indexed_specs:
+                if not loader.sequential_load:
+                    continue
+                spec["timeline_in"] += sequential_offset
+                sequential_offset += (
+                    spec["source_end"] - spec["source_start"] + 1)
+
+            created_items = lib.create_timeline_items(
+                [spec for _, _, spec in indexed_specs], timeline)
+            for (index, loader, _), timeline_item in zip(
+                indexed_specs, created_items
+            ):
+                print("Loading clips: `{}`".format(loader.data["clip_name"]))
+                timeline_items[index] = timeline_item
+        return timeline_items
+
+    def get_timeline_item_spec(self, files):
+        """Import media and return spec of timeline item to create.
+
+        Specs of multiple loaders targeting the same timeline are passed
+        to `lib.create_timeline_items` at once, see `load_batch`.
+
+        Arguments:
+            files (list[str]): list of files to load into timeline
+
+        Returns:
+            dict: Item spec for `lib.create_timeline_items`.
+        """
         # create project bin for the media to be imported into
         self.active_bin = lib.create_bin(self.data["binPath"])
 
@@ -138,10 +198,10 @@ class ClipLoader:
             files,
             self.active_bin
         )
-        _clip_property = media_pool_item.GetClipProperty
-        source_in = int(_clip_property("Start"))
-        source_out = int(_clip_property("End"))
-        source_duration = int(_clip_property("Frames"))
+        clip_properties = lib.get_clip_properties(media_pool_item)
+        source_in = clip_properties.start
+        source_out = clip_properties.end
+        source_duration = clip_properties.frames
 
         # Trim clip start if slate is present
         if "slate" in self.data["versionAttributes"]["families"]:
@@ -190,16 +250,12 @@ class ClipLoader:
                 timeline_start + self.data["folderAttributes"]["clipIn"])
 
         # make track item from source in bin as item
-        timeline_item = lib.create_timeline_item(
-            media_pool_item,
-            self.active_timeline,
-            timeline_in,
-            source_in,
-            source_out,
-        )
-
-        print("Loading clips: `{}`".format(self.data["clip_name"]))
-        return timeline_item
+        return {
+            "media_pool_item": media_pool_item,
+            "timeline_in": timeline_in,
+            "source_start": source_in,
+            "source_end": source_out,
+        }
 
     def update(self, timeline_item, files):
         # create project bin for the media to be imported into
@@ -305,6 +361,19 @@ class ResolveCreator(Creator):
         else:
             self.selected = lib.get_current_timeline_items(filter=False)
 
+    def get_timeline_snapshot(self):
+        """Return current timeline snapshot shared by collecting creators.
+
+        Returns:
+            timeline_snapshot.TimelineSnapshot: snapshot or None if project
+                has no timeline
+        """
+        shared_data = self.collection_shared_data
+        if "resolve_timeline_snapshot" not in shared_data:
+            shared_data["resolve_timeline_snapshot"] = (
+                lib.get_timeline_snapshot())
+        return shared_data["resolve_timeline_snapshot"]
+
 
 class PublishableClip:
     """
@@ -382,11 +451,12 @@ class PublishableClip:
         # get main parent objects
         self.timeline_item_data = timeline_item_data
         self.timeline_item = timeline_item_data["clip"]["item"]
+        self.timeline_item_record = timeline_item_data["clip"]["record"]
         timeline_name = timeline_item_data["timeline"].GetName()
         self.timeline_name = str(timeline_name).replace(" ", "_")
 
         # track item (clip) main attributes
-        self.ti_name = self.timeline_item.GetName()
+        self.ti_name = self.timeline_item_record.name
         self.ti_index = int(timeline_item_data["clip"]["index"])
 
         # get track name and index
@@ -474,8 +544,8 @@ class PublishableClip:
     def _populate_attributes(self):
         """ Populate main object attributes. """
         # track item frame range and parent track name for vertical sync check
-        self.clip_in = int(self.timeline_item.GetStart())
-        self.clip_out = int(self.timeline_item.GetEnd())
+        self.clip_in = int(self.timeline_item_record.start)
+        self.clip_out = int(self.timeline_item_record.end)
 
         # define ui inputs if non gui mode was used
         self.shot_num = self.ti_index
@@ -806,3 +876,71 @@ def get_representation_files(project_name, representation):
         anatomy.fill_root(file_data["path"])
         for file_data in representation["files"]
     ]
+
+
+def get_product_representation_contexts(contexts, extensions, log=None):
+    """Return representation context of each product to be loaded.
+
+    Used by loaders of selected products which load all of them at once.
+    One representation of each product version is picked, image sequences
+    are preferred as they hold the full quality media of plates and
+    renders while movies are mostly reviews transcoded from them.
+    Representations of the same kind are ordered by name only to keep
+    the choice stable.
+
+    Args:
+        contexts (list[dict]): Product contexts of the loader.
+        extensions (set[str]): Extensions of loadable representations.
+        log (Optional[logging.Logger]): Logger for products without
+            a loadable representation.
+
+    Returns:
+        list[dict]: Contexts with a representation, in order of products.
+    """
+    if not contexts:
+        return []
+
+    contexts_by_version_id = {
+        context["version"]["id"]: context
+        for context in contexts
+    }
+    representations_by_version_id = defaultdict(list)
+    for representation in get_representations(
+        contexts[0]["project"]["name"],
+        version_ids=set(contexts_by_version_id)
+    ):
+        ext = representation["context"].get("ext")
+        if representation["name"] == "thumbnail":
+            continue
+        if ext and ext.lower() not in extensions:
+            continue
+        representations_by_version_id[
+            representation["versionId"]].append(representation)
+
+    repre_contexts = []
+    for version_id, context in contexts_by_version_id.items():
+        representations = sorted(
+            representations_by_version_id[version_id],
+            key=_get_representation_sort_key
+        )
+        if not representations:
+            if log:
+                log.warning(
+                    "No loadable representation found for product "
+                    f"'{context['product']['name']}'."
+                )
+            continue
+        if log:
+            log.debug(
+                f"Loading representation '{representations[0]['name']}' "
+                f"of product '{context['product']['name']}'."
+            )
+        repre_context = dict(context)
+        repre_context["representation"] = representations[0]
+        repre_contexts.append(repre_context)
+    return repre_contexts
+
+
+def _get_representation_sort_key(representation):
+    is_sequence = representation["context"].get("frame") is not None
+    return not is_sequence, representation["name"]
@@ -0,0 +1,129 @@
+"""
+Render capabilities of Resolve cached for the session.
+
+Render formats, their codecs and resolutions don't change while Resolve is
+running, but every render used to query and log them again. They are
+queried once here and used to validate render format and codec pairs
+before rendering starts.
+"""
+from ayon_core.lib import Logger
+
+log = Logger.get_logger(__name__)
+
+_SESSION = {
+    # format name -> format value (file extension), None until queried
+    "formats": None,
+    # format value -> codec name -> codec value
+    "codecs": {},
+    # (format value, codec value) -> list of resolutions
+    "resolutions": {},
+}
+
+
+def get_render_formats(project):
+    """Return render formats by their name.
+
+    Args:
+        project (resolve.Project): Project to query the formats in.
+
+    Returns:
+        dict[str, str]: Format value (file extension) by format name.
+    """
+    if _SESSION["formats"] is None:
+        _SESSION["formats"] = dict(project.GetRenderFormats() or {})
+        log.debug(f"Available render formats: {_SESSION['formats']}")
+    return _SESSION["formats"]
+
+
+def get_render_codecs(project, format_value):
+    """Return render codecs of format by their name.
+
+    Args:
+        project (resolve.Project): Project to query the codecs in.
+        format_value (str): Format value (file extension).
+
+    Returns:
+        dict[str, str]: Codec value by codec name.
+    """
+    codecs = _SESSION["codecs"].get(format_value)
+    if codecs is None:
+        codecs = dict(project.GetRenderCodecs(format_value) or {})
+        _SESSION["codecs"][format_value] = codecs
+        log.debug(f"Available codecs of format '{format_value}': {codecs}")
+    return codecs
+
+
+def get_render_resolutions(project, format_value, codec_value):
+    """Return render resolutions of format and codec pair.
+
+    Args:
+        project (resolve.Project): Project to query the resolutions in.
+        format_value (str): Format value (file extension).
+        codec_value (str): Codec value.
+
+    Returns:
+        list[dict]: Resolutions with "Width" and "Height" keys.
+    """
+    key = (format_value, codec_value)
+    resolutions = _SESSION["resolutions"].get(key)
+    if resolutions is None:
+        resolutions = list(
+            project.GetRenderResolutions(format_value, codec_value) or [])
+        _SESSION["resolutions"][key] = resolutions
+    return resolutions
+
+
+def get_format_and_codec_values(project, render_format, render_codec):
+    """Return values of format and codec names.
+
+    Args:
+        project (resolve.Project): Project to query the capabilities in.
+        render_format (str): Format name (e.g. ``"EXR"``).
+        render_codec (str): Codec name (e.g. ``"RGB half (DWAA)"``).
+
+    Returns:
+        tuple[str, str]: Format value and codec value.
+
+    Raises:
+        ValueError: If the format or the codec of the format is not
+            available.
+    """
+    format_value = get_render_formats(project).get(render_format)
+    if not format_value:
+        raise ValueError(f"Invalid render format: '{render_format}'")
+
+    codec_value = get_render_codecs(project, format_value).get(render_codec)
+    if not codec_value:
+        raise ValueError(
+            f"Invalid render codec: '{render_codec}' "
+            f"of format '{render_format}'"
+        )
+    return format_value, codec_value
+
+
+def set_current_format_and_codec(project, format_value, codec_value):
+    """Make format and codec pair current unless it already is.
+
+    Args:
+        project (resolve.Project): Project to set the pair in.
+        format_value (str): Format value (file extension).
+        codec_value (str): Codec value.
+
+    Returns:
+        bool: True if the pair is current.
+    """
+    current = project.GetCurrentRenderFormatAndCodec() or {}
+    if (
+        current.get("format") == format_value
+        and current.get("codec") == codec_value
+    ):
+        return True
+    return bool(
+        project.SetCurrentRenderFormatAndCodec(format_value, codec_value))
+
+
+def invalidate():
+    """Drop cached capabilities, they are queried again on next use."""
+    _SESSION["formats"] = None
+    _SESSION["codecs"].clear()
+    _SESSION["resolutions"].clear()
@@ -0,0 +1,218 @@
+"""
+Monitoring of running Resolve render jobs.
+
+`RenderMonitor` polls status of the render jobs it waits for. Polling starts
+fast so short jobs are noticed as soon as they finish and slows down up to
+`MAX_POLL_INTERVAL` for long renders, or follows the estimated remaining
+time when Resolve reports it. Overall progress and remaining time are
+logged and passed to an optional callback. Rendering is stopped when the
+monitor is cancelled, when it times out or when progress of the jobs
+stalls, so a hung render does not block publishing forever.
+"""
+import time
+import threading
+
+from ayon_core.lib import Logger
+
+log = Logger.get_logger(__name__)
+
+MIN_POLL_INTERVAL = 0.05
+MAX_POLL_INTERVAL = 1.0
+# Poll interval is multiplied by this factor while no estimate is known
+POLL_BACKOFF = 1.5
+# Seconds between progress log messages
+LOG_INTERVAL = 5.0
+
+# Defaults for all monitors, None to wait without limit
+DEFAULT_TIMEOUT = None
+DEFAULT_STALL_TIMEOUT = 600.0
+
+FINISHED_STATUSES = {"Complete", "Failed", "Cancelled"}
+
+
+def is_job_finished(status):
+    """Return whether render job status is final.
+
+    Unknown jobs (empty status) are considered finished.
+    """
+    return not status or status.get("JobStatus") in FINISHED_STATUSES
+
+
+class RenderMonitor:
+    """Wait for render jobs of a project to finish.
+
+    Args:
+        project (resolve.Project): Project rendering the jobs.
+        job_ids (Iterable[str]): Render jobs to wait for.
+        timeout (Optional[float]): Seconds after which rendering is
+            stopped, `DEFAULT_TIMEOUT` is used if not provided.
+        stall_timeout (Optional[float]): Seconds without any progress
+            after which rendering is stopped, `DEFAULT_STALL_TIMEOUT` is
+            used if not provided.
+        callback (Optional[Callable[[float, Union[float, None]], None]]):
+            Called with overall progress in percent and estimated remaining
+            seconds whenever the progress changes.
+        logger (Optional[logging.Logger]): Logger of progress messages.
+        cancel_event (Optional[threading.Event]): Event stopping rendering
+            when set, e.g. by UI of the caller, new event is used if not
+            provided.
+
+    Example:
+        >>> monitor = RenderMonitor(project, [job_id], timeout=3600)
+        >>> statuses = monitor.wait()
+        >>> statuses[job_id]["JobStatus"]
+        'Complete'
+    """
+
+    def __init__(
+        self,
+        project,
+        job_ids,
+        timeout=None,
+        stall_timeout=None,
+        callback=None,
+        logger=None,
+        cancel_event=None,
+    ):
+        self.project = project
+        self.job_ids = list(job_ids)
+        self.timeout = DEFAULT_TIMEOUT if timeout is None else timeout
+        self.stall_timeout = (
+            DEFAULT_STALL_TIMEOUT if stall_timeout is None else stall_timeout
+        )
+        self.callback = callback
+        self.log = logger or log
+        # reason why rendering was stopped by the monitor
+        self.error = None
+        self._cancelled = cancel_event or threading.Event()
+
+    def cancel(self):
+        """Stop rendering at next poll, can be called from other thread."""
+        self._cancelled.set()
+
+    @staticmethod
+    def get_progress(statuses):
+        """Return overall progress of jobs in percent."""
+        if not statuses:
+            return 100.0
+        total = 0.0
+        for status in statuses.values():
+            if is_job_finished(status):
+                total += 100.0
+            else:
+                total += float(status.get("CompletionPercentage") or 0)
+        return total / len(statuses)
+
+    @staticmethod
+    def get_eta(statuses, progress, elapsed):
+        """Return estimated remaining seconds of all jobs.
+
+        Estimate reported by Resolve is used for the last unfinished job,
+        otherwise the remaining time is extrapolated from elapsed time.
+
+        Returns:
+            Union[float, None]: Remaining seconds if they can be estimated.
+        """
+        unfinished = [
+            status for status in statuses.values()
+            if not is_job_finished(status)
+        ]
+        if (
+            len(unfinished) == 1
+            and unfinished[0].get("EstimatedTimeRemainingInMs")
+        ):
+            return unfinished[0]["EstimatedTimeRemainingInMs"] / 1000.0
+
+        if progress <= 0:
+            return None
+        return elapsed * (100.0 - progress) / progress
+
+    def _poll(self, statuses):
+        for job_id in self.job_ids:
+            previous = statuses.get(job_id)
+            if previous is not None and is_job_finished(previous):
+                continue
+
+            status = self.project.GetRenderJobStatus(job_id) or {}
+            statuses[job_id] = status
+            if status.get("JobStatus") == "Failed":
+                self.log.error(
+                    f"Render job '{job_id}' failed: "
+                    f"{status.get('Error') or status}"
+                )
+
+    def _stop(self, statuses, reason):
+        self.error = reason
+        self.log.error(f"Stopping rendering: {reason}")
+        self.project.StopRendering()
+        self._poll(statuses)
+        for job_id, status in statuses.items():
+            if status.get("JobStatus") != "Complete":
+                statuses[job_id] = dict(status, Error=reason)
+
+    def _report(self, progress, eta):
+        if self.callback is not None:
+            self.callback(progress, eta)
+
+    def wait(self):
+        """Wait until all jobs are finished or rendering is stopped.
+
+        Returns:
+            dict[str, dict]: Last status of each job by job id, statuses of
+                jobs stopped by the monitor contain "Error" key.
+        """
+        statuses = {}
+        start = last_change = last_log = time.monotonic()
+        last_progress = None
+        interval = MIN_POLL_INTERVAL
+
+        while True:
+            self._poll(statuses)
+            now = time.monotonic()
+            elapsed = now - start
+            progress = self.get_progress(statuses)
+            finished = all(
+                is_job_finished(status) for status in statuses.values())
+            eta = None if finished else self.get_eta(
+                statuses, progress, elapsed)
+
+            if progress != last_progress:
+                last_change = now
+                last_progress = progress
+                self._report(progress, eta)
+                if finished or now - last_log >= LOG_INTERVAL:
+                    last_log = now
+                    eta_message = "" if eta is None else f", ETA {eta:.0f}s"
+                    self.log.info(
+                        f"Rendering {len(self.job_ids)} jobs: "
+                        f"{progress:.0f}%{eta_message}"
+                    )
+
+            if finished:
+                return statuses
+
+            if self._cancelled.is_set():
+                self._stop(statuses, "Rendering was cancelled.")
+                return statuses
+
+            if self.timeout and elapsed > self.timeout:
+                self._stop(
+                    statuses,
+                    f"Rendering timed out after {self.timeout:.0f}s."
+                )
+                return statuses
+
+            if self.stall_timeout and now - last_change > self.stall_timeout:
+                self._stop(
+                    statuses,
+                    "Rendering made no progress for "
+                    f"{self.stall_timeout:.0f}s."
+                )
+                return statuses
+
+            if eta is not None:
+                interval = eta / 4.0
+            else:
+                interval *= POLL_BACKOFF
+            interval = min(max(interval, MIN_POLL_INTERVAL), MAX_POLL_INTERVAL)
+            time.sleep(interval)
@@ -0,0 +1,153 @@
+"""
+Registry of render presets imported to Resolve.
+
+Render preset used to be imported to Resolve for every rendered plate and
+every plate wrote its own modified copy of the preset XML although the
+overrides are the same for most of them. Presets are registered here by
+hash of the base XML content and its overrides. Each distinct preset is
+written once to a cache directory of the session under a hash suffixed
+name and with its own database id, so Resolve does not mistake copies with
+different overrides for the same preset. It is imported to Resolve once and
+following uses only load it by name. Presets loaded by AYON are deleted from
+Resolve by `cleanup` once rendering is done.
+"""
+import os
+import json
+import uuid
+import hashlib
+import tempfile
+from pathlib import Path
+
+from ayon_core.lib import Logger
+
+log = Logger.get_logger(__name__)
+
+_SESSION = {
+    # cache directory of preset files, created on first use
+    "cache_dir": None,
+    # hash of base preset and overrides -> preset file in cache directory
+    "files": {},
+    # unique id of project -> names of presets loaded in the project
+    "loaded": {},
+}
+
+
+def _get_cache_dir():
+    if _SESSION["cache_dir"] is None:
+        _SESSION["cache_dir"] = Path(
+            tempfile.mkdtemp(prefix="ayon_resolve_render_presets_"))
+    return _SESSION["cache_dir"]
+
+
+def get_preset_hash(xml_path, overrides=None):
+    """Return hash of preset XML content and its overrides.
+
+    Args:
+        xml_path (Path): Base preset XML file.
+        overrides (Optional[dict]): Overrides applied to the preset.
+
+    Returns:
+        str: Hash of the preset.
+    """
+    data = hashlib.sha1(Path(xml_path).read_bytes())
+    data.update(
+        json.dumps(overrides or {}, sort_keys=True, default=str).encode(
+            "utf-8")
+    )
+    return data.hexdigest()
+
+
+def get_preset_file(xml_path, overrides=None):
+    """Return preset file with overrides applied, written once per session.
+
+    Args:
+        xml_path (Path): Base preset XML file.
+        overrides (Optional[dict]): Mapping of XML tag / path to new value,
+            see `rendering.modify_preset_file`.
+
+    Returns:
+        Path: Preset file named after the base preset with hash suffix.
+    """
+    from .rendering import modify_preset_file
+
+    xml_path = Path(xml_path)
+    preset_hash = get_preset_hash(xml_path, overrides)
+    preset_file = _SESSION["files"].get(preset_hash)
+    if preset_file is not None and preset_file.exists():
+        return preset_file
+
+    cache_dir = _get_cache_dir()
+    file_name = f"{xml_path.stem}_{preset_hash[:12]}{xml_path.suffix}"
+    # write to temporary file first so interrupted write never leaves
+    # truncated preset behind
+    temp_file = modify_preset_file(
+        xml_path,
+        cache_dir,
+        overrides or {},
+        file_name=f"{file_name}.tmp",
+        root_attributes={
+            "DbId": str(uuid.uuid5(uuid.NAMESPACE_OID, preset_hash))
+        },
+    )
+    preset_file = cache_dir / file_name
+    os.replace(temp_file, preset_file)
+
+    _SESSION["files"][preset_hash] = preset_file
+    log.debug(f"Registered render preset: {preset_file}")
+    return preset_file
+
+
+def load_preset(project, xml_path, overrides=None):
+    """Load preset in project, the preset is imported to Resolve if needed.
+
+    Args:
+        project (resolve.Project): Project to load the preset in.
+        xml_path (Path): Base preset XML file or preset file returned by
+            `get_preset_file`.
+        overrides (Optional[dict]): Overrides applied to the preset.
+
+    Returns:
+        bool: True if the preset was loaded.
+    """
+    from . import bmdvr
+
+    xml_path = Path(xml_path)
+    if overrides or xml_path not in _SESSION["files"].values():
+        xml_path = get_preset_file(xml_path, overrides)
+
+    # hash suffixed name always refers to the same preset content
+    preset_name = xml_path.stem
+    if not project.LoadRenderPreset(preset_name):
+        log.info(f"Importing render preset: '{preset_name}'")
+        if not bmdvr.ImportRenderPreset(xml_path.as_posix()):
+            log.error(f"Failed to import render preset: {xml_path}")
+            return False
+        if not project.LoadRenderPreset(preset_name):
+            return False
+
+    _SESSION["loaded"].setdefault(
+        project.GetUniqueId(), set()).add(preset_name)
+    return True
+
+
+def cleanup(project):
+    """Delete render presets loaded by AYON from Resolve.
+
+    Preset files stay registered, presets are imported again when they
+    are loaded next time.
+
+    Args:
+        project (resolve.Project): Project the presets were loaded in.
+    """
+    for preset_name in sorted(
+        _SESSION["loaded"].pop(project.GetUniqueId(), ())
+    ):
+        log.debug(f"Deleting render preset: '{preset_name}'")
+        if not project.DeleteRenderPreset(preset_name):
+            log.warning(f"Failed to delete render preset: '{preset_name}'")
+
+
+def clear():
+    """Forget registered preset files of the session."""
+    _SESSION["files"].clear()
+    _SESSION["loaded"].clear()
@@ -5,7 +5,6 @@ from __future__ import annotations
 
 import contextlib
 import io
-import time
 from pathlib import Path
 from pprint import pformat
 from typing import TYPE_CHECKING
@@ -13,11 +12,14 @@ from xml.etree import ElementTree as ET
 
 from ayon_core.lib import Logger
 
+from . import render_capabilities, render_presets
 from .lib import (
+    get_clip_properties,
     get_current_resolve_project,
-    maintain_current_timeline,
     maintain_page_by_name,
 )
+from .render_monitor import RenderMonitor
+from .timeline_scheduler import TimelineScheduler
 
 if TYPE_CHECKING:
     # Import the actual class here; it only runs during linting/type-checking
@@ -27,7 +29,6 @@ if TYPE_CHECKING:
 log = Logger.get_logger(__name__)
 
 
-_SLEEP_TIME = 1
 _PROCESSING_JOBS = []
 
 # File extensions produced by Resolve that are image sequences (not containers)
@@ -50,34 +51,51 @@ def add_timeline_to_render(
     return bmr_project.AddRenderJob()
 
 
-def _render_timelines(timelines, target_render_directory):
+def _render_timelines(timelines, target_render_directory, **monitor_options):
     """Render timelines to target directory
 
     Args:
         timelines (list[resolve.Timeline]): List of Timeline objects
         target_render_directory (Path): Path to target render directory
+        **monitor_options: Options of `RenderMonitor` waiting for the
+            render jobs, `timeout`, `stall_timeout`, `callback` and
+            `cancel_event`.
 
     Returns:
         bool: True if all renders are successful, False otherwise
     """
     bmr_project = get_current_resolve_project()
-    failed_timelines = []
+
+    # each timeline is made current once, render jobs are added for
+    # the current timeline
+    scheduler = TimelineScheduler(bmr_project)
     for timeline_to_render in timelines:
-        with maintain_current_timeline(timeline_to_render):
-            job_id = add_timeline_to_render(
-                bmr_project,
-                target_render_directory,
-            )
+        scheduler.add(
+            timeline_to_render,
+            add_timeline_to_render,
+            bmr_project,
+            target_render_directory,
+        )
+    job_ids = scheduler.run()
+
+    failed_timelines = []
+    timeline_names_by_job_id = {}
+    for timeline_to_render, job_id in zip(timelines, job_ids):
         if job_id:
             # adding job id into list of processing
             # jobs in module constant list
             _PROCESSING_JOBS.append(job_id)
+            timeline_names_by_job_id[job_id] = timeline_to_render.GetName()
             log.info(f"Created render Job ID: {job_id}")
         else:
             failed_timelines.append(timeline_to_render.GetName())
     if len(failed_timelines) != len(timelines):
         bmr_project.StartRendering(_PROCESSING_JOBS, isInteractiveMode=False)
-        wait_for_rendering_completion()
+        statuses = wait_for_rendering_completion(
+            list(timeline_names_by_job_id), **monitor_options)
+        for job_id, status in statuses.items():
+            if status.get("JobStatus") != "Complete":
+                failed_timelines.append(timeline_names_by_job_id[job_id])
         delete_all_processed_jobs()
     if failed_timelines:
         log.error(f"Failed to render timelines: {failed_timelines}")
@@ -86,11 +104,14 @@ def _render_timelines(timelines, target_render_directory):
     return True
 
 
-def render_all_timelines(target_render_directory):
+def render_all_timelines(target_render_directory, **monitor_options):
     """Render all of the timelines of current project.
 
     Args:
         target_render_directory (Path): Path to target render directory
+        **monitor_options: Options of `RenderMonitor` waiting for the
+            render jobs, `timeout`, `stall_timeout`, `callback` and
+            `cancel_event`.
 
     Returns:
         bool: True if all renders are successful, False otherwise
@@ -102,10 +123,13 @@ def render_all_timelines(target_render_directory):
             bmr_project.GetTimelineByIndex(index + 1)
             for index in range(0, int(timelineCount))
         ]
-        return _render_timelines(all_timelines, target_render_directory)
+        return _render_timelines(
+            all_timelines, target_render_directory, **monitor_options)
 
 
-def render_single_timeline(timeline, target_render_directory):
+def render_single_timeline(
+    timeline, target_render_directory, **monitor_options
+):
     """Render single timeline
 
     Process is taking a defined timeline and render it to temporary
@@ -115,11 +139,15 @@ def render_single_timeline(timeline, target_render_directory):
     Args:
         timeline (resolve.Timeline): Timeline object
         target_render_directory (Path): Path to target render directory
+        **monitor_options: Options of `RenderMonitor` waiting for the
+            render jobs, `timeout`, `stall_timeout`, `callback` and
+            `cancel_event`.
 
     Returns:
         bool: True if rendering is successful, False otherwise
     """
-    return _render_timelines([timeline], target_render_directory)
+    return _render_timelines(
+        [timeline], target_render_directory, **monitor_options)
 
 
 def is_rendering_in_progress():
@@ -131,11 +159,48 @@ def is_rendering_in_progress():
     return bmr_project.IsRenderingInProgress()
 
 
-def wait_for_rendering_completion():
-    """Wait for rendering completion"""
-    while is_rendering_in_progress():
-        time.sleep(_SLEEP_TIME)
-    return
+def wait_for_rendering_completion(
+    job_ids=None,
+    timeout=None,
+    stall_timeout=None,
+    callback=None,
+    cancel_event=None,
+):
+    """Wait for rendering completion of render jobs.
+
+    Progress is logged and rendering is stopped on timeout or when it
+    stalls, see `RenderMonitor`.
+
+    Args:
+        job_ids (Optional[list[str]]): Render jobs to wait for, all
+            processing jobs if not provided.
+        timeout (Optional[float]): Seconds after which rendering is stopped.
+        stall_timeout (Optional[float]): Seconds without progress after
+            which rendering is stopped.
+        callback (Optional[Callable[[float, Union[float, None]], None]]):
+            Called with progress in percent and estimated remaining seconds.
+        cancel_event (Optional[threading.Event]): Event stopping rendering
+            when set.
+
+    Returns:
+        dict[str, dict]: Last render job status by job id.
+    """
+    bmr_project = get_current_resolve_project()
+    if not bmr_project:
+        return {}
+
+    if job_ids is None:
+        job_ids = list(_PROCESSING_JOBS)
+    monitor = RenderMonitor(
+        bmr_project,
+        job_ids,
+        timeout=timeout,
+        stall_timeout=stall_timeout,
+        callback=callback,
+        logger=log,
+        cancel_event=cancel_event,
+    )
+    return monitor.wait()
 
 
 def apply_drx_to_all_timeline_items(timeline, path, grade_mode=0):
@@ -205,49 +270,40 @@ def _solo_video_track(timeline_item):
         for i in range(1, track_count + 1)
     }
 
-    with maintain_page_by_name("Edit"):
-        # Disable every enabled video track that is not the clip's track.
-        for i, enabled in original_states.items():
-            if i != item_track_index and enabled:
-                timeline.SetTrackEnable(track_type, i, False)
+    # Disable every enabled video track that is not the clip's track and
+    # guarantee the clip's own track is enabled.
+    changed_states = {
+        i: i == item_track_index
+        for i, enabled in original_states.items()
+        if enabled != (i == item_track_index)
+    }
 
-        # Guarantee the clip's own track is enabled.
-        if not original_states.get(item_track_index):
-            timeline.SetTrackEnable(track_type, item_track_index, True)
+    # Edit page is opened only if any track state has to change.
+    if changed_states:
+        with maintain_page_by_name("Edit"):
+            for i, enabled in changed_states.items():
+                timeline.SetTrackEnable(track_type, i, enabled)
 
     try:
         yield
     finally:
-        with maintain_page_by_name("Edit"):
-            for i, was_enabled in original_states.items():
-                if timeline.GetIsTrackEnabled(track_type, i) != was_enabled:
-                    timeline.SetTrackEnable(track_type, i, was_enabled)
+        if changed_states:
+            with maintain_page_by_name("Edit"):
+                for i in changed_states:
+                    timeline.SetTrackEnable(
+                        track_type, i, original_states[i])
 
 
-def render_clip_to_intermediate_file(
-    timeline_item: resolve.TimelineItem,
-    target_render_directory: Path
-) -> Path | list[Path]:
-    """Render a single TimelineItem's range on the currently active timeline.
-
-    Uses the render settings already configured on the project (format, codec,
-    preset). Caller is responsible for setting those up before calling this
-    function (e.g. via ``set_render_preset_from_file`` and
-    ``set_format_and_codec``).
-
-    Args:
-        timeline_item: A Resolve ``TimelineItem`` object from the active timeline.
-        target_render_directory (Path): Directory where rendered files are written.
+def _add_clip_render_job(bmr_project, timeline_item, target_render_directory):
+    """Add render job of *timeline_item* range with current render settings.
 
     Returns:
-        Path: Single file path for container formats (QuickTime, MXF, …).
-        list[Path]: Sorted list of frame paths for image sequences (EXR, DPX, …).
+        str: Render job id.
 
     Raises:
-        RuntimeError: If the render job cannot be created, started, or completes
-            with a non-"Complete" status, or if no output files are found.
+        RuntimeError: If render settings cannot be set or the render job
+            cannot be created.
     """
-    bmr_project = get_current_resolve_project()
     media_pool_item = timeline_item.GetMediaPoolItem()
 
     render_settings = {
@@ -256,33 +312,29 @@ def render_clip_to_intermediate_file(
         "MarkOut":   timeline_item.GetEnd() - 1,
         "TargetDir": target_render_directory.as_posix(),
         "CustomName": timeline_item.GetName(),
-        "FrameRate": float(media_pool_item.GetClipProperty("FPS")),
+        "FrameRate": get_clip_properties(media_pool_item).fps,
     }
     log.info(f"Clip render settings: {pformat(render_settings)}")
 
     if not bmr_project.SetRenderSettings(render_settings):
         raise RuntimeError("SetRenderSettings failed for clip render.")
 
-    with _solo_video_track(timeline_item):
-        job_id = bmr_project.AddRenderJob()
-        if not job_id:
-            raise RuntimeError("AddRenderJob failed for clip render.")
+    job_id = bmr_project.AddRenderJob()
+    if not job_id:
+        raise RuntimeError("AddRenderJob failed for clip render.")
 
-        log.info(f"Clip render job created: {job_id}")
-        try:
-            if not bmr_project.StartRendering([job_id], isInteractiveMode=False):
-                raise RuntimeError(f"StartRendering failed for job '{job_id}'.")
-            wait_for_rendering_completion()
+    log.info(f"Clip render job created: {job_id}")
+    return job_id
 
-            status = bmr_project.GetRenderJobStatus(job_id)
-            if status.get("JobStatus") != "Complete":
-                raise RuntimeError(
-                    f"Clip render job '{job_id}' did not complete: {status}"
-                )
-        finally:
-            log.info(f"Deleting clip render job: {job_id}")
-            bmr_project.DeleteRenderJob(job_id)
 
+def _collect_rendered_clip_files(
+    target_render_directory: Path
+) -> Path | list[Path]:
+    """Return files rendered to *target_render_directory*.
+
+    Raises:
+        RuntimeError: If no output files are found.
+    """
     # Collect all rendered files, handling two layouts:
     #   1. Flat:   target_render_directory/*.<ext>
     #   2. Nested: target_render_directory/**/*.<ext>
@@ -302,10 +354,207 @@ def render_clip_to_intermediate_file(
     return rendered[0]  # Path
 
 
+def render_clip_to_intermediate_file(
+    timeline_item: resolve.TimelineItem,
+    target_render_directory: Path,
+    **monitor_options,
+) -> Path | list[Path]:
+    """Render a single TimelineItem's range on the currently active timeline.
+
+    Uses the render settings already configured on the project (format, codec,
+    preset). Caller is responsible for setting those up before calling this
+    function (e.g. via ``set_render_preset_from_file`` and
+    ``set_format_and_codec``).
 
-def set_render_preset_from_file(preset_file_path):
-    from . import bmdvr
+    Args:
+        timeline_item: A Resolve ``TimelineItem`` object from the active timeline.
+        target_render_directory (Path): Directory where rendered files are written.
+        **monitor_options: Options of `RenderMonitor` waiting for the
+            render jobs, `timeout`, `stall_timeout`, `callback` and
+            `cancel_event`.
 
+    Returns:
+        Path: Single file path for container formats (QuickTime, MXF, …).
+        list[Path]: Sorted list of frame paths for image sequences (EXR, DPX, …).
+
+    Raises:
+        RuntimeError: If the render job cannot be created, started, or completes
+            with a non-"Complete" status, or if no output files are found.
+    """
+    bmr_project = get_current_resolve_project()
+
+    with _solo_video_track(timeline_item):
+        job_id = _add_clip_render_job(
+            bmr_project, timeline_item, target_render_directory)
+        try:
+            if not bmr_project.StartRendering([job_id], isInteractiveMode=False):
+                raise RuntimeError(f"StartRendering failed for job '{job_id}'.")
+            status = wait_for_rendering_completion(
+                [job_id], **monitor_options)[job_id]
+            if status.get("JobStatus") != "Complete":
+                raise RuntimeError(
+                    f"Clip render job '{job_id}' did not complete: {status}"
+                )
+        finally:
+            log.info(f"Deleting clip render job: {job_id}")
+            bmr_project.DeleteRenderJob(job_id)
+
+    return _collect_rendered_clip_files(target_render_directory)
+
+
+class ClipRenderRequest:
+    """Render of a TimelineItem's range planned by `render_clips`.
+
+    Args:
+        timeline_item: A Resolve ``TimelineItem`` object from the active
+            timeline.
+        target_render_directory (Path): Directory where rendered files are
+            written, must not be shared with other requests.
+        preset_path (Path): Path to the render preset XML file.
+        file_format (str): Resolve format name (e.g. ``"EXR"``).
+        codec (str): Resolve codec name (e.g. ``"RGB half (DWAA)"``).
+    """
+    __slots__ = (
+        "timeline_item",
+        "target_render_directory",
+        "preset_path",
+        "file_format",
+        "codec",
+        "job_id",
+        "rendered",
+        "error",
+    )
+
+    def __init__(
+        self,
+        timeline_item,
+        target_render_directory,
+        preset_path,
+        file_format,
+        codec,
+    ):
+        self.timeline_item = timeline_item
+        self.target_render_directory = target_render_directory
+        self.preset_path = preset_path
+        self.file_format = file_format
+        self.codec = codec
+        self.job_id = None
+        # set by `render_clips`
+        self.rendered = None
+        self.error = None
+
+    def __repr__(self):
+        return f"<ClipRenderRequest '{self.target_render_directory.name}'>"
+
+
+def render_clips(requests: list[ClipRenderRequest], **monitor_options):
+    """Render ranges of multiple TimelineItems in a single render queue.
+
+    Requests are grouped by track of their timeline item. For each group the
+    track is soloed once, render jobs of all its requests are added and
+    rendered with single ``StartRendering`` call. Tracks have to be soloed
+    while rendering, so groups can't share a render queue.
+
+    Each request gets its ``rendered`` files or ``error`` message, failure of
+    one request does not stop rendering of the others.
+
+    Args:
+        requests (list[ClipRenderRequest]): Planned renders of clips on the
+            active timeline.
+        **monitor_options: Options of `RenderMonitor` waiting for the
+            render jobs, `timeout`, `stall_timeout`, `callback` and
+            `cancel_event`.
+    """
+    bmr_project = get_current_resolve_project()
+
+    groups = {}
+    for request in requests:
+        track = tuple(request.timeline_item.GetTrackTypeAndIndex())
+        groups.setdefault(track, []).append(request)
+
+    with maintain_page_by_name("Deliver"):
+        for group_requests in groups.values():
+            with _solo_video_track(group_requests[0].timeline_item):
+                _render_clip_group(
+                    bmr_project, group_requests, **monitor_options)
+
+
+def _render_clip_group(bmr_project, requests, **monitor_options):
+    render_setup = None
+    for request in requests:
+        try:
+            # presets are loaded only when they change between requests
+            setup = (
+                request.preset_path.as_posix(),
+                request.file_format,
+                request.codec,
+            )
+            if setup != render_setup:
+                render_setup = None
+                if not set_render_preset_from_file(setup[0]):
+                    raise RuntimeError(
+                        f"Unable to load render preset: {setup[0]}")
+                if not set_format_and_codec(setup[1], setup[2]):
+                    raise RuntimeError(
+                        f"Unable to set render format '{setup[1]}' "
+                        f"/ codec '{setup[2]}'."
+                    )
+                render_setup = setup
+
+            request.job_id = _add_clip_render_job(
+                bmr_project,
+                request.timeline_item,
+                request.target_render_directory,
+            )
+        except RuntimeError as exc:
+            request.error = str(exc)
+
+    queued = [request for request in requests if request.job_id]
+    if not queued:
+        return
+
+    job_ids = [request.job_id for request in queued]
+    try:
+        if not bmr_project.StartRendering(job_ids, isInteractiveMode=False):
+            for request in queued:
+                request.error = f"StartRendering failed for jobs {job_ids}."
+            return
+        statuses = wait_for_rendering_completion(
+            job_ids, **monitor_options)
+
+        for request in queued:
+            status = statuses[request.job_id]
+            if status.get("JobStatus") != "Complete":
+                request.error = (
+                    f"Clip render job '{request.job_id}' did not complete: "
+                    f"{status}"
+                )
+                continue
+            try:
+                request.rendered = _collect_rendered_clip_files(
+                    request.target_render_directory)
+            except RuntimeError as exc:
+                request.error = str(exc)
+    finally:
+        for job_id in job_ids:
+            log.info(f"Deleting clip render job: {job_id}")
+            bmr_project.DeleteRenderJob(job_id)
+
+
+def set_render_preset_from_file(preset_file_path, overrides=None):
+    """Load render preset from file in current project.
+
+    Each distinct preset is imported to Resolve once per session under
+    a name suffixed with hash of its content, see `render_presets`.
+
+    Args:
+        preset_file_path (str): Path to the render preset XML file.
+        overrides (Optional[dict]): Mapping of XML tag / path to new value
+            applied to the preset, see `modify_preset_file`.
+
+    Returns:
+        bool: True if the preset was loaded.
+    """
     bmr_project = get_current_resolve_project()
     preset_path = Path(preset_file_path)
 
@@ -314,48 +563,36 @@ def set_render_preset_from_file(preset_file_path):
         log.error(f"File not found: {preset_file_path}")
         return
 
-    # get only the file name without extension
-    preset_name = preset_path.stem
-
-    # check if the render preset already exists
-    if bmr_project.LoadRenderPreset(preset_name):
-        delete_preset = bmr_project.DeleteRenderPreset(preset_name)
-        log.info(f"Deleted already existing preset: {delete_preset}")
-
-    log.info(
-        "Render preset does not exists. "
-        f"Creating new render preset: '{preset_name}'"
-    )
-    return bmdvr.ImportRenderPreset(preset_path.as_posix())
-
+    return render_presets.load_preset(bmr_project, preset_path, overrides)
 
 
 def set_format_and_codec(render_format, render_codec):
-    bmr_project = get_current_resolve_project()
+    """Set current render format and codec of current project.
 
-    available_render_formats = bmr_project.GetRenderFormats()
-    log.debug(f"Available formats: {pformat(available_render_formats)}")
+    Available formats and codecs are queried once per session, see
+    `render_capabilities`.
 
-    # get render format value from key
-    render_format_val = available_render_formats.get(render_format)
-    if not render_format_val:
-        log.error(f"Invalid render format: '{render_format}'")
-        return False
+    Args:
+        render_format (str): Resolve format name (e.g. ``"EXR"``).
+        render_codec (str): Resolve codec name (e.g. ``"RGB half (DWAA)"``).
 
-    available_render_codecs = bmr_project.GetRenderCodecs(render_format_val)
-    log.debug(
-        f"Available codecs for format '{render_format_val}': "
-        f"{pformat(available_render_codecs)}"
-    )
+    Returns:
+        Union[str, bool]: Format value (file extension) or False if
+            the format and codec could not be set.
+    """
+    bmr_project = get_current_resolve_project()
 
-    # get render codec value from key
-    render_codec_val = available_render_codecs.get(render_codec)
-    if not render_codec_val:
-        log.error(f"Invalid render codec: '{render_codec}'")
+    try:
+        render_format_val, render_codec_val = (
+            render_capabilities.get_format_and_codec_values(
+                bmr_project, render_format, render_codec)
+        )
+    except ValueError as exc:
+        log.error(str(exc))
         return False
 
-    if not bmr_project.SetCurrentRenderFormatAndCodec(
-        render_format_val, render_codec_val
+    if not render_capabilities.set_current_format_and_codec(
+        bmr_project, render_format_val, render_codec_val
     ):
         log.error(
             f"Failed to set render format '{render_format}' "
@@ -372,6 +609,7 @@ def render_timeline_intermediate_file(
     preset_path: Path,
     file_format: str,
     codec: str,
+    **monitor_options,
 ) -> Path | list[Path]:
     """Render *timeline* to an intermediate file in *target_render_directory*.
 
@@ -381,6 +619,9 @@ def render_timeline_intermediate_file(
         preset_path (Path): Path to the render preset XML file.
         file_format (str): Resolve format name (e.g. ``"QuickTime"``).
         codec (str): Resolve codec name (e.g. ``"H.264"``).
+        **monitor_options: Options of `RenderMonitor` waiting for the
+            render job, `timeout`, `stall_timeout`, `callback` and
+            `cancel_event`.
 
     Returns:
         Path: Path to the rendered file.
@@ -400,7 +641,9 @@ def render_timeline_intermediate_file(
         if not format_extension:
             raise RuntimeError("Unable to set render format and codec.")
 
-        if not render_single_timeline(timeline, target_render_directory):
+        if not render_single_timeline(
+            timeline, target_render_directory, **monitor_options
+        ):
             raise RuntimeError("Unable to render timeline.")
 
     # Collect all files matching the format extension, handling two layouts:
@@ -453,6 +696,8 @@ def modify_preset_file(
     xml_path: Path,
     staging_dir: Path,
     data: dict,
+    file_name: str | None = None,
+    root_attributes: dict | None = None,
 ) -> Path:
     """Copy *xml_path* to *staging_dir* and apply *data* overrides.
 
@@ -468,6 +713,10 @@ def modify_preset_file(
         xml_path (Path): Source XML preset file.
         staging_dir (Path): Directory where the modified copy is written.
         data (dict): Mapping of XML tag / path → new text value.
+        file_name (str | None): Name of the modified copy, name of
+            *xml_path* is used if not provided.
+        root_attributes (dict | None): Attributes set on the root element,
+            e.g. ``DbId`` of ``SyRecordInfo``.
 
     Returns:
         Path: Path to the modified copy of the preset in *staging_dir*.
@@ -475,7 +724,7 @@ def modify_preset_file(
     Raises:
         AttributeError: Logged as a warning when a bare tag is not found.
     """
-    temp_path = staging_dir / xml_path.name
+    temp_path = staging_dir / (file_name or xml_path.name)
 
     # Read raw text upfront so we can extract the prolog (XML declaration +
     # any prolog-level comments).  Python's ElementTree parser drops prolog
@@ -487,6 +736,8 @@ def modify_preset_file(
     # insert_comments=True preserves comments that live *inside* elements.
     parser = ET.XMLParser(target=ET.TreeBuilder(insert_comments=True))
     tree = ET.parse(xml_path, parser=parser)
+    if root_attributes:
+        tree.getroot().attrib.update(root_attributes)
 
     for key, value in data.items():
         log.debug(f"Setting {key} to {value}")
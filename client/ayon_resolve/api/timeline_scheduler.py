@@ -0,0 +1,283 @@
+"""
+Coalescing of current timeline switches.
+
+Every `SetCurrentTimeline` call redraws Resolve UI and plugins working on
+multiple timelines used to switch to a timeline and back for each piece of
+work. Switches made here are skipped when the target timeline is already
+current, timelines are resolved by unique id or name from `TimelineIndex`
+instead of walking all project timelines, and while a switch session is
+active (see `lib.timeline_switch_session`, publish renders run in one)
+the original timeline is restored only once when the session ends.
+"""
+import contextlib
+import collections
+
+from ayon_core.lib import Logger
+
+log = Logger.get_logger(__name__)
+
+_SESSION = {
+    "active": False,
+    # timeline current when the session started, set on first switch
+    "original_timeline": None,
+    "timeline_index": None,
+    "switches": 0,
+}
+
+
+class TimelineIndex:
+    """Timelines of a project by unique id and by name.
+
+    Args:
+        project (resolve.Project): Project owning the timelines.
+    """
+
+    def __init__(self, project):
+        self.project = project
+        self._by_id = {}
+        self._by_name = {}
+        self.build()
+
+    def build(self):
+        """Collect all timelines of the project."""
+        self._by_id.clear()
+        self._by_name.clear()
+        timeline_count = int(self.project.GetTimelineCount() or 0)
+        for timeline_index in range(1, timeline_count + 1):
+            timeline = self.project.GetTimelineByIndex(timeline_index)
+            self._by_id[timeline.GetUniqueId()] = timeline
+            self._by_name[timeline.GetName()] = timeline
+
+    def get_by_id(self, timeline_id):
+        """Return timeline by its unique id."""
+        return self._by_id.get(timeline_id)
+
+    def get_by_name(self, name, refresh=True):
+        """Return timeline by its name.
+
+        Args:
+            name (str): Timeline name.
+            refresh (Optional[bool]): Rebuild the index once if the timeline
+                is not found, it may have been created meanwhile.
+
+        Returns:
+            Union[resolve.Timeline, None]: Timeline if found.
+        """
+        timeline = self._by_name.get(name)
+        if timeline is None and refresh:
+            self.build()
+            timeline = self._by_name.get(name)
+        return timeline
+
+
+class TimelineScheduler:
+    """Queue of work grouped by the timeline it has to run on.
+
+    Queued callbacks are run timeline by timeline in order of first use of
+    each timeline, so each timeline is made current only once.
+
+    Args:
+        project (resolve.Project): Project owning the timelines.
+
+    Example:
+        >>> scheduler = TimelineScheduler(project)
+        >>> for timeline in timelines:
+        ...     scheduler.add(timeline, add_render_job, timeline)
+        >>> job_ids = scheduler.run()
+    """
+
+    def __init__(self, project):
+        self.project = project
+        self._queue = collections.OrderedDict()
+
+    def add(self, timeline, callback, *args, **kwargs):
+        """Queue callback to be called while timeline is current.
+
+        Args:
+            timeline (Union[resolve.Timeline, resolve.MediaPoolItem]):
+                Timeline or its media pool item.
+            callback (Callable): Called with *args* and *kwargs*.
+        """
+        timeline = resolve_timeline(self.project, timeline)
+        group = self._queue.setdefault(
+            timeline.GetUniqueId(), (timeline, []))
+        group[1].append((len(self), callback, args, kwargs))
+
+    def __len__(self):
+        return sum(len(group[1]) for group in self._queue.values())
+
+    def run(self):
+        """Run queued callbacks and clear the queue.
+
+        Returns:
+            list: Callback results in order the callbacks were queued.
+        """
+        results = [None] * len(self)
+        queue = list(self._queue.values())
+        self._queue.clear()
+        with maintain_current_timeline(self.project) as switch:
+            for timeline, callbacks in queue:
+                switch(timeline)
+                for position, callback, args, kwargs in callbacks:
+                    results[position] = callback(*args, **kwargs)
+        return results
+
+
+def is_timeline(obj):
+    """Return whether Resolve object is a timeline.
+
+    Note: Media pool items do not have `AddTrack` attribute. API is not
+        providing any other way to identify the object type and `hasattr`
+        is returning false info.
+    """
+    return "AddTrack" in dir(obj)
+
+
+def get_timeline_index(project):
+    """Return timeline index shared within active session.
+
+    Args:
+        project (resolve.Project): Project owning the timelines.
+
+    Returns:
+        TimelineIndex: Index of project timelines.
+    """
+    if not _SESSION["active"]:
+        return TimelineIndex(project)
+
+    index = _SESSION["timeline_index"]
+    if index is None:
+        index = TimelineIndex(project)
+        _SESSION["timeline_index"] = index
+    return index
+
+
+def resolve_timeline(project, timeline):
+    """Return timeline of media pool item or the timeline itself.
+
+    Args:
+        project (resolve.Project): Project owning the timeline.
+        timeline (Union[resolve.Timeline, resolve.MediaPoolItem]):
+            Timeline or its media pool item.
+
+    Returns:
+        Union[resolve.Timeline, None]: Timeline if found.
+    """
+    if is_timeline(timeline):
+        return timeline
+    return get_timeline_index(project).get_by_name(timeline.GetName())
+
+
+def switch_timeline(project, timeline, current_timeline=None):
+    """Make timeline current unless it already is.
+
+    Args:
+        project (resolve.Project): Project owning the timeline.
+        timeline (resolve.Timeline): Timeline to switch to.
+        current_timeline (Optional[resolve.Timeline]): Current timeline if
+            already known.
+
+    Returns:
+        bool: Whether the current timeline was changed.
+
+    Raises:
+        ValueError: If Resolve failed to switch the timeline.
+    """
+    if current_timeline is None:
+        current_timeline = project.GetCurrentTimeline()
+
+    if current_timeline and (
+        current_timeline.GetUniqueId() == timeline.GetUniqueId()
+    ):
+        return False
+
+    if not project.SetCurrentTimeline(timeline):
+        raise ValueError(f"Failed to switch to timeline: {timeline}")
+
+    if _SESSION["active"]:
+        _SESSION["switches"] += 1
+        if _SESSION["original_timeline"] is None:
+            _SESSION["original_timeline"] = current_timeline
+    return True
+
+
+@contextlib.contextmanager
+def maintain_current_timeline(project, restore_timeline=None):
+    """Allow switching timelines and restore the original on exit.
+
+    While a switch session is active the original timeline is restored
+    when the session ends instead.
+
+    Args:
+        project (resolve.Project): Project owning the timelines.
+        restore_timeline (Optional[resolve.Timeline]): Timeline made
+            current on exit, the current one is used if not provided.
+
+    Yields:
+        Callable[[resolve.Timeline], bool]: Function switching current
+            timeline, returns whether the timeline was changed.
+    """
+    current_timeline = project.GetCurrentTimeline()
+    restore = restore_timeline is not None
+    restore_timeline = restore_timeline or current_timeline
+
+    def switch(timeline):
+        nonlocal current_timeline, restore
+        changed = switch_timeline(project, timeline, current_timeline)
+        current_timeline = timeline
+        restore = restore or changed
+        return changed
+
+    try:
+        yield switch
+    finally:
+        if restore and restore_timeline and not _SESSION["active"]:
+            switch_timeline(project, restore_timeline, current_timeline)
+
+
+def is_session_active():
+    """Return whether a switch session is active."""
+    return _SESSION["active"]
+
+
+def begin_session():
+    """Start coalescing timeline switches until `end_session` is called.
+
+    Session left active by an interrupted run is dropped without
+    restoring its original timeline.
+    """
+    if _SESSION["active"]:
+        log.debug("Dropping unfinished timeline switch session.")
+    _SESSION.update({
+        "active": True,
+        "original_timeline": None,
+        "timeline_index": None,
+        "switches": 0,
+    })
+
+
+def end_session(project=None):
+    """Stop coalescing and restore the timeline current at session start.
+
+    Args:
+        project (Optional[resolve.Project]): Project owning the timelines,
+            original timeline is not restored if not provided.
+
+    Returns:
+        int: Number of timeline switches made during the session.
+    """
+    if not _SESSION["active"]:
+        return 0
+
+    original_timeline = _SESSION["original_timeline"]
+    switches = _SESSION["switches"]
+    _SESSION.update({
+        "active": False,
+        "original_timeline": None,
+        "timeline_index": None,
+        "switches": 0,
+    })
+    if project is not None and original_timeline:
+        if switch_timeline(project, original_timeline):
+            switches += 1
+    return switches
@@ -0,0 +1,259 @@
+"""
+Read-only snapshot of timeline tracks and items.
+
+Every Resolve API call is an IPC round trip, so walking all tracks of a
+large timeline is expensive. `TimelineSnapshot` walks the timeline once and
+keeps compact records of every track and item which can then be queried
+by unique id, track or frame range. Values of an item are read from
+Resolve only when first used and kept on its record.
+
+Snapshots are shared between callers while
+`operation_cache.operation_scope` is active, otherwise each `get_snapshot`
+call builds a new one.
+"""
+import bisect
+
+from . import operation_cache
+
+TRACK_TYPES = ("video", "audio")
+
+# Name of operation cache with snapshots by unique id of timeline
+_CACHE_NAME = "timeline_snapshots"
+
+
+class TrackRecord:
+    """Timeline track with its items."""
+    __slots__ = (
+        "type", "index", "name", "items", "_sorted_items", "_starts")
+
+    def __init__(self, track_type, index, name):
+        self.type = track_type
+        self.index = index
+        self.name = name
+        self.items = []
+        self._sorted_items = None
+        self._starts = None
+
+    def __repr__(self):
+        return f"<TrackRecord {self.type} {self.index} '{self.name}'>"
+
+    def get_items_in_range(self, frame_start, frame_end):
+        """Return items overlapping frame range, end frame exclusive."""
+        if self._starts is None:
+            self._sorted_items = sorted(
+                self.items, key=lambda record: record.start)
+            self._starts = [record.start for record in self._sorted_items]
+
+        end_index = bisect.bisect_left(self._starts, frame_end)
+        return [
+            record for record in self._sorted_items[:end_index]
+            if record.end > frame_start
+        ]
+
+
+def _lazy_value(name, read):
+    """Return property reading value of the item on first access.
+
+    Records are created for every item of walked tracks, while callers
+    mostly need just one or two values of each item, e.g. its color.
+    """
+    def getter(self):
+        values = self._values
+        if name not in values:
+            values[name] = read(self.item)
+        return values[name]
+
+    return property(getter)
+
+
+class TimelineItemRecord:
+    """Values of a single timeline item, read once on first access."""
+    __slots__ = ("item", "track", "index", "_values")
+
+    unique_id = _lazy_value("unique_id", lambda item: item.GetUniqueId())
+    name = _lazy_value("name", lambda item: item.GetName())
+    start = _lazy_value("start", lambda item: item.GetStart())
+    end = _lazy_value("end", lambda item: item.GetEnd())
+    left_offset = _lazy_value(
+        "left_offset", lambda item: item.GetLeftOffset())
+    right_offset = _lazy_value(
+        "right_offset", lambda item: item.GetRightOffset())
+    color = _lazy_value("color", lambda item: item.GetClipColor())
+    # Adjustment clips, generators or Fusion compositions do not have
+    # any media pool item.
+    media_pool_item = _lazy_value(
+        "media_pool_item", lambda item: item.GetMediaPoolItem())
+
+    def __init__(self, item, track, index):
+        self.item = item
+        self.track = track
+        self.index = index
+        self._values = {}
+
+    def __repr__(self):
+        return f"<TimelineItemRecord '{self.name}' {self.unique_id}>"
+
+    @property
+    def media_pool_item_id(self):
+        # Same id as used by media pool index and clip usage index
+        if "media_pool_item_id" not in self._values:
+            media_pool_item = self.media_pool_item
+            self._values["media_pool_item_id"] = (
+                media_pool_item.GetUniqueId() if media_pool_item else None
+            )
+        return self._values["media_pool_item_id"]
+
+    @property
+    def duration(self):
+        return self.end - self.start
+
+
+class TimelineSnapshot:
+    """Tracks and items of a timeline collected in a single pass.
+
+    Tracks of each type are walked once on first access, so snapshot used
+    only for video tracks never asks Resolve for audio items.
+
+    Args:
+        project (resolve.Project): Project owning the timeline.
+        timeline (resolve.Timeline): Snapshot timeline.
+    """
+
+    def __init__(self, project, timeline):
+        self.project = project
+        self.timeline = timeline
+        self.timeline_id = timeline.GetUniqueId()
+        self._tracks = {}
+        self._items_by_id = None
+
+    def _collect_tracks(self, track_type):
+        tracks = []
+        track_count = int(self.timeline.GetTrackCount(track_type) or 0)
+        for track_index in range(1, track_count + 1):
+            track = TrackRecord(
+                track_type,
+                track_index,
+                self.timeline.GetTrackName(track_type, track_index),
+            )
+            timeline_items = self.timeline.GetItemListInTrack(
+                track_type, track_index) or []
+            for clip_index, timeline_item in enumerate(timeline_items):
+                track.items.append(
+                    TimelineItemRecord(timeline_item, track, clip_index))
+            tracks.append(track)
+        return tracks
+
+    def get_tracks(self, track_type="video"):
+        """Return tracks of type ordered by track index."""
+        tracks = self._tracks.get(track_type)
+        if tracks is None:
+            tracks = self._collect_tracks(track_type)
+            self._tracks[track_type] = tracks
+        return tracks
+
+    def get_track(self, track_type, track_index):
+        """Return track by its type and 1-based index."""
+        tracks = self.get_tracks(track_type)
+        if 0 < track_index <= len(tracks):
+            return tracks[track_index - 1]
+        return None
+
+    def get_item(self, unique_id):
+        """Return item record by unique id of timeline item."""
+        if self._items_by_id is None:
+            self._items_by_id = {
+                record.unique_id: record
+                for record in self.iter_items(track_type=None)
+            }
+        return self._items_by_id.get(unique_id)
+
+    def iter_items(self, track_type="video", track_name=None):
+        """Iterate item records in track order.
+
+        Args:
+            track_type (Optional[str]): Type of tracks, all if None.
+            track_name (Optional[Union[str, list[str]]]): Keep only tracks
+                with name contained in the value.
+
+        Yields:
+            TimelineItemRecord: Item record.
+        """
+        track_types = [track_type] if track_type else TRACK_TYPES
+        for _track_type in track_types:
+            for track in self.get_tracks(_track_type):
+                if track_name and track.name not in track_name:
+                    continue
+                yield from track.items
+
+    def get_items_in_range(self, frame_start, frame_end, track_type=None):
+        """Return item records overlapping timeline frame range.
+
+        Args:
+            frame_start (int): First timeline frame.
+            frame_end (int): Timeline frame after the last frame.
+            track_type (Optional[str]): Type of tracks, all if None.
+
+        Returns:
+            list[TimelineItemRecord]: Overlapping items.
+        """
+        track_types = [track_type] if track_type else TRACK_TYPES
+        output = []
+        for _track_type in track_types:
+            for track in self.get_tracks(_track_type):
+                output.extend(
+                    track.get_items_in_range(frame_start, frame_end))
+        return output
+
+    def get_items_by_media_pool_item_id(
+            self, media_pool_item_id, track_type=None):
+        """Return item records using media pool item.
+
+        Args:
+            media_pool_item_id (str): Unique id of media pool item.
+            track_type (Optional[str]): Type of tracks, all if None.
+
+        Returns:
+            list[TimelineItemRecord]: Items in track order.
+        """
+        return [
+            record for record in self.iter_items(track_type=track_type)
+            if record.media_pool_item_id == media_pool_item_id
+        ]
+
+
+def get_snapshot(project, timeline):
+    """Return snapshot of timeline, shared within active operation.
+
+    Args:
+        project (resolve.Project): Project owning the timeline.
+        timeline (resolve.Timeline): Timeline to snapshot.
+
+    Returns:
+        TimelineSnapshot: Snapshot of the timeline.
+    """
+    snapshots = operation_cache.get_cache(_CACHE_NAME)
+    if snapshots is None:
+        return TimelineSnapshot(project, timeline)
+
+    timeline_id = timeline.GetUniqueId()
+    snapshot = snapshots.get(timeline_id)
+    if snapshot is None:
+        snapshot = TimelineSnapshot(project, timeline)
+        snapshots[timeline_id] = snapshot
+    return snapshot
+
+
+def invalidate(timeline=None):
+    """Drop shared snapshots after timeline edits.
+
+    Args:
+        timeline (Optional[resolve.Timeline]): Edited timeline, all shared
+            snapshots are dropped if not provided.
+    """
+    snapshots = operation_cache.get_cache(_CACHE_NAME)
+    if not snapshots:
+        return
+    if timeline is None:
+        snapshots.clear()
+        return
+    snapshots.pop(timeline.GetUniqueId(), None)
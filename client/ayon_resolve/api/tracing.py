@@ -0,0 +1,341 @@
+"""
+Opt-in tracer of Resolve scripting API round trips.
+
+When enabled, Resolve objects handed out by `lib.get_project_manager` are
+wrapped in transparent proxies which time every method call and record it
+under the calling AYON function and, if any, the calling pyblish plugin,
+creator or loader.
+
+Tracing is enabled by setting `AYON_RESOLVE_API_TRACE` environment variable
+to a directory where JSON reports are written by `dump_report`.
+"""
+import os
+import sys
+import json
+import time
+import collections
+
+from ayon_core.lib import Logger
+
+log = Logger.get_logger(__name__)
+
+TRACE_ENV_KEY = "AYON_RESOLVE_API_TRACE"
+
+_ADDON_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+_PLUGINS_ROOT = os.path.join(_ADDON_ROOT, "plugins")
+
+# Resolve object types returned by API methods. Used only for labeling.
+_RETURN_TYPES = {
+    "GetProjectManager": "ProjectManager",
+    "GetMediaStorage": "MediaStorage",
+    "GetCurrentProject": "Project",
+    "LoadProject": "Project",
+    "CreateProject": "Project",
+    "GetMediaPool": "MediaPool",
+    "GetRootFolder": "Folder",
+    "GetCurrentFolder": "Folder",
+    "GetSubFolderList": "Folder",
+    "AddSubFolder": "Folder",
+    "GetCurrentTimeline": "Timeline",
+    "GetTimelineByIndex": "Timeline",
+    "CreateEmptyTimeline": "Timeline",
+    "ImportTimelineFromFile": "Timeline",
+    "GetItemListInTrack": "TimelineItem",
+    "GetItemsInTrack": "TimelineItem",
+    "AppendToTimeline": "TimelineItem",
+    "GetMediaPoolItem": "MediaPoolItem",
+    "GetClipList": "MediaPoolItem",
+    "ImportMedia": "MediaPoolItem",
+}
+_PRIMITIVE_TYPES = (str, bytes, int, float, bool)
+
+# Upper bounds (in milliseconds) of latency histogram buckets
+_HISTOGRAM_BUCKETS = (0.1, 0.5, 1, 5, 10, 50, 100, 500)
+
+
+class _MethodStats:
+    """Collected durations of a single Resolve method."""
+    __slots__ = ("durations", "total")
+
+    def __init__(self):
+        self.durations = []
+        self.total = 0.0
+
+    def add(self, duration):
+        self.durations.append(duration)
+        self.total += duration
+
+    def to_dict(self):
+        durations = sorted(self.durations)
+        histogram = collections.OrderedDict(
+            (f"<{bucket}ms", 0) for bucket in _HISTOGRAM_BUCKETS)
+        histogram[f">={_HISTOGRAM_BUCKETS[-1]}ms"] = 0
+        for duration in durations:
+            duration_ms = duration * 1000
+            for bucket in _HISTOGRAM_BUCKETS:
+                if duration_ms < bucket:
+                    histogram[f"<{bucket}ms"] += 1
+                    break
+            else:
+                histogram[f">={_HISTOGRAM_BUCKETS[-1]}ms"] += 1
+
+        return {
+            "count": len(durations),
+            "total_ms": self.total * 1000,
+            "p50_ms": _percentile(durations, 50) * 1000,
+            "p95_ms": _percentile(durations, 95) * 1000,
+            "max_ms": durations[-1] * 1000 if durations else 0.0,
+            "histogram": histogram,
+        }
+
+
+class ResolveApiTracer:
+    """Statistics of Resolve API calls grouped by caller."""
+
+    def __init__(self):
+        self._by_function = collections.defaultdict(
+            lambda: collections.defaultdict(_MethodStats))
+        self._by_plugin = collections.defaultdict(
+            lambda: collections.defaultdict(_MethodStats))
+
+    def record(self, method, duration, function, plugin=None):
+        """Record a single call of *method* taking *duration* seconds."""
+        self._by_function[function][method].add(duration)
+        if plugin:
+            self._by_plugin[plugin][method].add(duration)
+
+    def reset(self):
+        self._by_function.clear()
+        self._by_plugin.clear()
+
+    def get_report(self):
+        """Return collected statistics as JSON serializable dict.
+
+        Callers and methods are sorted by total time spent, slowest first.
+        """
+        function_report = _group_report(self._by_function)
+        return {
+            "calls": sum(group["calls"] for group in function_report.values()),
+            "total_ms": sum(
+                group["total_ms"] for group in function_report.values()),
+            "functions": function_report,
+            "plugins": _group_report(self._by_plugin),
+        }
+
+
+class ResolveObjectProxy:
+    """Transparent proxy timing every method call of a Resolve object."""
+    __slots__ = ("_traced_object", "_traced_type")
+
+    def __init__(self, obj, api_type="Object"):
+        object.__setattr__(self, "_traced_object", obj)
+        object.__setattr__(self, "_traced_type", api_type)
+
+    def __getattr__(self, name):
+        attr = getattr(self._traced_object, name)
+        if name.startswith("_") or not callable(attr):
+            return attr
+
+        method_name = f"{self._traced_type}.{name}"
+        return_type = _RETURN_TYPES.get(name, "Object")
+
+        def traced_method(*args, **kwargs):
+            args = _unwrap(args)
+            kwargs = _unwrap(kwargs)
+            start = time.perf_counter()
+            try:
+                return _wrap(attr(*args, **kwargs), return_type)
+            finally:
+                duration = time.perf_counter() - start
+                tracer = _TRACER
+                if tracer is not None:
+                    function, plugin = _get_callers()
+                    tracer.record(method_name, duration, function, plugin)
+
+        return traced_method
+
+    def __setattr__(self, name, value):
+        setattr(self._traced_object, name, value)
+
+    def __dir__(self):
+        return dir(self._traced_object)
+
+    def __eq__(self, other):
+        return self._traced_object == _unwrap(other)
+
+    def __ne__(self, other):
+        return not self.__eq__(other)
+
+    def __hash__(self):
+        return hash(self._traced_object)
+
+    def __bool__(self):
+        return bool(self._traced_object)
+
+    def __repr__(self):
+        return repr(self._traced_object)
+
+
+_TRACER = ResolveApiTracer() if os.getenv(TRACE_ENV_KEY) else None
+
+
+def is_enabled():
+    """Return whether Resolve API calls are traced."""
+    return _TRACER is not None
+
+
+def enable():
+    """Start tracing Resolve API calls.
+
+    Only objects handed out after this call are traced.
+    """
+    global _TRACER
+    if _TRACER is None:
+        _TRACER = ResolveApiTracer()
+
+
+def disable():
+    """Stop tracing Resolve API calls and drop collected statistics."""
+    global _TRACER
+    _TRACER = None
+
+
+def get_tracer():
+    """Return active tracer.
+
+    Returns:
+        Union[ResolveApiTracer, None]: Active tracer if tracing is enabled.
+    """
+    return _TRACER
+
+
+def trace(obj, api_type="Object"):
+    """Wrap Resolve object into tracing proxy if tracing is enabled.
+
+    Args:
+        obj (object): Resolve object.
+        api_type (Optional[str]): Resolve object type used in report labels.
+
+    Returns:
+        object: Proxy of the object, or the object itself.
+    """
+    if _TRACER is None:
+        return obj
+    return _wrap(obj, api_type)
+
+
+def dump_report(label, directory=None):
+    """Write collected statistics as JSON file and reset them.
+
+    Args:
+        label (str): Name of the traced operation, used in file name.
+        directory (Optional[str]): Output directory. Defaults to directory
+            set in `AYON_RESOLVE_API_TRACE` environment variable.
+
+    Returns:
+        Union[str, None]: Path to the report or None if nothing was written.
+    """
+    if _TRACER is None:
+        return None
+
+    directory = directory or os.getenv(TRACE_ENV_KEY)
+    if not directory:
+        return None
+
+    report = _TRACER.get_report()
+    _TRACER.reset()
+    report["label"] = label
+
+    os.makedirs(directory, exist_ok=True)
+    filepath = os.path.join(
+        directory,
+        "{}_{}.json".format(label, time.strftime("%Y%m%d-%H%M%S")),
+    )
+    with open(filepath, "w") as stream:
+        json.dump(report, stream, indent=4)
+
+    log.info(
+        f"Resolve API trace '{label}': {report['calls']} calls, "
+        f"{report['total_ms']:.1f}ms. Report: {filepath}"
+    )
+    return filepath
+
+
+def _percentile(sorted_values, percent):
+    """Nearest-rank percentile of already sorted values."""
+    if not sorted_values:
+        return 0.0
+    rank = max(int(round(percent / 100.0 * len(sorted_values))), 1)
+    return sorted_values[rank - 1]
+
+
+def _group_report(groups):
+    report = {}
+    for caller, methods in groups.items():
+        method_report = {
+            method: stats.to_dict()
+            for method, stats in methods.items()
+        }
+        report[caller] = {
+            "calls": sum(item["count"] for item in method_report.values()),
+            "total_ms": sum(
+                item["total_ms"] for item in method_report.values()),
+            "methods": dict(sorted(
+                method_report.items(),
+                key=lambda item: item[1]["total_ms"],
+                reverse=True,
+            )),
+        }
+    return dict(sorted(
+        report.items(), key=lambda item: item[1]["total_ms"], reverse=True))
+
+
+def _wrap(value, api_type):
+    if value is None or isinstance(value, _PRIMITIVE_TYPES):
+        return value
+    if isinstance(value, ResolveObjectProxy):
+        return value
+    if isinstance(value, list):
+        return [_wrap(item, api_type) for item in value]
+    if isinstance(value, tuple):
+        return tuple(_wrap(item, api_type) for item in value)
+    if isinstance(value, dict):
+        return {key: _wrap(item, api_type) for key, item in value.items()}
+    return ResolveObjectProxy(value, api_type)
+
+
+def _unwrap(value):
+    if isinstance(value, ResolveObjectProxy):
+        return value._traced_object
+    if isinstance(value, list):
+        return [_unwrap(item) for item in value]
+    if isinstance(value, tuple):
+        return tuple(_unwrap(item) for item in value)
+    if isinstance(value, dict):
+        return {key: _unwrap(item) for key, item in value.items()}
+    return value
+
+
+def _get_callers():
+    """Return innermost AYON function and outermost plugin of the call.
+
+    Returns:
+        tuple[str, Union[str, None]]: Function label as `module.function`
+            and plugin label as `PluginClass.method`.
+    """
+    function = None
+    plugin = None
+    frame = sys._getframe(2)
+    while frame is not None:
+        filename = frame.f_code.co_filename
+        if filename.startswith(_ADDON_ROOT) and filename != __file__:
+            if function is None:
+                function = "{}.{}".format(
+                    frame.f_globals.get("__name__"), frame.f_code.co_name)
+            if filename.startswith(_PLUGINS_ROOT):
+                instance = frame.f_locals.get("self")
+                if instance is not None:
+                    plugin = "{}.{}".format(
+                        type(instance).__name__, frame.f_code.co_name)
+        frame = frame.f_back
+    return function or "<unknown>", plugin
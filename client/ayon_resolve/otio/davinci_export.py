@@ -5,10 +5,10 @@ import os
 import re
 import json
 import opentimelineio as otio
-from . import utils
+from . import utils, track_cache
 import clique
 
-from ayon_resolve.api import lib
+from ayon_resolve.api import lib, operation_cache
 
 
 TRACK_TYPES = {
@@ -16,6 +16,9 @@ TRACK_TYPES = {
     "audio": otio.schema.TrackKind.Audio
 }
 
+# Name of operation cache with media references by media pool item id
+_REFERENCE_CACHE_NAME = "otio_media_references"
+
 
 def create_otio_rational_time(frame, fps):
     return otio.opentime.RationalTime(
@@ -35,9 +38,9 @@ def create_otio_reference(media_pool_item):
     metadata = _get_metadata_media_pool_item(media_pool_item)
     print("media pool item: {}".format(media_pool_item.GetName()))
 
-    _mp_clip_property = media_pool_item.GetClipProperty
+    clip_properties = lib.get_clip_properties(media_pool_item)
 
-    path = _mp_clip_property("File Path")
+    path = clip_properties.file_path
     reformat_path = utils.get_reformated_path(path, padded=True)
     padding = utils.get_padding_from_path(path)
 
@@ -48,19 +51,19 @@ def create_otio_reference(media_pool_item):
         })
 
     # get clip property regarding to type
-    fps = float(_mp_clip_property("FPS"))
-    if _mp_clip_property("Type") == "Video":
-        frame_start = int(_mp_clip_property("Start"))
-        frame_duration = int(_mp_clip_property("Frames"))
+    fps = clip_properties.fps
+    if clip_properties.clip_type == "Video":
+        frame_start = clip_properties.start
+        frame_duration = clip_properties.frames
     else:
-        audio_duration = str(_mp_clip_property("Duration"))
+        audio_duration = str(clip_properties.duration)
         frame_start = 0
         frame_duration = int(utils.timecode_to_frames(
             audio_duration, float(fps)))
 
     otio_ex_ref_item = None
     available_start = otio.opentime.from_timecode(
-        _mp_clip_property("Start TC"),
+        clip_properties.start_tc,
         fps
     )
 
@@ -104,6 +107,31 @@ def create_otio_reference(media_pool_item):
     return otio_ex_ref_item
 
 
+def get_otio_reference(media_pool_item):
+    """Return media reference of media pool item.
+
+    Reference is created once per media pool item within active operation
+    and each clip gets its own copy of it, so timelines with many cuts of
+    the same media read and parse the media only once.
+
+    Args:
+        media_pool_item (resolve.MediaPoolItem): Media of the clip.
+
+    Returns:
+        otio.schema.MediaReference: Media reference of the clip.
+    """
+    references = operation_cache.get_cache(_REFERENCE_CACHE_NAME)
+    if references is None:
+        return create_otio_reference(media_pool_item)
+
+    item_id = media_pool_item.GetUniqueId()
+    reference = references.get(item_id)
+    if reference is None:
+        reference = create_otio_reference(media_pool_item)
+        references[item_id] = reference
+    return reference.clone()
+
+
 def create_otio_markers(track_item, fps, clip):
     track_item_markers = track_item.GetMarkers()
     markers = []
@@ -132,12 +160,12 @@ def create_otio_markers(track_item, fps, clip):
 
 def create_otio_clip(track_item, fps=None):
     media_pool_item = track_item.GetMediaPoolItem()
-    _mp_clip_property = media_pool_item.GetClipProperty
+    clip_properties = lib.get_clip_properties(media_pool_item)
 
-    fps = fps or float(_mp_clip_property("FPS"))
+    fps = fps or clip_properties.fps
     name = track_item.GetName()
 
-    media_reference = create_otio_reference(media_pool_item)
+    media_reference = get_otio_reference(media_pool_item)
     available_start = media_reference.available_range.start_time
     conformed_start = available_start.value_rescaled_to(fps)
 
@@ -147,10 +175,9 @@ def create_otio_clip(track_item, fps=None):
         fps
     )
 
-    if _mp_clip_property("Type") == "Audio":
+    if clip_properties.clip_type == "Audio":
         return_clips = list()
-        audio_chanels = _mp_clip_property("Audio Ch")
-        for channel in range(0, int(audio_chanels)):
+        for channel in range(0, clip_properties.audio_channels):
             clip = otio.schema.Clip(
                 name=f"{name}_{channel}",
                 source_range=source_range,
@@ -207,7 +234,7 @@ def _get_timeline_metadata(project, timeline):
 def _get_metadata_media_pool_item(media_pool_item):
     data = dict()
     data.update({k: v for k, v in media_pool_item.GetMetadata().items()})
-    property = media_pool_item.GetClipProperty() or {}
+    property = lib.get_clip_properties(media_pool_item).properties
     for name, value in property.items():
         if "Resolution" in name and "" != value:
             print(f"property: {name} - {value}")
@@ -261,12 +288,20 @@ def add_otio_metadata(otio_item, media_pool_item, **kwargs):
         otio_item.metadata.update({key: value})
 
 
-def create_otio_timeline(resolve_project, timeline=None):
+def create_otio_timeline(
+    resolve_project, timeline=None, cache_dir=None, track_items=None
+):
     """Create otio timeline from resolve timeline
 
     Args:
         resolve_project (resolve.Project): resolve project
         timeline (resolve.Timeline, optional): resolve timeline. Defaults to None.
+        cache_dir (str, optional): directory of exported tracks cache of the
+            timeline, only tracks changed since the previous export are
+            exported again if provided. Defaults to None.
+        track_items (dict, optional): already listed items of all tracks by
+            track type and index, tracks are listed if not provided.
+            Defaults to None.
 
     Returns:
         otio.schema.Timeline: otio timeline
@@ -278,65 +313,110 @@ def create_otio_timeline(resolve_project, timeline=None):
         timeline.GetSetting("timelineFrameRate") or
         resolve_project.GetSetting("timelineFrameRate")
     )
+    cache = track_cache.TrackCache(cache_dir) if cache_dir else None
+
+    if track_items is None:
+        track_items = {}
+        # loop all defined track types
+        for track_type in list(TRACK_TYPES.keys()):
+            # get total track count
+            track_count = timeline.GetTrackCount(track_type)
+
+            # loop all tracks by track indexes
+            for track_index in range(1, int(track_count) + 1):
+                # get all track items in current track
+                track_items[(track_type, track_index)] = (
+                    timeline.GetItemListInTrack(track_type, track_index)
+                    or []
+                )
+
+    # media used by multiple clips is read only once
+    with operation_cache.operation_scope():
+        # convert timeline to otio
+        otio_timeline = _create_otio_timeline(
+            resolve_project, timeline, timeline_fps)
+
+        for (track_type, track_index), current_track_items in (
+            track_items.items()
+        ):
+            otio_tracks = None
+            if cache is not None:
+                fingerprint = track_cache.get_track_fingerprint(
+                    timeline, track_type, track_index,
+                    current_track_items, timeline_fps
+                )
+                otio_tracks = cache.get(
+                    track_type, track_index, fingerprint)
 
-    # convert timeline to otio
-    otio_timeline = _create_otio_timeline(
-        resolve_project, timeline, timeline_fps)
+            if otio_tracks is None:
+                otio_tracks = _create_otio_tracks(
+                    timeline, track_type, track_index,
+                    current_track_items, timeline_fps
+                )
+                if cache is not None:
+                    cache.set(
+                        track_type, track_index, fingerprint,
+                        otio_tracks
+                    )
 
-    # loop all defined track types
-    for track_type in list(TRACK_TYPES.keys()):
-        # get total track count
-        track_count = timeline.GetTrackCount(track_type)
+            # add tracks to otio timeline
+            for otio_track in otio_tracks:
+                otio_timeline.tracks.append(otio_track)
 
-        # loop all tracks by track indexes
-        for track_index in range(1, int(track_count) + 1):
-            # get current track name
-            track_name = timeline.GetTrackName(track_type, track_index)
+    return otio_timeline
 
-            # convert track to otio
-            otio_track = create_otio_track(
-                track_type, track_name)
 
-            # get all track items in current track
-            current_track_items = timeline.GetItemListInTrack(
-                track_type, track_index)
+def _create_otio_tracks(timeline, track_type, track_index, track_items, fps):
+    """Convert resolve track to otio tracks.
 
-            # loop available track items in current track items
-            for track_item in current_track_items:
-                # skip offline track items
-                if track_item.GetMediaPoolItem() is None:
-                    continue
+    Audio clips with multiple channels are split to multiple otio tracks.
 
-                # calculate real clip start
-                clip_start = track_item.GetStart() - timeline.GetStartFrame()
+    Returns:
+        list[otio.schema.Track]: otio tracks of the resolve track
+    """
+    otio_tracks = []
 
-                add_otio_gap(
-                    clip_start, otio_track, track_item, timeline)
+    # get current track name
+    track_name = timeline.GetTrackName(track_type, track_index)
 
-                # create otio clip and add it to track
-                otio_clip = create_otio_clip(track_item, fps=timeline_fps)
+    # convert track to otio
+    otio_track = create_otio_track(
+        track_type, track_name)
 
-                if not isinstance(otio_clip, list):
-                    otio_track.append(otio_clip)
-                else:
-                    for index, clip in enumerate(otio_clip):
-                        if index == 0:
-                            otio_track.append(clip)
-                        else:
-                            # add previous otio track to timeline
-                            otio_timeline.tracks.append(otio_track)
-                            # convert track to otio
-                            otio_track = create_otio_track(
-                                track_type, track_name)
-                            add_otio_gap(
-                                clip_start, otio_track,
-                                track_item, timeline)
-                            otio_track.append(clip)
-
-            # add track to otio timeline
-            otio_timeline.tracks.append(otio_track)
+    # loop available track items in current track items
+    for track_item in track_items:
+        # skip offline track items
+        if track_item.GetMediaPoolItem() is None:
+            continue
 
-    return otio_timeline
+        # calculate real clip start
+        clip_start = track_item.GetStart() - timeline.GetStartFrame()
+
+        add_otio_gap(
+            clip_start, otio_track, track_item, timeline)
+
+        # create otio clip and add it to track
+        otio_clip = create_otio_clip(track_item, fps=fps)
+
+        if not isinstance(otio_clip, list):
+            otio_track.append(otio_clip)
+        else:
+            for index, clip in enumerate(otio_clip):
+                if index == 0:
+                    otio_track.append(clip)
+                else:
+                    # add previous otio track to timeline
+                    otio_tracks.append(otio_track)
+                    # convert track to otio
+                    otio_track = create_otio_track(
+                        track_type, track_name)
+                    add_otio_gap(
+                        clip_start, otio_track,
+                        track_item, timeline)
+                    otio_track.append(clip)
+
+    otio_tracks.append(otio_track)
+    return otio_tracks
 
 
 def write_to_file(otio_timeline, path):
@@ -0,0 +1,125 @@
+"""
+Interval index of clips in OTIO timeline tracks.
+
+Finding OTIO clip of a Resolve timeline item means comparing range of every
+clip in the timeline with range of the item. `TimelineIntervalIndex` keeps
+clips of each track sorted by their start in parent track, so clips
+covering a time range are found with a binary search.
+"""
+import bisect
+
+import opentimelineio as otio
+
+# Range boundaries in seconds are compared with this tolerance to never
+# skip a clip which covers the range in frames
+_TOLERANCE = 1.0
+
+
+def _get_seconds_range(otio_range):
+    start = otio_range.start_time.to_seconds()
+    return start, start + otio_range.duration.to_seconds()
+
+
+def _get_frame_range(otio_range):
+    start = otio_range.start_time.to_frames()
+    return start, start + otio_range.duration.to_frames()
+
+
+def _is_covering(parent_range, otio_range):
+    """Return whether clip range covers the range in frames.
+
+    Same as strict `is_overlapping_otio_ranges` of ayon_core.
+    """
+    parent_start, parent_end = _get_frame_range(parent_range)
+    start, end = _get_frame_range(otio_range)
+    return parent_start <= start and parent_end >= end
+
+
+class TrackIntervalIndex:
+    """Clips of an OTIO track sorted by start in the track.
+
+    Args:
+        track (otio.schema.Track): Indexed track.
+    """
+
+    def __init__(self, track):
+        self.track = track
+        clips = []
+        for child in track:
+            if not isinstance(child, otio.schema.Clip):
+                continue
+            parent_range = child.range_in_parent()
+            start, end = _get_seconds_range(parent_range)
+            clips.append((start, end, child, parent_range))
+        clips.sort(key=lambda item: item[0])
+
+        self._starts = [item[0] for item in clips]
+        self._clips = [(item[2], item[3]) for item in clips]
+        # highest end of all clips up to the index, clips may overlap
+        self._max_ends = []
+        max_end = None
+        for item in clips:
+            max_end = item[1] if max_end is None else max(max_end, item[1])
+            self._max_ends.append(max_end)
+
+    def __len__(self):
+        return len(self._clips)
+
+    def iter_covering(self, otio_range, exact=False):
+        """Iterate clips which may cover the range, in order of start.
+
+        Candidates are found with tolerance, exact test is left on caller
+        unless `exact` is set.
+
+        Args:
+            otio_range (otio.opentime.TimeRange): Range in parent track.
+            exact (Optional[bool]): Yield only clips covering the range
+                in frames.
+
+        Yields:
+            tuple[otio.schema.Clip, otio.opentime.TimeRange]: Clip with its
+                range in parent track.
+        """
+        start, end = _get_seconds_range(otio_range)
+        position = bisect.bisect_right(self._starts, start + _TOLERANCE)
+        # highest ends never decrease, clips before the first one with high
+        # enough end can't cover the range
+        first = bisect.bisect_left(self._max_ends, end - _TOLERANCE)
+        for index in range(first, position):
+            otio_clip, parent_range = self._clips[index]
+            if exact and not _is_covering(parent_range, otio_range):
+                continue
+            yield otio_clip, parent_range
+
+
+class TimelineIntervalIndex:
+    """Interval indexes of all tracks of an OTIO timeline.
+
+    Args:
+        otio_timeline (otio.schema.Timeline): Indexed timeline.
+    """
+
+    def __init__(self, otio_timeline):
+        self.otio_timeline = otio_timeline
+        self.tracks = [
+            TrackIntervalIndex(track) for track in otio_timeline.tracks
+        ]
+
+    def iter_covering(self, otio_range, track_name=None, exact=False):
+        """Iterate clips which may cover the range, track by track.
+
+        Args:
+            otio_range (otio.opentime.TimeRange): Range in parent track.
+            track_name (Optional[str]): Search only tracks with the name.
+            exact (Optional[bool]): Yield only clips covering the range
+                in frames.
+
+        Yields:
+            tuple[otio.schema.Clip, otio.opentime.TimeRange]: Clip with its
+                range in parent track.
+        """
+        for track_index in self.tracks:
+            if track_name is not None and track_index.track.name != track_name:
+                continue
+            yield from track_index.iter_covering(otio_range, exact=exact)
+
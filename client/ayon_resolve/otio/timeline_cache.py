@@ -0,0 +1,91 @@
+"""
+Cache of OTIO timelines exported by AYON exporter within an operation.
+
+AYON exporter used by Resolve older than 18.5 reads every clip of the
+timeline, so exporting the same timeline twice in one operation (see
+`operation_cache.operation_scope`) is expensive. Within an operation the
+project is edited only by AYON, so cached timelines are guarded just by
+a fingerprint of cheap timeline-level reads: frame range, track counts,
+item counts per track and marker count. Cached timelines are dropped
+when the operation ends or AYON changes clip properties, unchanged
+tracks are reused across operations by `track_cache`.
+
+Native export of Resolve 18.5+ is a single call and is not cached.
+"""
+from ayon_resolve.api import operation_cache
+
+from . import track_cache
+
+# Name of operation cache with exported timelines by timeline unique id
+_CACHE_NAME = "otio_timelines"
+
+
+def get_timeline_fingerprint(timeline):
+    """Return fingerprint of timeline from timeline-level reads only.
+
+    Args:
+        timeline (resolve.Timeline): Resolve timeline.
+
+    Returns:
+        tuple[str, dict[tuple[str, int], list[resolve.TimelineItem]]]:
+            Fingerprint of the timeline and items of each track by track
+            type and index, so the tracks don't have to be listed again
+            by the exporter.
+    """
+    track_items_by_track = {}
+    for track_type in ("video", "audio"):
+        track_count = int(timeline.GetTrackCount(track_type) or 0)
+        for track_index in range(1, track_count + 1):
+            track_items_by_track[(track_type, track_index)] = (
+                timeline.GetItemListInTrack(track_type, track_index) or [])
+
+    fingerprint = track_cache.hash_data([
+        timeline.GetStartFrame(),
+        timeline.GetEndFrame(),
+        len(timeline.GetMarkers() or {}),
+        [
+            [track_type, track_index, len(track_items)]
+            for (track_type, track_index), track_items
+            in track_items_by_track.items()
+        ],
+    ])
+    return fingerprint, track_items_by_track
+
+
+def get(timeline_id, fingerprint):
+    """Return copy of OTIO timeline cached within active operation.
+
+    Args:
+        timeline_id (str): Unique id of Resolve timeline.
+        fingerprint (str): Current fingerprint of the timeline.
+
+    Returns:
+        Union[otio.schema.Timeline, None]: OTIO timeline if cached with
+            the same fingerprint.
+    """
+    cache = operation_cache.get_cache(_CACHE_NAME)
+    entry = cache.get(timeline_id) if cache else None
+    if entry is None or entry[0] != fingerprint:
+        return None
+    return entry[1].clone()
+
+
+def add(timeline_id, fingerprint, otio_timeline):
+    """Cache exported OTIO timeline for the rest of active operation.
+
+    Nothing is cached outside of an operation.
+
+    Args:
+        timeline_id (str): Unique id of Resolve timeline.
+        fingerprint (str): Fingerprint of the timeline.
+        otio_timeline (otio.schema.Timeline): Exported timeline, a copy
+            is cached.
+    """
+    cache = operation_cache.get_cache(_CACHE_NAME)
+    if cache is not None:
+        cache[timeline_id] = (fingerprint, otio_timeline.clone())
+
+
+def clear():
+    """Drop all cached timelines."""
+    operation_cache.invalidate(_CACHE_NAME)
@@ -0,0 +1,165 @@
+"""
+Disk cache of OTIO tracks exported by AYON OTIO exporter.
+
+Exporting a track reads media and markers of every clip on it. Publishing
+exports the current timeline on every run although usually only a few
+shots changed since the last one. `TrackCache` stores exported tracks of a
+timeline on disk together with fingerprint of the Resolve track they were
+created from, so unchanged tracks are read back instead of exported again.
+"""
+import os
+import json
+import hashlib
+
+import opentimelineio as otio
+
+from ayon_resolve.api import lib, operation_cache
+
+# Cache format version, stored tracks are dropped when it changes
+CACHE_VERSION = 2
+
+# Name of operation cache with media fingerprints by media pool item id
+_MEDIA_CACHE_NAME = "otio_media_fingerprints"
+
+
+def hash_data(data):
+    """Return hash of JSON serializable data."""
+    return hashlib.sha1(
+        json.dumps(data, sort_keys=True, default=str).encode("utf-8")
+    ).hexdigest()
+
+
+def get_media_fingerprint(media_pool_item):
+    """Return fingerprint of media used by a clip.
+
+    Fingerprint changes when the clip is relinked or its metadata or clip
+    properties, which the media reference is created from, change. It is
+    computed once per media pool item within active operation.
+
+    Args:
+        media_pool_item (Union[resolve.MediaPoolItem, None]): Media of
+            the clip.
+
+    Returns:
+        Union[str, None]: Fingerprint of the media, None for offline clip.
+    """
+    if not media_pool_item:
+        return None
+
+    item_id = media_pool_item.GetUniqueId()
+    fingerprints = operation_cache.get_cache(_MEDIA_CACHE_NAME)
+    if fingerprints is not None and item_id in fingerprints:
+        return fingerprints[item_id]
+
+    fingerprint = hash_data([
+        item_id,
+        media_pool_item.GetMetadata() or {},
+        lib.get_clip_properties(media_pool_item).properties,
+    ])
+    if fingerprints is not None:
+        fingerprints[item_id] = fingerprint
+    return fingerprint
+
+
+def get_track_fingerprint(timeline, track_type, track_index, track_items,
+                          fps):
+    """Return fingerprint of Resolve track.
+
+    Fingerprint changes when clips are added, removed, trimmed or moved,
+    when their markers change or when their media changes.
+
+    Args:
+        timeline (resolve.Timeline): Timeline of the track.
+        track_type (str): Type of the track, "video" or "audio".
+        track_index (int): Index of the track.
+        track_items (list[resolve.TimelineItem]): Items of the track.
+        fps (float): Frame rate of exported timeline.
+
+    Returns:
+        str: Fingerprint of the track.
+    """
+    items_data = []
+    for track_item in track_items:
+        items_data.append([
+            track_item.GetUniqueId(),
+            track_item.GetName(),
+            track_item.GetStart(),
+            track_item.GetEnd(),
+            track_item.GetLeftOffset(),
+            track_item.GetRightOffset(),
+            hash_data(track_item.GetMarkers() or {}),
+            get_media_fingerprint(track_item.GetMediaPoolItem()),
+        ])
+
+    return hash_data([
+        CACHE_VERSION,
+        track_type,
+        track_index,
+        timeline.GetTrackName(track_type, track_index),
+        timeline.GetStartFrame(),
+        fps,
+        items_data,
+    ])
+
+
+class TrackCache:
+    """Exported OTIO tracks of a timeline stored in a directory.
+
+    Args:
+        cache_dir (str): Directory of cached tracks of the timeline.
+    """
+
+    def __init__(self, cache_dir):
+        self.cache_dir = cache_dir
+
+    def _get_path(self, track_type, track_index):
+        return os.path.join(
+            self.cache_dir, f"{track_type}_{track_index}.otio")
+
+    def get(self, track_type, track_index, fingerprint):
+        """Return cached OTIO tracks of Resolve track.
+
+        Args:
+            track_type (str): Type of the track, "video" or "audio".
+            track_index (int): Index of the track.
+            fingerprint (str): Current fingerprint of the track.
+
+        Returns:
+            Union[list[otio.schema.Track], None]: OTIO tracks if cached
+                with the same fingerprint.
+        """
+        path = self._get_path(track_type, track_index)
+        if not os.path.exists(path):
+            return None
+
+        try:
+            collection = otio.adapters.read_from_file(
+                path, adapter_name="otio_json")
+        except Exception:
+            return None
+
+        if collection.metadata.get("fingerprint") != fingerprint:
+            return None
+        return list(collection)
+
+    def set(self, track_type, track_index, fingerprint, otio_tracks):
+        """Store OTIO tracks exported from Resolve track.
+
+        Args:
+            track_type (str): Type of the track, "video" or "audio".
+            track_index (int): Index of the track.
+            fingerprint (str): Fingerprint of the track.
+            otio_tracks (list[otio.schema.Track]): Exported tracks.
+        """
+        os.makedirs(self.cache_dir, exist_ok=True)
+        collection = otio.schema.SerializableCollection(
+            children=[otio_track.clone() for otio_track in otio_tracks],
+            metadata={"fingerprint": fingerprint},
+        )
+        path = self._get_path(track_type, track_index)
+        # write to temporary file first so interrupted write never leaves
+        # truncated cache behind
+        temp_path = f"{path}.tmp"
+        otio.adapters.write_to_file(
+            collection, temp_path, adapter_name="otio_json")
+        os.replace(temp_path, path)
@@ -98,27 +98,67 @@ def unwrap_resolve_otio_marker(marker):
     return marker
 
 
-def get_marker_from_clip_index(otio_timeline, clip_index):
-    """
+def get_clip_index_map(otio_timeline):
+    """Index clips of otio timeline by clip index of their AYON marker.
+
     Args:
         otio_timeline (otio.Timeline): The otio timeline to inspect
-        clip_index (int): The clip index metadata to retrieve.
 
     Returns:
-        tuple(otio.Clip, otio.Marker): The associated clip and marker
-            or (None, None)
+        dict[str, tuple(otio.Clip, otio.Marker)]: The associated clip and
+            marker by clip index metadata, first clip wins.
     """
     try:  # opentimelineio >= 0.16.0
         all_clips = otio_timeline.find_clips()
     except AttributeError:  # legacy
         all_clips = otio_timeline.each_clip()
 
-    # Retrieve otioClip from parent context otioTimeline
-    # See collect_current_project
+    clip_index_map = {}
     for otio_clip in all_clips:
         for marker in otio_clip.markers:
             marker = unwrap_resolve_otio_marker(marker)
-            if marker.metadata.get("clip_index") == clip_index:
-                return  otio_clip, marker
+            clip_index = marker.metadata.get("clip_index")
+            if clip_index is not None:
+                clip_index_map.setdefault(clip_index, (otio_clip, marker))
+
+    return clip_index_map
+
+
+def get_marker_from_clip_index(
+    otio_timeline,
+    clip_index,
+    clip_index_map=None,
+    interval_index=None,
+    otio_range=None,
+):
+    """
+    Args:
+        otio_timeline (otio.Timeline): The otio timeline to inspect
+        clip_index (int): The clip index metadata to retrieve.
+        clip_index_map (Optional[dict]): Already built result of
+            `get_clip_index_map` for the otio timeline.
+        interval_index (Optional[TimelineIntervalIndex]): Interval index
+            of the otio timeline clips.
+        otio_range (Optional[otio.opentime.TimeRange]): Range of the
+            timeline item in its track. Clip covering the range is used
+            when provided with the interval index, copied clips share
+            the clip index of the original.
 
-    return None, None
+    Returns:
+        tuple(otio.Clip, otio.Marker): The associated clip and marker
+            or (None, None)
+    """
+    # Retrieve otioClip from parent context otioTimeline
+    # See collect_current_project
+    if clip_index_map is None:
+        clip_index_map = get_clip_index_map(otio_timeline)
+
+    if interval_index is not None and otio_range is not None:
+        # markers are already unwrapped by `get_clip_index_map`
+        for otio_clip, _parent_range in interval_index.iter_covering(
+                otio_range, exact=True):
+            for marker in otio_clip.markers:
+                if marker.metadata.get("clip_index") == clip_index:
+                    return otio_clip, marker
+
+    return clip_index_map.get(clip_index, (None, None))
@@ -2,7 +2,7 @@ from __future__ import annotations
 
 import copy
 
-from ayon_resolve.api import lib, constants
+from ayon_resolve.api import lib, constants, operation_cache, tracing
 from ayon_resolve.api.plugin import (
     HiddenResolvePublishCreator,
     ResolveCreator,
@@ -141,7 +141,9 @@ class _ResolveInstanceClipCreator(HiddenResolvePublishCreator):
         """
         for created_inst, _changes in update_list:
             track_item = created_inst.transient_data["track_item"]
-            tag_data = lib.get_timeline_item_ayon_tag(track_item)
+            item_id = track_item.GetUniqueId()
+            tag_data = lib.get_timeline_item_ayon_tag(
+                track_item, item_id=item_id)
 
             try:
                 instances_data = tag_data[_CONTENT_ID]
@@ -152,7 +154,7 @@ class _ResolveInstanceClipCreator(HiddenResolvePublishCreator):
                 instances_data = tag_data[_CONTENT_ID]
 
             instances_data[self.identifier] = created_inst.data_to_store()
-            lib.imprint(track_item, tag_data)
+            lib.imprint(track_item, tag_data, item_id=item_id)
 
     def remove_instances(self, instances):
         """Remove instance marker from track item.
@@ -163,20 +165,22 @@ class _ResolveInstanceClipCreator(HiddenResolvePublishCreator):
         """
         for instance in instances:
             track_item = instance.transient_data["track_item"]
-            tag_data = lib.get_timeline_item_ayon_tag(track_item)
+            item_id = track_item.GetUniqueId()
+            tag_data = lib.get_timeline_item_ayon_tag(
+                track_item, item_id=item_id)
             instances_data = tag_data.get(_CONTENT_ID, {})
             instances_data.pop(self.identifier, None)
             self._remove_instance_from_context(instance)
 
             # Remove markers if deleted all of the instances
             if not instances_data:
-                track_item.DeleteMarkersByColor(constants.AYON_MARKER_COLOR)
+                lib.delete_ayon_markers(track_item, item_id=item_id)
                 if track_item.GetClipColor() != constants.SELECTED_CLIP_COLOR:
                     track_item.ClearClipColor()
 
             # Push edited data in marker
             else:
-                lib.imprint(track_item, tag_data)
+                lib.imprint(track_item, tag_data, item_id=item_id)
 
 
 class ResolveShotInstanceCreator(_ResolveInstanceClipCreator):
@@ -536,6 +540,16 @@ OTIO file.
         )
 
     def create(self, product_name, instance_data, pre_create_data):
+        try:
+            # share single timeline walk between selection and audio lookups
+            with operation_cache.operation_scope():
+                return self._create_publishable_clips(
+                    product_name, instance_data, pre_create_data)
+        finally:
+            tracing.dump_report("create_shot_clip")
+
+    def _create_publishable_clips(
+            self, product_name, instance_data, pre_create_data):
         super().create(
             product_name,
             instance_data,
@@ -618,7 +632,8 @@ OTIO file.
 
             # Compute and store resolution metadata from mediapool clip.
             resolution_data = lib.get_clip_resolution_from_media_pool(track_item_data)
-            item_unique_id = track_item_data["clip"]["item"].GetUniqueId()
+            item_record = track_item_data["clip"]["record"]
+            item_unique_id = item_record.unique_id
             segment_data = copy.deepcopy(instance_data)
 
             segment_data.update({
@@ -649,7 +664,8 @@ OTIO file.
             )
 
             # Delete any existing instances previously generated for the clip.
-            prev_tag_data = lib.get_timeline_item_ayon_tag(track_item)
+            prev_tag_data = lib.get_timeline_item_ayon_tag(
+                track_item, item_id=item_unique_id)
             if prev_tag_data:
                 for creator_id, inst_data in prev_tag_data.get(_CONTENT_ID, {}).items():
                     creator = self.create_context.creators[creator_id]
@@ -659,6 +675,12 @@ OTIO file.
                         if inst_id == inst_data["instance_id"]
                     ]
                     creator.remove_instances(prev_instances)
+                # removed instances imprinted or deleted the marker
+                lib.invalidate_ayon_markers(item_unique_id)
+
+            # Read the tag once, all changes are written at once at the end.
+            tag_transaction = lib.AyonTagTransaction(
+                track_item, item_id=item_unique_id)
 
             # Create new product(s) instances.
             clip_instances = {}
@@ -688,7 +710,7 @@ OTIO file.
 
                 # Shot creation
                 if creator_id == shot_creator_id:
-                    track_item_duration = track_item.GetDuration()
+                    track_item_duration = item_record.duration
                     workfileFrameStart = \
                         sub_instance_data["workfileFrameStart"]
                     sub_instance_data.update(
@@ -707,11 +729,11 @@ OTIO file.
                         "frameStart": workfileFrameStart,
                         "frameEnd": (workfileFrameStart +
                             track_item_duration),
-                        "clipIn": track_item.GetStart(),
-                        "clipOut": track_item.GetEnd(),
+                        "clipIn": item_record.start,
+                        "clipOut": item_record.end,
                         "clipDuration": track_item_duration,
-                        "sourceIn": track_item.GetLeftOffset(),
-                        "sourceOut": (track_item.GetLeftOffset() +
+                        "sourceIn": item_record.left_offset,
+                        "sourceOut": (item_record.left_offset +
                             track_item_duration),
                         "useSourceResolution": sub_instance_data["sourceResolution"],
                     })
@@ -772,25 +794,25 @@ OTIO file.
             # insert clip unique ID and created instances
             # data as track_item metadata, to retrieve those
             # during collections and publishing phases
-            lib.imprint(
-                track_item,
-                data={
-                    _CONTENT_ID: clip_instances,
-                    "clip_index": item_unique_id,
-                },
-            )
+            tag_transaction.update({
+                _CONTENT_ID: clip_instances,
+                "clip_index": item_unique_id,
+                "publish": True,
+            })
+            tag_transaction.commit()
             track_item.SetClipColor(constants.PUBLISH_CLIP_COLOR)
             instances.extend(list(clip_instances.values()))
 
         return instances
 
     def _create_and_add_instance(self, data, creator_id,
-            timeline_item, instances):
+            item_record, instances):
         """
         Args:
             data (dict): The data to re-recreate the instance from.
             creator_id (str): The creator id to use.
-            timeline_item (obj): The associated timeline item.
+            item_record (timeline_snapshot.TimelineItemRecord): Snapshot
+                record of the associated timeline item.
             instances (list): Result instance container.
 
         Returns:
@@ -800,7 +822,7 @@ OTIO file.
         creator = self.create_context.creators[creator_id]
 
         if creator_id == ResolveShotInstanceCreator.identifier:
-            track_item_duration = timeline_item.GetDuration()
+            track_item_duration = item_record.duration
             workfileFrameStart = data["workfileFrameStart"]
             creator_attributes = {
                 "workfileFrameStart": workfileFrameStart,
@@ -809,32 +831,34 @@ OTIO file.
                 "frameStart": workfileFrameStart,
                 "frameEnd": (workfileFrameStart +
                     track_item_duration),
-                "clipIn": timeline_item.GetStart(),
-                "clipOut": timeline_item.GetEnd(),
+                "clipIn": item_record.start,
+                "clipOut": item_record.end,
                 "clipDuration": track_item_duration,
-                "sourceIn": timeline_item.GetLeftOffset(),
-                "sourceOut": (timeline_item.GetLeftOffset() +
+                "sourceIn": item_record.left_offset,
+                "sourceOut": (item_record.left_offset +
                     track_item_duration),
                 "useSourceResolution": data["sourceResolution"],
             }
             data["creator_attributes"] = creator_attributes
 
         instance = creator.create(data)
-        instance.transient_data["track_item"] = timeline_item
+        instance.transient_data["track_item"] = item_record.item
         self._add_instance_to_context(instance)
         instances.append(instance)
         return instance
 
-    def _handle_legacy_marker(self, tag_data, timeline_item, instances):
+    def _handle_legacy_marker(self, tag_data, item_record, instances):
         """ Convert OpenPypeData to AYON data.
 
         Args:
             tag_data (dict): The legacy marker data.
-            timline_item (obj): The associated Resolve item.
+            item_record (timeline_snapshot.TimelineItemRecord): Snapshot
+                record of the associated Resolve item.
             instances (list): Result instance container.
         """
+        timeline_item = item_record.item
+        item_unique_id = item_record.unique_id
         clip_instances = {}
-        item_unique_id = timeline_item.GetUniqueId()
         tag_data.update({
             "task": self.create_context.get_current_task_name(),
             "clip_index": item_unique_id,
@@ -844,7 +868,7 @@ OTIO file.
         creator_id = ResolveShotInstanceCreator.identifier
         shot_data = tag_data.copy()
         inst = self._create_and_add_instance(
-            shot_data, creator_id, timeline_item, instances)
+            shot_data, creator_id, item_record, instances)
         clip_instances[creator_id] = inst.data_to_store()
 
         # create children plate
@@ -858,45 +882,55 @@ OTIO file.
             }
         })
         inst = self._create_and_add_instance(
-            plate_data, creator_id, timeline_item, instances)
+            plate_data, creator_id, item_record, instances)
         clip_instances[creator_id] = inst.data_to_store()
 
         # Update marker with new version data.
-        timeline_item.DeleteMarkersByColor(constants.AYON_MARKER_COLOR)
+        lib.delete_ayon_markers(timeline_item, item_id=item_unique_id)
         lib.imprint(
             timeline_item,
             data={
                 _CONTENT_ID: clip_instances,
                 "clip_index": item_unique_id,
             },
+            item_id=item_unique_id,
         )
 
     def collect_instances(self):
         """Collect all created instances from current timeline."""
-        all_timeline_items = lib.get_current_timeline_items()
+        # legacy and AYON markers of an item are read with single call
+        with operation_cache.operation_scope():
+            return self._collect_instances()
+
+    def _collect_instances(self):
+        all_timeline_items = lib.get_current_timeline_items(
+            snapshot=self.get_timeline_snapshot())
         instances = []
         for timeline_item_data in all_timeline_items:
             timeline_item = timeline_item_data["clip"]["item"]
+            item_record = timeline_item_data["clip"]["record"]
+            item_unique_id = item_record.unique_id
 
             # get (legacy) openpype tag data
             # Backwards compatible (Deprecated since 24/09/05)
             tag_data = lib.get_ayon_marker(
                 timeline_item,
-                tag_name=constants.LEGACY_OPENPYPE_MARKER_NAME
+                tag_name=constants.LEGACY_OPENPYPE_MARKER_NAME,
+                item_id=item_unique_id,
             )
             if tag_data:
-                self._handle_legacy_marker(
-                    tag_data, timeline_item, instances)
+                self._handle_legacy_marker(tag_data, item_record, instances)
                 continue
 
             # get AyonData tag data
-            tag_data = lib.get_timeline_item_ayon_tag(timeline_item)
+            tag_data = lib.get_timeline_item_ayon_tag(
+                timeline_item, item_id=item_unique_id)
             if not tag_data:
                 continue
 
             for creator_id, data in tag_data.get(_CONTENT_ID, {}).items():
                 self._create_and_add_instance(
-                        data, creator_id, timeline_item, instances)
+                        data, creator_id, item_record, instances)
 
         return instances
 
@@ -1,9 +1,11 @@
 import ayon_api
 
+from ayon_core.pipeline import ProductLoaderPlugin
 from ayon_resolve.api import lib, plugin
 from ayon_resolve.api.pipeline import (
     containerise,
     update_container,
+    unregister_container,
 )
 from ayon_core.lib.transcoding import (
     VIDEO_EXTENSIONS,
@@ -48,6 +50,11 @@ class LoadClip(plugin.TimelineItemLoader):
 
         timeline_item = plugin.ClipLoader(
             self, context, **options).load(files)
+        return self.containerise_item(
+            timeline_item, context, name, namespace)
+
+    def containerise_item(self, timeline_item, context, name, namespace=None):
+        """Color loaded timeline item and containerise it"""
         namespace = namespace or timeline_item.GetName()
 
         # update color of clip regarding the version order
@@ -152,6 +159,7 @@ class LoadClip(plugin.TimelineItemLoader):
     def remove(self, container):
         timeline_item = container["_timeline_item"]
         media_pool_item = timeline_item.GetMediaPoolItem()
+        unregister_container(timeline_item.GetUniqueId())
         timeline = lib.get_current_timeline()
 
         # DeleteClips function was added in Resolve 18.5+
@@ -159,17 +167,64 @@ class LoadClip(plugin.TimelineItemLoader):
         # function exists in Resolve
         if timeline.DeleteClips is not None:
             timeline.DeleteClips([timeline_item])
+            usage_index = lib.get_clip_usage_index(build=False)
+            if usage_index is not None:
+                usage_index.remove_timeline_item(
+                    media_pool_item, timeline_item)
         else:
             # Resolve versions older than 18.5 can't delete clips via API
             # so all we can do is just remove the ayon marker to 'untag' it
-            if lib.get_ayon_marker(timeline_item):
-                # Note: We must call `get_ayon_marker` because
-                # `delete_ayon_marker` uses a global variable set by
-                # `get_ayon_marker` to delete the right marker
-                # TODO: Improve code to avoid the global `temp_marker_frame`
-                lib.delete_ayon_marker(timeline_item)
+            lib.delete_ayon_marker(timeline_item)
 
         # if media pool item has no remaining usages left
         # remove it from the media pool
         if int(media_pool_item.GetClipProperty("Usage")) == 0:
             lib.remove_media_pool_item(media_pool_item)
+
+
+class LoadClipProducts(ProductLoaderPlugin):
+    """Load selected products to timeline as clips at once.
+
+    Clips of all selected products are appended to the timeline with
+    single call, see `plugin.ClipLoader.load_batch`. The standard
+    "Load as clip" action is called by the loader once per representation.
+
+    One representation of each product is loaded, see
+    `plugin.get_product_representation_contexts`.
+    """
+
+    is_multiple_contexts_compatible = True
+
+    product_base_types = LoadClip.product_base_types
+    product_types = LoadClip.product_types
+    representations = {"*"}
+
+    label = "Load as clips (selected products)"
+    order = -9
+    icon = "code-fork"
+    color = "orange"
+
+    options = LoadClip.options
+
+    def load(self, contexts, name=None, namespace=None, options=None):
+        options = options or {}
+        repre_contexts = plugin.get_product_representation_contexts(
+            contexts, LoadClip.extensions, log=self.log)
+        if not repre_contexts:
+            return
+
+        clip_loader = LoadClip()
+        loaders_files = [
+            (
+                plugin.ClipLoader(clip_loader, context, **options),
+                plugin.get_representation_files(
+                    context["project"]["name"],
+                    context["representation"]
+                ),
+            )
+            for context in repre_contexts
+        ]
+        timeline_items = plugin.ClipLoader.load_batch(loaders_files)
+        for context, timeline_item in zip(repre_contexts, timeline_items):
+            clip_loader.containerise_item(
+                timeline_item, context, context["product"]["name"])
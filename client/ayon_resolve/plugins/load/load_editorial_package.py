@@ -57,6 +57,9 @@ class LoadEditorialPackage(load.LoaderPlugin):
 
         # import timeline from otio file
         timeline = media_pool.ImportTimelineFromFile(files, import_options)
+        # index the imported timeline, so it is not seen as a change made
+        # outside of AYON
+        lib.get_media_pool_index().update_folder(loaded_bin)
 
         # get timeline media pool item for metadata update
         timeline_media_pool_item = lib.get_timeline_media_pool_item(
@@ -1,7 +1,7 @@
 import json
 import contextlib
 from pathlib import Path
-from collections import defaultdict
+from collections import OrderedDict, defaultdict
 from typing import Union, List, Optional, TypedDict, Tuple
 
 from ayon_api import version_is_latest
@@ -10,8 +10,8 @@ from ayon_core.pipeline.colorspace import get_remapped_colorspace_to_native
 from ayon_core.pipeline import (
     Anatomy,
     LoaderPlugin,
+    ProductLoaderPlugin,
     get_representation_path,
-    registered_host
 )
 from ayon_core.pipeline.load import get_representation_path_with_anatomy
 from ayon_core.lib.transcoding import (
@@ -19,8 +19,15 @@ from ayon_core.lib.transcoding import (
     IMAGE_EXTENSIONS
 )
 from ayon_core.lib import BoolDef
-from ayon_resolve.api import lib, constants
-from ayon_resolve.api.pipeline import AVALON_CONTAINER_ID
+from ayon_resolve.api import lib, constants, plugin
+from ayon_resolve.api import container_registry
+from ayon_resolve.api.media_pool_index import get_media_path_keys
+from ayon_resolve.api.pipeline import (
+    AVALON_CONTAINER_ID,
+    get_container_registry,
+    register_media_pool_container,
+    unregister_container,
+)
 
 
 FRAME_SPLITTER = "__frame_splitter__"
@@ -84,7 +91,10 @@ def set_colorspace(media_pool_item,
         bool: Whether applying the colorspace succeeded.
     """
     with project_color_science_mode(mode=mode):
-        return media_pool_item.SetClipProperty("Input Color Space", colorspace)
+        result = media_pool_item.SetClipProperty(
+            "Input Color Space", colorspace)
+    lib.invalidate_clip_properties(media_pool_item)
+    return result
 
 
 def find_clip_usage(media_pool_item, project=None):
@@ -102,37 +112,20 @@ def find_clip_usage(media_pool_item, project=None):
             the timeline item.
 
     """
-    usage = int(media_pool_item.GetClipProperty("Usage"))
-    if not usage:
-        return []
-
-    if project is None:
-        project = lib.get_current_resolve_project()
-
-    matching_items = []
-    unique_id = media_pool_item.GetUniqueId()
-    for timeline_idx in range(project.GetTimelineCount()):
-        timeline = project.GetTimelineByIndex(timeline_idx + 1)
+    # Project timelines are walked once and kept indexed, so removing
+    # many containers does not walk them for each container
+    return lib.get_clip_usage(media_pool_item, project=project)
 
-        # Consider audio and video tracks
-        for track_type in ["video", "audio"]:
-            for track_idx in range(timeline.GetTrackCount(track_type)):
-                timeline_items = timeline.GetItemListInTrack(track_type,
-                                                             track_idx + 1)
-                for timeline_item in timeline_items:
-                    timeline_item_mpi = timeline_item.GetMediaPoolItem()
-                    if not timeline_item_mpi:
-                        continue
 
-                    if timeline_item_mpi.GetUniqueId() == unique_id:
-                        matching_items.append((timeline, timeline_item))
-                        usage -= 1
-                        if usage <= 0:
-                            # If there should be no usage left after this found
-                            # entry we return early
-                            return matching_items
+class MediaLoadRequest:
+    """Representation to be loaded by `LoadMedia.load_batch`."""
+    __slots__ = ("context", "is_sequence", "file_info", "item")
 
-    return matching_items
+    def __init__(self, context, is_sequence, file_info):
+        self.context = context
+        self.is_sequence = is_sequence
+        self.file_info = file_info
+        self.item = None
 
 
 class LoadMedia(LoaderPlugin):
@@ -193,93 +186,233 @@ class LoadMedia(LoaderPlugin):
         cls._host_imageio_settings = project_settings["resolve"]["imageio"]
 
     def load(self, context, name, namespace, options):
+        self.load_batch([context], options)
+
+    def load_batch(self, contexts, options=None):
+        """Load multiple representations at once.
+
+        Bins are created once, media of each bin are imported with single
+        `ImportMedia` call and color science mode is switched once for
+        setting colorspace of all imported media.
+
+        Media which failed to import are reported after all other media
+        were colored and added to the timeline.
+
+        Args:
+            contexts (list[dict]): Representation contexts.
+            options (Optional[dict]): Loader options.
+
+        Returns:
+            list[resolve.MediaPoolItem]: Media pool items in order of
+                the contexts.
+
+        Raises:
+            RuntimeError: If any media failed to import.
+        """
+        options = options or {}
 
         # For loading multiselection, we store timeline before first load
         # because the current timeline can change with the imported media.
         if self.timeline is None:
             self.timeline = lib.get_current_timeline()
 
-        representation = context["representation"]
-        self._project_name = context["project"]["name"]
+        self._project_name = contexts[0]["project"]["name"]
+        anatomy = Anatomy(self._project_name)
 
         project = lib.get_current_resolve_project()
         media_pool = project.GetMediaPool()
 
-        # Allow to use an existing media pool item and re-use it
-        item = None
-        if options.get("load_once", True):
-            host = registered_host()
-            repre_id = context["representation"]["id"]
-            for container in host.ls():
-                if container["representation"] != repre_id:
-                    continue
-
-                if container["loader"] != self.__class__.__name__:
-                    continue
-
-                print(f"Re-using existing container: {container}")
-                item = container["_item"]
+        requests = []
+        for context in contexts:
+            # Resolve API: ImportMedia function requires a list of
+            # dictionaries with keys "FilePath", "StartIndex" and "EndIndex"
+            # for sequences but only string with absolute path for single
+            # files.
+            is_sequence, file_info = self._get_file_info(context, anatomy)
+            request = MediaLoadRequest(context, is_sequence, file_info)
+
+            # Allow to use an existing media pool item and re-use it
+            if options.get("load_once", True):
+                request.item = self._get_loaded_item(
+                    context, file_info["FilePath"])
+            requests.append(request)
+
+        imported, failed = self._import_media_to_bins(
+            media_pool,
+            [request for request in requests if request.item is None],
+        )
+        self._set_colorspaces(imported)
 
-        if item is None:
-            item = self._import_media_to_bin(context, media_pool, representation)
-        # Always update clip color - even if re-using existing clip
-        color = self.get_item_color(context)
-        item.SetClipColor(color)
+        # continue with the media which were imported or re-used
+        requests = [request for request in requests if request.item]
+        for request in requests:
+            # Always update clip color - even if re-using existing clip
+            color = self.get_item_color(request.context)
+            request.item.SetClipColor(color)
 
         if options.get("load_to_timeline", True):
             timeline = options.get("timeline", self.timeline)
             if timeline:
                 # Add media to active timeline
-                lib.create_timeline_item(
-                    media_pool_item=item,
-                    timeline=timeline
+                lib.create_timeline_items(
+                    [
+                        {"media_pool_item": request.item}
+                        for request in requests
+                    ],
+                    timeline=timeline,
                 )
 
-    def _import_media_to_bin(
-        self, context, media_pool, representation
-    ):
-        """Import media to Resolve Media Pool.
+        if failed:
+            raise RuntimeError(f"Failed to import media: {failed}")
+        return [request.item for request in requests]
 
-        Also create a bin if `media_pool_bin_path` is set.
+    def _get_loaded_item(self, context, filepath):
+        """Return media pool item already loaded from the representation.
 
         Args:
             context (dict): The context dictionary.
-            media_pool (resolve.MediaPool): The Resolve Media Pool.
-            representation (dict): The representation data.
+            filepath (str): The representation file path used for import.
 
         Returns:
-            resolve.MediaPoolItem: The imported media pool item.
+            Union[resolve.MediaPoolItem, None]: The loaded media pool item.
         """
-        # Create or set the bin folder, we add it in there
-        # If bin path is not set we just add into the current active bin
-        if self.media_pool_bin_path:
-            media_pool_bin_path = StringTemplate(
-                self.media_pool_bin_path).format_strict(context)
-
-            folder = lib.create_bin(
-                # double slashes will create unconnected folders
-                name=media_pool_bin_path.replace("//", "/"),
-                root=media_pool.GetRootFolder(),
-                set_as_current=False
-            )
-            media_pool.SetCurrentFolder(folder)
-
-        # Import media
-        # Resolve API: ImportMedia function requires a list of dictionaries
-        # with keys "FilePath", "StartIndex" and "EndIndex" for sequences
-        # but only string with absolute path for single files.
-        is_sequence, file_info = self._get_file_info(context)
-        items = (
-            media_pool.ImportMedia([file_info])
-            if is_sequence
-            else media_pool.ImportMedia([file_info["FilePath"]])
-        )
-        assert len(items) == 1, "Must import only one media item"
+        registry = get_container_registry()
+        if registry.is_built(container_registry.MEDIA_POOL):
+            for container in registry.get_by_representation(
+                context["representation"]["id"],
+                loader=self.__class__.__name__,
+            ):
+                item = container["_item"]
+                if item.GetMediaId():
+                    self.log.info(
+                        "Re-using existing media pool item: "
+                        f"{container['objectName']}"
+                    )
+                    return item
+            return None
+
+        item = lib.get_media_pool_index().get_by_path(filepath)
+        if item is None:
+            return None
+
+        data = item.GetMetadata(constants.AYON_TAG_NAME)
+        if not data:
+            return None
 
-        result = items[0]
+        try:
+            data = json.loads(data)
+        except json.JSONDecodeError:
+            return None
 
-        self._set_metadata(result, context)
-        self._set_colorspace_from_representation(result, representation)
+        # There might be cases where clip's metadata are having additional
+        # 'load' and 'publish' data.
+        data = data.get("load") or data
+        if (
+            data.get("representation") != context["representation"]["id"]
+            or data.get("loader") != self.__class__.__name__
+        ):
+            return None
+
+        self.log.info(f"Re-using existing media pool item: {item.GetName()}")
+        return item
+
+    def _import_media_to_bins(self, media_pool, requests):
+        """Import media to Resolve Media Pool.
+
+        Also create a bin if `media_pool_bin_path` is set. Media of each
+        bin are imported with single call.
+
+        Args:
+            media_pool (resolve.MediaPool): The Resolve Media Pool.
+            requests (list[MediaLoadRequest]): Requests without media pool
+                item, the imported item is set on them.
+
+        Returns:
+            tuple[list[MediaLoadRequest], list[str]]: Requests with newly
+                imported items and file paths which failed to import.
+        """
+        # Group requests by bin and by import type, single files and
+        # sequences can't be mixed in one `ImportMedia` call.
+        requests_by_bin = OrderedDict()
+        for request in requests:
+            bin_path = self._get_bin_path(request.context)
+            requests_by_bin.setdefault(
+                (bin_path, request.is_sequence), []).append(request)
+
+        media_pool_index = lib.get_media_pool_index()
+        folders_by_path = {}
+        imported = []
+        failed = []
+        for (bin_path, is_sequence), bin_requests in requests_by_bin.items():
+            # Create or set the bin folder, we add it in there
+            # If bin path is not set we just add into the current active bin
+            folder = None
+            if bin_path:
+                folder = folders_by_path.get(bin_path)
+                if folder is None:
+                    folder = lib.create_bin(
+                        name=bin_path,
+                        set_as_current=False
+                    )
+                    folders_by_path[bin_path] = folder
+                media_pool.SetCurrentFolder(folder)
+            else:
+                folder = media_pool.GetCurrentFolder()
+
+            # Same media requested multiple times is imported only once
+            requests_by_path = OrderedDict()
+            for request in bin_requests:
+                requests_by_path.setdefault(
+                    request.file_info["FilePath"], []).append(request)
+
+            # Import media
+            items = media_pool.ImportMedia([
+                path_requests[0].file_info if is_sequence else filepath
+                for filepath, path_requests in requests_by_path.items()
+            ]) or []
+            media_pool_index.add(items, folder)
+
+            # Match imported items by their "File Path" clip property, failed
+            # imports are left out of the result
+            items_by_path_key = {}
+            for item in items:
+                record = media_pool_index.get_record(item)
+                if record is None:
+                    continue
+                for key in record.path_keys:
+                    items_by_path_key.setdefault(key, item)
+
+            for filepath, path_requests in requests_by_path.items():
+                item = next(
+                    (
+                        items_by_path_key[key]
+                        for key in get_media_path_keys(filepath)
+                        if key in items_by_path_key
+                    ),
+                    None
+                )
+                if item is None:
+                    failed.append(filepath)
+                    continue
+                for request in path_requests:
+                    request.item = item
+                    self._imprint_imported_item(item, request.context)
+                    imported.append(request)
+
+        return imported, failed
+
+    def _get_bin_path(self, context):
+        """Return media pool bin path of the context or None if not set."""
+        if not self.media_pool_bin_path:
+            return None
+        # double slashes will create unconnected folders
+        return StringTemplate(
+            self.media_pool_bin_path
+        ).format_strict(context).replace("//", "/")
+
+    def _imprint_imported_item(self, item, context):
+        """Set metadata and container data to newly imported item."""
+        self._set_metadata(item, context)
 
         data = self._get_container_data(context)
 
@@ -290,13 +423,23 @@ class LoadMedia(LoaderPlugin):
             "loader": str(self.__class__.__name__),
         })
 
-        result.SetMetadata(constants.AYON_TAG_NAME, json.dumps(data))
-
-        return result
+        item.SetMetadata(constants.AYON_TAG_NAME, json.dumps(data))
+        register_media_pool_container(
+            item, data, record=lib.get_media_pool_index().get_record(item))
 
     def switch(self, container, context):
         self.update(container, context)
 
+        # Switched item is moved to the bin of the new context
+        bin_path = self._get_bin_path(context)
+        if not bin_path:
+            return
+        item = container["_item"]
+        folder = lib.create_bin(name=bin_path, set_as_current=False)
+        record = lib.get_media_pool_index().get_record(item)
+        if record and record.folder_id != folder.GetUniqueId():
+            lib.move_media_pool_items([item], folder)
+
     def update(self, container, context):
         # Update MediaPoolItem filepath and metadata
         item = container["_item"]
@@ -316,11 +459,15 @@ class LoadMedia(LoaderPlugin):
             raise RuntimeError(
                 f"Failed to replace media pool item clip to filepath: {path}"
             )
+        media_pool_index = lib.get_media_pool_index()
+        media_pool_index.update(item)
 
         # Update the metadata
         update_data = self._get_container_data(context)
         data.update(update_data)
         item.SetMetadata(constants.AYON_TAG_NAME, json.dumps(data))
+        register_media_pool_container(
+            item, data, record=media_pool_index.get_record(item))
 
         self._set_metadata(media_pool_item=item, context=context)
         self._set_colorspace_from_representation(
@@ -347,7 +494,6 @@ class LoadMedia(LoaderPlugin):
     def remove(self, container):
         # Remove MediaPoolItem entry
         project = lib.get_current_resolve_project()
-        media_pool = project.GetMediaPool()
         item = container["_item"]
 
         # Delete any usages of the media pool item so there's no trail
@@ -371,7 +517,8 @@ class LoadMedia(LoaderPlugin):
                 timeline.DeleteClips(timeline_items)
 
         # Delete the media pool item
-        media_pool.DeleteClips([item])
+        unregister_container(container["name"])
+        lib.remove_media_pool_item(item)
 
     def _get_container_data(self, context: dict) -> dict:
         """Return metadata related to the representation and version."""
@@ -428,6 +575,7 @@ class LoadMedia(LoaderPlugin):
                 clip_property,
                 value_formatted
             )
+            lib.invalidate_clip_properties(media_pool_item)
             if not is_set:
                 # Allow to set metadata instead of clip property using the same
                 # configuration in settings.
@@ -439,11 +587,15 @@ class LoadMedia(LoaderPlugin):
                         f" '{clip_property}': '{value_formatted}'"
                     )
 
-    def _get_file_info(self, context: dict) -> Tuple[bool, Union[str, dict]]:
+    def _get_file_info(
+        self, context: dict, anatomy: Optional[Anatomy] = None
+    ) -> Tuple[bool, Union[str, dict]]:
         """Return file info for Resolve ImportMedia.
 
         Args:
             context (dict): The context dictionary.
+            anatomy (Optional[Anatomy]): Project anatomy, created if not
+                provided.
 
         Returns:
             Tuple[bool, Union[str, dict]]: A tuple of whether the file is a
@@ -451,7 +603,8 @@ class LoadMedia(LoaderPlugin):
         """
 
         representation = context["representation"]
-        anatomy = Anatomy(self._project_name)
+        if anatomy is None:
+            anatomy = Anatomy(self._project_name)
 
         # Get path to representation with correct frame number
         repre_path = get_representation_path_with_anatomy(
@@ -537,6 +690,34 @@ class LoadMedia(LoaderPlugin):
                 "Ignoring colorspace."
             )
 
+    def _set_colorspaces(self, requests):
+        """Set the colorspace for media pool items of load requests.
+
+        Project color science mode is switched only once for all items.
+
+        Args:
+            requests (list[MediaLoadRequest]): Requests with imported items.
+        """
+        colorspaces = []
+        for request in requests:
+            colorspace = self._get_colorspace(
+                request.context["representation"])
+            if colorspace:
+                colorspaces.append((request.item, colorspace))
+
+        if not colorspaces:
+            return
+
+        with project_color_science_mode():
+            for media_pool_item, colorspace in colorspaces:
+                result = media_pool_item.SetClipProperty(
+                    "Input Color Space", colorspace)
+                lib.invalidate_clip_properties(media_pool_item)
+                if not result:
+                    self.log.warning(
+                        f"Failed to apply colorspace: {colorspace}."
+                    )
+
     def _set_colorspace_from_representation(
             self, media_pool_item, representation: dict):
         """Set the colorspace for the media pool item.
@@ -553,3 +734,35 @@ class LoadMedia(LoaderPlugin):
                 self.log.warning(
                     f"Failed to apply colorspace: {colorspace}."
                 )
+
+
+class LoadMediaProducts(ProductLoaderPlugin):
+    """Load selected products as media pool items at once.
+
+    Representations of all selected products are loaded by
+    `LoadMedia.load_batch`, so bins are created and media imported once
+    for the whole selection. The standard "Load media" action is called by
+    the loader once per representation and can't batch the import.
+
+    One representation of each product is loaded, see
+    `plugin.get_product_representation_contexts`.
+    """
+
+    is_multiple_contexts_compatible = True
+
+    product_base_types = LoadMedia.product_base_types
+    product_types = LoadMedia.product_types
+    representations = ["*"]
+
+    label = "Load media (selected products)"
+    order = -19
+    icon = "code-fork"
+    color = "orange"
+
+    options = LoadMedia.options
+
+    def load(self, contexts, name=None, namespace=None, options=None):
+        repre_contexts = plugin.get_product_representation_contexts(
+            contexts, LoadMedia.extensions, log=self.log)
+        if repre_contexts:
+            LoadMedia().load_batch(repre_contexts, options)
@@ -2,6 +2,7 @@ import pprint
 import pyblish
 
 from ayon_core.pipeline import PublishError
+from ayon_resolve.api import lib
 from ayon_resolve.otio import utils
 
 
@@ -19,9 +20,17 @@ class CollectShotAudio(pyblish.api.InstancePlugin):
         Args:
             instance (pyblish.Instance): The shot instance to update.
         """
-        otio_timeline = instance.context.data["otioTimeline"]
+        context = instance.context
+        track_item = instance.data["transientData"]["track_item"]
+        otio_timeline = context.data["otioTimeline"]
         otio_clip, marker = utils.get_marker_from_clip_index(
-            otio_timeline, instance.data["clip_index"]
+            otio_timeline,
+            instance.data["clip_index"],
+            context.data.get("otioClipIndexMap"),
+            interval_index=context.data.get("otioIntervalIndex"),
+            otio_range=lib.create_otio_time_range_from_timeline_item(
+                track_item, context.data["activeTimeline"], context.data["fps"]
+            ),
         )
         if not otio_clip:
             raise PublishError(
@@ -3,6 +3,7 @@ import pyblish.api
 from ayon_core.pipeline import registered_host
 
 from ayon_resolve import api
+from ayon_resolve.otio import utils
 
 
 class CollectResolveProject(pyblish.api.ContextPlugin):
@@ -29,7 +30,11 @@ class CollectResolveProject(pyblish.api.ContextPlugin):
             "activeProject": resolve_project,
             "currentFile": current_file,
             # timeline
+            "activeTimeline": timeline,
             "otioTimeline": otio_timeline,
+            "otioClipIndexMap": utils.get_clip_index_map(otio_timeline),
+            # shared by all lookups of otio clips by timeline item range
+            "otioIntervalIndex": api.get_otio_interval_index(otio_timeline),
             "videoTracks": video_tracks,
             "fps": fps,
         })
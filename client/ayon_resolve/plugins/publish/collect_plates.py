@@ -2,6 +2,7 @@ import pyblish.api
 
 from ayon_core.pipeline import PublishError
 
+from ayon_resolve.api import lib
 from ayon_resolve.otio import utils
 
 
@@ -22,9 +23,16 @@ class CollectPlate(pyblish.api.InstancePlugin):
         track_item = instance.data["transientData"]["track_item"]
         instance.data["timelineItem"] = track_item
 
-        otio_timeline = instance.context.data["otioTimeline"]
+        context = instance.context
+        otio_timeline = context.data["otioTimeline"]
         otio_clip, marker = utils.get_marker_from_clip_index(
-            otio_timeline, instance.data["clip_index"]
+            otio_timeline,
+            instance.data["clip_index"],
+            context.data.get("otioClipIndexMap"),
+            interval_index=context.data.get("otioIntervalIndex"),
+            otio_range=lib.create_otio_time_range_from_timeline_item(
+                track_item, context.data["activeTimeline"], context.data["fps"]
+            ),
         )
         if not otio_clip:
             raise PublishError(
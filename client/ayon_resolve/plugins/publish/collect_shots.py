@@ -72,9 +72,16 @@ class CollectShot(pyblish.api.InstancePlugin):
         })
 
         # Adjust instance data from parent otio timeline.
-        otio_timeline = instance.context.data["otioTimeline"]
+        context = instance.context
+        otio_timeline = context.data["otioTimeline"]
         otio_clip, marker = utils.get_marker_from_clip_index(
-            otio_timeline, instance.data["clip_index"]
+            otio_timeline,
+            instance.data["clip_index"],
+            context.data.get("otioClipIndexMap"),
+            interval_index=context.data.get("otioIntervalIndex"),
+            otio_range=lib.create_otio_time_range_from_timeline_item(
+                track_item, context.data["activeTimeline"], context.data["fps"]
+            ),
         )
         if not otio_clip:
             raise PublishError("Could not retrieve otioClip for shot %r", instance)
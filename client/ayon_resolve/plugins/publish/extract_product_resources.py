@@ -6,17 +6,18 @@ import pyblish.api
 from ayon_core.lib import StringTemplate, filter_profiles
 from ayon_core.pipeline import Anatomy, get_current_project_name, publish
 from ayon_core.pipeline.context_tools import get_current_task_entity
-from ayon_resolve.api import rendering
+from ayon_resolve.api import render_presets, rendering
 from ayon_resolve.api.lib import (
+    get_current_resolve_project,
     maintain_current_timeline,
-    maintain_page_by_name,
+    page_session,
+    timeline_switch_session,
 )
+from ayon_resolve.api.render_presets import get_preset_file
 from ayon_resolve.api.rendering import (
-    modify_preset_file,
-    render_clip_to_intermediate_file,
+    ClipRenderRequest,
+    render_clips,
     render_timeline_intermediate_file,
-    set_format_and_codec,
-    set_render_preset_from_file,
 )
 from ayon_resolve.utils import RESOLVE_ADDON_ROOT
 
@@ -45,6 +46,9 @@ class ExtractProductResources(
 
     # settings
     profiles = []
+    # seconds, 0 to wait for rendering without limit
+    render_timeout = 0
+    render_stall_timeout = 600
 
     def process(self, instance):
         instance.data.setdefault("representations", [])
@@ -56,14 +60,22 @@ class ExtractProductResources(
         # set rendering logger to inherit from publisher's logger
         rendering.log = self.log
 
-        if product_base_type == "editorial_pkg":
-            self._process_editorial_pkg(instance, settings, preset_path)
-        elif product_base_type == "plate":
-            self._process_plate(instance, settings, preset_path)
-        else:
-            self.log.warning(
-                "ExtractProductResources: unhandled product base type '%s', skipping.", product_base_type
-            )
+        try:
+            # timeline and page are restored once after the render, also
+            # on error
+            with timeline_switch_session(), page_session():
+                if product_base_type == "editorial_pkg":
+                    self._process_editorial_pkg(
+                        instance, settings, preset_path)
+                elif product_base_type == "plate":
+                    self._process_plate(instance, settings, preset_path)
+                else:
+                    self.log.warning(
+                        "ExtractProductResources: unhandled product base type '%s', skipping.", product_base_type
+                    )
+        finally:
+            # remove render presets imported for the render from Resolve
+            render_presets.cleanup(get_current_resolve_project())
 
     def get_settings(self, instance):
         """Return normalised render settings for *instance*.
@@ -103,6 +115,13 @@ class ExtractProductResources(
         self.log.debug(f"Matched preset: {profile.get('name')}")
         return self._normalize_preset(profile, product_base_type)
 
+    def get_render_monitor_options(self):
+        """Return options of `RenderMonitor` waiting for render jobs."""
+        return {
+            "timeout": self.render_timeout,
+            "stall_timeout": self.render_stall_timeout,
+        }
+
     def _normalize_preset(self, preset, product_base_type):
         """Flatten the nested preset structure into a render-ready dict."""
         sub = preset.get(product_base_type, {})
@@ -237,6 +256,7 @@ class ExtractProductResources(
                 preset_path,
                 settings["file_format"],
                 settings["codec"],
+                **self.get_render_monitor_options()
             )
 
         self.log.debug("Rendered output: %s", rendered)
@@ -280,8 +300,12 @@ class ExtractProductResources(
             f"{os.path.join(staging_dir, rendered.name)}"
         )
 
-    def _process_plate(self, instance, settings, preset_path):
-        """Render a single TimelineItem's frame range on the active timeline."""
+    def plan_plate_render(self, instance, settings, preset_path):
+        """Plan render of a single TimelineItem's frame range.
+
+        Returns:
+            dict: Render request with representation frame range.
+        """
         timeline_item = instance.data.get("timelineItem")
         if timeline_item is None:
             raise RuntimeError(
@@ -323,31 +347,47 @@ class ExtractProductResources(
             repre_frame_start = frame_start
             repre_frame_end = frame_start + clip_duration - 1
 
-        # Modify preset file
-        modified_preset_path = modify_preset_file(
-            preset_path,
-            Path(self.staging_dir(instance)),
-            preset_data,
-        )
+        # Modified preset is shared by plates with the same overrides
+        modified_preset_path = get_preset_file(preset_path, preset_data)
         self.log.info("Modified preset path: %s", modified_preset_path)
 
-        with maintain_page_by_name("Deliver"):
-            if not set_render_preset_from_file(modified_preset_path.as_posix()):
-                raise RuntimeError(
-                    f"Unable to load render preset: {modified_preset_path}"
-                )
+        return {
+            "request": ClipRenderRequest(
+                timeline_item,
+                staging_dir,
+                modified_preset_path,
+                settings["file_format"],
+                settings["codec"],
+            ),
+            "frameStart": repre_frame_start,
+            "frameEnd": repre_frame_end,
+        }
 
-            format_ext = set_format_and_codec(
-                settings["file_format"], settings["codec"]
-            )
-            if not format_ext:
-                raise RuntimeError(
-                    f"Unable to set render format '{settings['file_format']}' "
-                    f"/ codec '{settings['codec']}'."
-                )
-            rendered = render_clip_to_intermediate_file(
-                timeline_item, staging_dir
-            )
+    def _process_plate(self, instance, settings, preset_path):
+        """Render a single TimelineItem's frame range on the active timeline.
+
+        Plates are usually rendered together by `ExtractPlatesRenderQueue`,
+        the plate is rendered alone only if it was not planned.
+        """
+        plan = instance.data.get("plateRenderPlan")
+        if plan is None:
+            plan = self.plan_plate_render(instance, settings, preset_path)
+            # plates are rendered from the timeline they were collected on
+            with maintain_current_timeline(
+                instance.context.data["activeTimeline"]
+            ):
+                render_clips(
+                    [plan["request"]], **self.get_render_monitor_options())
+
+        request = plan["request"]
+        if request.error or request.rendered is None:
+            raise RuntimeError(
+                f"Plate render failed: {request.error or 'not rendered'}")
+
+        staging_dir = request.target_render_directory
+        rendered = request.rendered
+        repre_frame_start = plan["frameStart"]
+        repre_frame_end = plan["frameEnd"]
 
         representation = {
             "name":       settings["name"],
@@ -383,3 +423,63 @@ class ExtractProductResources(
         self.log.debug(f"Representation: {pformat(representation)}")
         instance.data["representations"].append(representation)
         self.log.info("Added clip intermediate representation: %s", staging_dir)
+
+
+class ExtractPlatesRenderQueue(pyblish.api.ContextPlugin):
+    """Render all plates of the publish in a single render queue.
+
+    Renders of all plate instances are planned with settings of
+    `ExtractProductResources` and rendered together, so Resolve starts the
+    render queue once per video track instead of once per plate.
+    `ExtractProductResources` then only turns the rendered files into
+    representations.
+    """
+
+    label = "Extract Plates Render Queue"
+    order = ExtractProductResources.order - 0.01
+    hosts = ["resolve"]
+    families = ["clip"]
+
+    def process(self, context):
+        extractor = ExtractProductResources()
+        extractor.log = self.log
+        # set rendering logger to inherit from publisher's logger
+        rendering.log = self.log
+
+        requests = []
+        for instance in context:
+            if not instance.data.get("publish", True):
+                continue
+            if instance.data.get("productBaseType") != "plate":
+                continue
+
+            try:
+                settings = extractor.get_settings(instance)
+                preset_path = Path(
+                    extractor.resolve_preset_path(settings["preset_path"]))
+                plan = extractor.plan_plate_render(
+                    instance, settings, preset_path)
+            except Exception:
+                # the plate is planned again and reports the error
+                # when processed by `ExtractProductResources`
+                self.log.warning(
+                    "Failed to plan render of %s.", instance, exc_info=True)
+                continue
+            instance.data["plateRenderPlan"] = plan
+            requests.append(plan["request"])
+
+        if not requests:
+            return
+
+        self.log.info("Rendering %d plates.", len(requests))
+        # plates are rendered from the timeline they were collected on
+        try:
+            with timeline_switch_session(), page_session():
+                timeline = context.data["activeTimeline"]
+                with maintain_current_timeline(timeline):
+                    render_clips(
+                        requests, **extractor.get_render_monitor_options())
+        finally:
+            # remove render presets imported for the render from Resolve
+            render_presets.cleanup(get_current_resolve_project())
+
@@ -0,0 +1,23 @@
+import pyblish.api
+
+from ayon_resolve.api import tracing
+
+
+class IntegrateResolveApiTraceReport(pyblish.api.ContextPlugin):
+    """Write report of traced Resolve API calls made during publishing.
+
+    Only active when `AYON_RESOLVE_API_TRACE` environment variable is set.
+    """
+
+    label = "Resolve API Trace Report"
+    order = pyblish.api.IntegratorOrder + 0.499
+    hosts = ["resolve"]
+
+    def process(self, context):
+        if not tracing.is_enabled():
+            self.log.debug("Resolve API tracing is disabled.")
+            return
+
+        report_path = tracing.dump_report("publish")
+        if report_path:
+            self.log.info(f"Resolve API trace report: {report_path}")
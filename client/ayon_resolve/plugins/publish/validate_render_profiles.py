@@ -0,0 +1,82 @@
+import pyblish.api
+from ayon_core.lib import filter_profiles
+from ayon_core.pipeline import PublishValidationError
+from ayon_core.pipeline.context_tools import get_current_task_entity
+from ayon_resolve.api import render_capabilities
+from ayon_resolve.api.lib import get_current_resolve_project
+
+
+class ValidateRenderProfiles(pyblish.api.ContextPlugin):
+    """Validate render formats and codecs of product resources profiles.
+
+    All profiles of `ExtractProductResources` settings are checked against
+    render formats and codecs available in Resolve before any rendering
+    starts. Invalid profiles used by published instances fail the
+    validation, other invalid profiles are only reported.
+    """
+
+    label = "Validate Render Profiles"
+    order = pyblish.api.ValidatorOrder
+    hosts = ["resolve"]
+    families = ["editorial_pkg", "clip"]
+
+    def process(self, context):
+        profiles = (
+            context.data["project_settings"]["resolve"]["publish"]
+            ["ExtractProductResources"]["profiles"]
+        )
+        if not profiles:
+            return
+
+        project = get_current_resolve_project()
+        errors_by_name = {}
+        for profile in profiles:
+            error = self._get_error(project, profile)
+            if error:
+                errors_by_name[profile["name"]] = error
+                self.log.warning(
+                    f"Render profile '{profile['name']}' is invalid: {error}")
+
+        if not errors_by_name:
+            return
+
+        # profiles are matched the same way as by `ExtractProductResources`
+        task_entity = get_current_task_entity() or {}
+        errors = []
+        for instance in context:
+            if not instance.data.get("publish", True):
+                continue
+            product_base_type = instance.data.get("productBaseType")
+            if product_base_type not in {"editorial_pkg", "plate"}:
+                continue
+
+            profile = filter_profiles(
+                profiles,
+                {
+                    "task_types": task_entity.get("taskType"),
+                    "task_names": task_entity.get("taskName"),
+                    "product_base_type": product_base_type,
+                },
+            )
+            if profile and profile["name"] in errors_by_name:
+                errors.append(
+                    f"{instance}: {errors_by_name[profile['name']]}")
+
+        if errors:
+            raise PublishValidationError(
+                "Invalid render settings:\n" + "\n".join(errors),
+                title="Invalid render profiles",
+            )
+
+    @staticmethod
+    def _get_error(project, profile):
+        """Return error of format and codec of the profile or None."""
+        product_settings = profile.get(profile["product_base_type"]) or {}
+        preset = product_settings.get(
+            product_settings.get("preset_type")) or {}
+        try:
+            render_capabilities.get_format_and_codec_values(
+                project, preset.get("format"), preset.get("codec"))
+        except ValueError as exc:
+            return str(exc)
+        return None
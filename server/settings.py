@@ -331,6 +331,22 @@ class ProductResourcesPresetModel(BaseSettingsModel):
 class ExtractProductResourcesModel(BaseSettingsModel):
     """Extract Product Resources.
     """
+    render_timeout: int = SettingsField(
+        0,
+        title="Render timeout",
+        description=(
+            "Seconds after which rendering is stopped and the publish "
+            "fails. Set to 0 to wait without limit."
+        )
+    )
+    render_stall_timeout: int = SettingsField(
+        600,
+        title="Render stall timeout",
+        description=(
+            "Seconds without any render progress after which rendering is "
+            "stopped and the publish fails. Set to 0 to wait without limit."
+        )
+    )
     profiles: list[ProductResourcesPresetModel] = SettingsField(
         default_factory=list,
         title="Profiles",
@@ -538,6 +554,8 @@ DEFAULT_VALUES = {
     },
     "publish": {
         "ExtractProductResources": {
+            "render_timeout": 0,
+            "render_stall_timeout": 600,
             "profiles": [
                 {
                     "name": "timeline_reviewable",
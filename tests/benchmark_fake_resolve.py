@@ -0,0 +1,63 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+"""Benchmark AYON Resolve hot paths against the in-process fake Resolve.
+
+Example:
+    python benchmark_fake_resolve.py --shots 3000 --latency 0.0002
+"""
+import time
+import argparse
+
+from ayon_core.lib import Logger
+
+import fake_resolve
+
+log = Logger.get_logger(__name__)
+
+
+def _measure(resolve, label, func):
+    resolve.reset_call_counts()
+    start = time.perf_counter()
+    result = func()
+    elapsed = time.perf_counter() - start
+    log.info(
+        f"{label:<32} {elapsed:>8.3f}s {resolve.call_count:>9} calls"
+    )
+    return result
+
+
+def main(shot_count, video_tracks, latency):
+    resolve = fake_resolve.FakeResolve()
+    fake_resolve.create_conform_project(
+        resolve, shot_count=shot_count, video_tracks=video_tracks)
+    fake_resolve.install_fake_resolve(resolve)
+    resolve.latency = latency
+
+    # import after the fake Resolve is installed
+    from ayon_resolve.api import lib, pipeline
+    from ayon_resolve.otio import davinci_export
+
+    log.info(
+        f"Fake conform project: {shot_count} shots, {video_tracks} video "
+        f"tracks, {latency * 1000:.3f}ms per call"
+    )
+    _measure(resolve, "get_current_timeline_items", lambda: len(
+        lib.get_current_timeline_items()))
+    _measure(resolve, "ls", lambda: len(list(pipeline.ls())))
+    _measure(resolve, "iter_all_media_pool_clips", lambda: len(
+        list(lib.iter_all_media_pool_clips())))
+    _measure(resolve, "create_otio_timeline", lambda: (
+        davinci_export.create_otio_timeline(
+            lib.get_current_resolve_project())))
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--shots", type=int, default=3000)
+    parser.add_argument("--video-tracks", type=int, default=1)
+    parser.add_argument(
+        "--latency", type=float, default=0.0,
+        help="Seconds added to every Resolve API call.")
+    args = parser.parse_args()
+
+    main(args.shots, args.video_tracks, args.latency)
@@ -0,0 +1,27 @@
+import os
+import sys
+
+import pytest
+
+# client code is not installed as a package in development environment
+sys.path.insert(
+    0,
+    os.path.join(os.path.dirname(os.path.dirname(__file__)), "client")
+)
+
+import fake_resolve  # noqa: E402
+
+
+@pytest.fixture
+def resolve():
+    """Fake Resolve with small conform project installed as `api.bmdvr`."""
+    resolve = fake_resolve.FakeResolve()
+    fake_resolve.create_conform_project(
+        resolve, shot_count=6, shots_per_bin=3)
+    return fake_resolve.install_fake_resolve(resolve)
+
+
+@pytest.fixture
+def project(resolve):
+    """Current project of the fake Resolve."""
+    return resolve.GetProjectManager().GetCurrentProject()
@@ -0,0 +1,1179 @@
+"""
+In-process stand-in for the DaVinci Resolve scripting API.
+
+The objects in this module mimic the subset of the Resolve object model
+(Resolve, ProjectManager, Project, MediaPool, Folder, Timeline, TimelineItem
+and MediaPoolItem) which is used by AYON, so the hot paths of
+`ayon_resolve.api` can be executed and benchmarked without a running Resolve.
+
+Every public (CamelCase) method is counted and can be delayed by a fixed
+latency to mimic the fusionscript round trip of the real API.
+
+Example:
+    >>> import fake_resolve
+    >>> resolve = fake_resolve.FakeResolve(latency=0.0002)
+    >>> fake_resolve.create_conform_project(resolve, shot_count=3000)
+    >>> fake_resolve.install_fake_resolve(resolve)
+    >>> resolve.reset_call_counts()
+    >>> items = get_current_timeline_items()
+    >>> print(resolve.call_count)
+"""
+import os
+import json
+import time
+import uuid
+import functools
+import itertools
+import collections
+
+
+# AYON marker defaults, kept in sync with `ayon_resolve.api.constants`
+_AYON_MARKER_NAME = "AYONData"
+_AYON_MARKER_COLOR = "Mint"
+_AYON_MARKER_CUSTOM_DATA = "AYONData"
+_AYON_TAG_NAME = "VFX Notes"
+
+_SEQUENCE_EXTENSIONS = {"exr", "dpx", "png", "tif", "tiff", "jpg", "jpeg"}
+_AUDIO_EXTENSIONS = {"wav", "aif", "aiff", "mp3", "flac", "aac", "m4a"}
+
+_RENDER_FORMATS = {
+    "QuickTime": "mov",
+    "MP4": "mp4",
+    "MXF OP1A": "mxf",
+    "EXR": "exr",
+    "DPX": "dpx",
+    "TIFF": "tif",
+}
+_RENDER_CODECS = {
+    "mov": {
+        "H.264": "H264",
+        "H.265": "H265",
+        "Apple ProRes 422 HQ": "ProRes422HQ",
+        "Apple ProRes 422 LT": "ProRes422LT",
+        "Apple ProRes 4444 XQ": "ProRes4444XQ",
+    },
+    "mp4": {"H.264": "H264", "H.265": "H265"},
+    "mxf": {"DNxHR HQX": "DNxHRHQX"},
+    "exr": {
+        "RGB half (DWAA)": "RGBHalfDWAA",
+        "RGB float (ZIP)": "RGBFloatZIP",
+    },
+    "dpx": {"RGB 10 bit": "RGB10"},
+    "tif": {"RGB 16 bit": "RGB16"},
+}
+
+
+def _new_id():
+    return str(uuid.uuid4())
+
+
+def _frames_to_timecode(frames, fps):
+    fps = int(round(float(fps)))
+    frames = int(frames)
+    return "{:02d}:{:02d}:{:02d}:{:02d}".format(
+        frames // (3600 * fps),
+        (frames // (60 * fps)) % 60,
+        (frames // fps) % 60,
+        frames % fps,
+    )
+
+
+def _round_trip(method):
+    """Count the call and apply session latency before running *method*."""
+    @functools.wraps(method)
+    def wrapper(self, *args, **kwargs):
+        session = self._session
+        session.call_counts[
+            "{}.{}".format(self._api_type, method.__name__)] += 1
+        if session.latency:
+            time.sleep(session.latency)
+        return method(self, *args, **kwargs)
+    return wrapper
+
+
+class _FakeObject:
+    """Base of all fake Resolve objects.
+
+    Public methods named as the Resolve API (CamelCase) are wrapped so each
+    call counts as one IPC round trip. Helpers used to synthesize data are
+    underscore prefixed and free of charge.
+    """
+    _api_type = "Object"
+
+    def __init_subclass__(cls, **kwargs):
+        super().__init_subclass__(**kwargs)
+        for name, value in list(vars(cls).items()):
+            if name[:1].isupper() and callable(value):
+                setattr(cls, name, _round_trip(value))
+
+    def __init__(self, session):
+        self._session = session
+
+    def __repr__(self):
+        return "<Fake{} {}>".format(self._api_type, self._repr_name())
+
+    def _repr_name(self):
+        return hex(id(self))
+
+
+class FakeMediaPoolItem(_FakeObject):
+    _api_type = "MediaPoolItem"
+
+    def __init__(self, session, name, properties=None, timeline=None):
+        super().__init__(session)
+        self._name = name
+        self._unique_id = _new_id()
+        self._media_id = _new_id()
+        self._metadata = {}
+        self._markers = {}
+        self._flags = []
+        self._color = ""
+        self._folder = None
+        self._timeline = timeline
+        self._properties = {
+            "Clip Name": name,
+            "File Name": name,
+            "File Path": "",
+            "Type": "Video",
+            "FPS": "24.0",
+            "Start": "0",
+            "End": "0",
+            "Frames": "0",
+            "Start TC": "00:00:00:00",
+            "End TC": "00:00:00:00",
+            "Duration": "00:00:00:00",
+            "Resolution": "1920x1080",
+            "PAR": "Square",
+            "Audio Ch": "0",
+            "Usage": "0",
+            "Input Color Space": "Project",
+            "IDT": "",
+        }
+        self._properties.update(properties or {})
+
+    def _repr_name(self):
+        if self._timeline is not None:
+            return self._timeline._name
+        return self._name
+
+    def _usage(self, delta):
+        usage = int(self._properties["Usage"]) + delta
+        self._properties["Usage"] = str(max(usage, 0))
+
+    def GetName(self):
+        if self._timeline is not None:
+            return self._timeline._name
+        return self._name
+
+    def SetName(self, name):
+        self._name = name
+        return True
+
+    def GetUniqueId(self):
+        return self._unique_id
+
+    def GetMediaId(self):
+        return self._media_id
+
+    def GetMetadata(self, metadataType=None):
+        if metadataType:
+            return self._metadata.get(metadataType, "")
+        return dict(self._metadata)
+
+    def SetMetadata(self, metadataType, metadataValue=None):
+        if isinstance(metadataType, dict):
+            self._metadata.update(metadataType)
+        else:
+            self._metadata[metadataType] = metadataValue
+        return True
+
+    def GetClipProperty(self, propertyName=None):
+        if propertyName:
+            return self._properties.get(propertyName, "")
+        return dict(self._properties)
+
+    def SetClipProperty(self, propertyName, propertyValue):
+        if propertyName not in self._properties:
+            return False
+        self._properties[propertyName] = str(propertyValue)
+        return True
+
+    def GetClipColor(self):
+        return self._color
+
+    def SetClipColor(self, colorName):
+        self._color = colorName
+        return True
+
+    def ClearClipColor(self):
+        self._color = ""
+        return True
+
+    def GetFlagList(self):
+        return list(self._flags)
+
+    def GetMarkers(self):
+        return {frame: dict(info) for frame, info in self._markers.items()}
+
+    def AddMarker(self, frameId, color, name, note, duration, customData=""):
+        return _add_marker(
+            self._markers, frameId, color, name, note, duration, customData)
+
+    def DeleteMarkerAtFrame(self, frameNum):
+        return self._markers.pop(float(frameNum), None) is not None
+
+    def ReplaceClip(self, filePath):
+        self._properties["File Path"] = filePath
+        self._properties["File Name"] = os.path.basename(filePath)
+        return True
+
+
+class FakeTimelineItem(_FakeObject):
+    _api_type = "TimelineItem"
+
+    def __init__(self, session, timeline, media_pool_item, track_type,
+                 track_index, start, duration, left_offset=0,
+                 right_offset=0, name=None):
+        super().__init__(session)
+        self._timeline = timeline
+        self._media_pool_item = media_pool_item
+        self._track_type = track_type
+        self._track_index = track_index
+        self._start = int(start)
+        self._duration = int(duration)
+        self._left_offset = int(left_offset)
+        self._right_offset = int(right_offset)
+        self._name = name or (
+            media_pool_item._name if media_pool_item else "Fusion Composition"
+        )
+        self._unique_id = _new_id()
+        self._markers = {}
+        self._flags = []
+        self._color = ""
+        self._takes = []
+        self._selected_take = 0
+        if media_pool_item is not None:
+            media_pool_item._usage(1)
+
+    def _repr_name(self):
+        return self._name
+
+    def GetName(self):
+        return self._name
+
+    def SetName(self, name):
+        self._name = name
+        return True
+
+    def GetUniqueId(self):
+        return self._unique_id
+
+    def GetStart(self, subframe_precision=False):
+        return self._start
+
+    def GetEnd(self, subframe_precision=False):
+        return self._start + self._duration
+
+    def GetDuration(self, subframe_precision=False):
+        return self._duration
+
+    def GetLeftOffset(self, subframe_precision=False):
+        return self._left_offset
+
+    def GetRightOffset(self, subframe_precision=False):
+        return self._right_offset
+
+    def GetSourceStartFrame(self):
+        return self._left_offset
+
+    def GetSourceEndFrame(self):
+        return self._left_offset + self._duration
+
+    def GetTrackTypeAndIndex(self):
+        return [self._track_type, self._track_index]
+
+    def GetMediaPoolItem(self):
+        return self._media_pool_item
+
+    def GetClipColor(self):
+        return self._color
+
+    def SetClipColor(self, colorName):
+        self._color = colorName
+        return True
+
+    def ClearClipColor(self):
+        self._color = ""
+        return True
+
+    def GetFlagList(self):
+        return list(self._flags)
+
+    def GetMarkers(self):
+        return {frame: dict(info) for frame, info in self._markers.items()}
+
+    def AddMarker(self, frameId, color, name, note, duration, customData=""):
+        return _add_marker(
+            self._markers, frameId, color, name, note, duration, customData)
+
+    def GetMarkerByCustomData(self, customData):
+        for frame, info in self._markers.items():
+            if info["customData"] == customData:
+                return {frame: dict(info)}
+        return {}
+
+    def GetMarkerCustomData(self, frameId):
+        info = self._markers.get(float(frameId))
+        return info["customData"] if info else ""
+
+    def UpdateMarkerCustomData(self, frameId, customData):
+        info = self._markers.get(float(frameId))
+        if not info:
+            return False
+        info["customData"] = customData
+        return True
+
+    def DeleteMarkerAtFrame(self, frameNum):
+        return self._markers.pop(float(frameNum), None) is not None
+
+    def DeleteMarkerByCustomData(self, customData):
+        for frame, info in list(self._markers.items()):
+            if info["customData"] == customData:
+                del self._markers[frame]
+                return True
+        return False
+
+    def DeleteMarkersByColor(self, color):
+        for frame, info in list(self._markers.items()):
+            if color == "All" or info["color"] == color:
+                del self._markers[frame]
+        return True
+
+    def AddTake(self, mediaPoolItem, startFrame=None, endFrame=None):
+        if not self._takes and self._media_pool_item is not None:
+            self._takes.append({
+                "mediaPoolItem": self._media_pool_item,
+                "startFrame": self._left_offset,
+                "endFrame": self._left_offset + self._duration,
+            })
+        self._takes.append({
+            "mediaPoolItem": mediaPoolItem,
+            "startFrame": startFrame,
+            "endFrame": endFrame,
+        })
+        return True
+
+    def GetTakesCount(self):
+        return len(self._takes)
+
+    def GetTakeByIndex(self, idx):
+        return dict(self._takes[int(idx) - 1])
+
+    def SelectTakeByIndex(self, idx):
+        self._selected_take = int(idx)
+        return True
+
+    def FinalizeTake(self):
+        if not self._selected_take:
+            return False
+        take = self._takes[self._selected_take - 1]
+        if self._media_pool_item is not None:
+            self._media_pool_item._usage(-1)
+        self._media_pool_item = take["mediaPoolItem"]
+        self._media_pool_item._usage(1)
+        self._takes = []
+        self._selected_take = 0
+        return True
+
+
+class FakeTimeline(_FakeObject):
+    _api_type = "Timeline"
+
+    def __init__(self, session, project, name, start_frame=86400):
+        super().__init__(session)
+        self._project = project
+        self._name = name
+        self._unique_id = _new_id()
+        self._start_frame = int(start_frame)
+        self._tracks = {"video": [], "audio": [], "subtitle": []}
+        self._settings = {}
+        self._markers = {}
+        self._media_pool_item = FakeMediaPoolItem(
+            session, name, {"Type": "Timeline"}, timeline=self)
+        self._add_track("video")
+        self._add_track("audio")
+
+    def _repr_name(self):
+        return self._name
+
+    def _add_track(self, track_type, name=None):
+        tracks = self._tracks[track_type]
+        tracks.append({
+            "name": name or "{}{}".format(
+                track_type[0].upper(), len(tracks) + 1),
+            "enabled": True,
+            "items": [],
+        })
+        return len(tracks)
+
+    def _add_item(self, track_type, track_index, media_pool_item, start,
+                  duration, left_offset=0, right_offset=0, name=None):
+        while len(self._tracks[track_type]) < track_index:
+            self._add_track(track_type)
+        item = FakeTimelineItem(
+            self._session, self, media_pool_item, track_type, track_index,
+            start, duration, left_offset, right_offset, name
+        )
+        items = self._tracks[track_type][track_index - 1]["items"]
+        items.append(item)
+        items.sort(key=lambda _item: _item._start)
+        return item
+
+    def _track_end(self, track_type, track_index):
+        items = self._tracks[track_type][track_index - 1]["items"]
+        if not items:
+            return self._start_frame
+        return max(item._start + item._duration for item in items)
+
+    def GetName(self):
+        return self._name
+
+    def SetName(self, timelineName):
+        self._name = timelineName
+        return True
+
+    def GetUniqueId(self):
+        return self._unique_id
+
+    def GetMediaPoolItem(self):
+        return self._media_pool_item
+
+    def GetStartFrame(self):
+        return self._start_frame
+
+    def GetEndFrame(self):
+        ends = [
+            self._track_end(track_type, index + 1)
+            for track_type, tracks in self._tracks.items()
+            for index in range(len(tracks))
+        ]
+        return max(ends or [self._start_frame])
+
+    def GetStartTimecode(self):
+        fps = self._settings.get(
+            "timelineFrameRate", self._project._settings["timelineFrameRate"])
+        return _frames_to_timecode(self._start_frame, fps)
+
+    def GetSetting(self, settingName=None):
+        settings = dict(self._project._settings)
+        settings.update(self._settings)
+        if settingName:
+            return settings.get(settingName, "")
+        return settings
+
+    def SetSetting(self, settingName, settingValue):
+        self._settings[settingName] = settingValue
+        return True
+
+    def GetTrackCount(self, trackType):
+        return len(self._tracks.get(trackType, []))
+
+    def GetTrackName(self, trackType, trackIndex):
+        return self._tracks[trackType][int(trackIndex) - 1]["name"]
+
+    def SetTrackName(self, trackType, trackIndex, name):
+        self._tracks[trackType][int(trackIndex) - 1]["name"] = name
+        return True
+
+    def AddTrack(self, trackType, subTrackType=None):
+        self._add_track(trackType)
+        return True
+
+    def GetIsTrackEnabled(self, trackType, trackIndex):
+        return self._tracks[trackType][int(trackIndex) - 1]["enabled"]
+
+    def SetTrackEnable(self, trackType, trackIndex, enabled):
+        self._tracks[trackType][int(trackIndex) - 1]["enabled"] = enabled
+        return True
+
+    def GetItemListInTrack(self, trackType, index):
+        return list(self._tracks[trackType][int(index) - 1]["items"])
+
+    def GetItemsInTrack(self, trackType, index):
+        items = self._tracks[trackType][int(index) - 1]["items"]
+        return {float(idx + 1): item for idx, item in enumerate(items)}
+
+    def DeleteClips(self, timelineItems, ripple=False):
+        for item in timelineItems:
+            track = self._tracks[item._track_type][item._track_index - 1]
+            if item in track["items"]:
+                track["items"].remove(item)
+                if item._media_pool_item is not None:
+                    item._media_pool_item._usage(-1)
+        return True
+
+    def GetMarkers(self):
+        return {frame: dict(info) for frame, info in self._markers.items()}
+
+    def AddMarker(self, frameId, color, name, note, duration, customData=""):
+        return _add_marker(
+            self._markers, frameId, color, name, note, duration, customData)
+
+    def ApplyGradeFromDRX(self, path, gradeMode, items):
+        return True
+
+
+class FakeFolder(_FakeObject):
+    _api_type = "Folder"
+
+    def __init__(self, session, name, parent=None):
+        super().__init__(session)
+        self._name = name
+        self._parent = parent
+        self._unique_id = _new_id()
+        self._clips = []
+        self._subfolders = []
+
+    def _repr_name(self):
+        return self._name
+
+    def _add_clip(self, clip):
+        clip._folder = self
+        self._clips.append(clip)
+        return clip
+
+    def _add_subfolder(self, name):
+        folder = FakeFolder(self._session, name, parent=self)
+        self._subfolders.append(folder)
+        return folder
+
+    def GetName(self):
+        return self._name
+
+    def GetUniqueId(self):
+        return self._unique_id
+
+    def GetIsFolderStale(self):
+        return False
+
+    def GetClipList(self):
+        return list(self._clips)
+
+    def GetSubFolderList(self):
+        return list(self._subfolders)
+
+
+class FakeMediaPool(_FakeObject):
+    _api_type = "MediaPool"
+
+    def __init__(self, session, project):
+        super().__init__(session)
+        self._project = project
+        self._unique_id = _new_id()
+        self._root = FakeFolder(session, "Master")
+        self._current_folder = self._root
+
+    def _import_file(self, file_info, folder=None):
+        folder = folder or self._current_folder
+        fps = float(self._project._settings["timelineFrameRate"])
+        if isinstance(file_info, dict):
+            path = file_info["FilePath"]
+            start = int(file_info.get("StartIndex", 1))
+            end = int(file_info.get("EndIndex", start))
+        else:
+            path = file_info
+            start, end = 0, int(fps * 4) - 1
+
+        dirname, basename = os.path.split(path)
+        ext = basename.rsplit(".", 1)[-1].lower()
+        clip_type = "Video"
+        if ext in _AUDIO_EXTENSIONS:
+            clip_type = "Audio"
+
+        if "%" in basename:
+            # Resolve sequence notation `name.[1001-1100].exr`
+            head, tail = basename.split("%", 1)
+            padding = int(tail[1:tail.index("d")] or 1)
+            tail = tail[tail.index("d") + 1:]
+            frame_range = "[{:0{p}d}-{:0{p}d}]".format(start, end, p=padding)
+            basename = "{}{}{}".format(head, frame_range, tail)
+            path = os.path.join(dirname, basename)
+
+        frames = end - start + 1
+        name = basename
+        clip = FakeMediaPoolItem(self._session, name, {
+            "File Path": path,
+            "File Name": basename,
+            "Type": clip_type,
+            "FPS": str(fps),
+            "Start": str(start),
+            "End": str(end),
+            "Frames": str(frames),
+            "Start TC": _frames_to_timecode(start, fps),
+            "End TC": _frames_to_timecode(end + 1, fps),
+            "Duration": _frames_to_timecode(frames, fps),
+            "Audio Ch": "2" if clip_type == "Audio" else "0",
+        })
+        return folder._add_clip(clip)
+
+    def _iter_folders(self):
+        queue = [self._root]
+        for folder in queue:
+            yield folder
+            queue.extend(folder._subfolders)
+
+    def _timeline_folder_clip(self, timeline, folder=None):
+        folder = folder or self._current_folder
+        return folder._add_clip(timeline._media_pool_item)
+
+    def GetUniqueId(self):
+        return self._unique_id
+
+    def GetRootFolder(self):
+        return self._root
+
+    def GetCurrentFolder(self):
+        return self._current_folder
+
+    def SetCurrentFolder(self, folder):
+        if not isinstance(folder, FakeFolder):
+            return False
+        self._current_folder = folder
+        return True
+
+    def AddSubFolder(self, folder, name):
+        return folder._add_subfolder(name)
+
+    def RefreshFolders(self):
+        return True
+
+    def ImportMedia(self, items):
+        return [self._import_file(item) for item in items]
+
+    def _remove_clips(self, clips):
+        for clip in clips:
+            folder = clip._folder
+            if folder is not None and clip in folder._clips:
+                folder._clips.remove(clip)
+                clip._folder = None
+
+    def DeleteClips(self, clips):
+        self._remove_clips(clips)
+        return True
+
+    def MoveClips(self, clips, targetFolder):
+        self._remove_clips(clips)
+        for clip in clips:
+            targetFolder._add_clip(clip)
+        return True
+
+    def DeleteFolders(self, subfolders):
+        for folder in subfolders:
+            if folder._parent is not None:
+                folder._parent._subfolders.remove(folder)
+        return True
+
+    def CreateEmptyTimeline(self, name):
+        project = self._project
+        if any(tl._name == name for tl in project._timelines):
+            return None
+        timeline = project._add_timeline(name)
+        self._timeline_folder_clip(timeline)
+        return timeline
+
+    def DeleteTimelines(self, timelines):
+        project = self._project
+        for timeline in timelines:
+            if timeline in project._timelines:
+                project._timelines.remove(timeline)
+            self._remove_clips([timeline._media_pool_item])
+        return True
+
+    def AppendToTimeline(self, clips):
+        timeline = self._project._current_timeline
+        if timeline is None:
+            return []
+
+        output = []
+        for clip_info in clips:
+            if not isinstance(clip_info, dict):
+                clip_info = {"mediaPoolItem": clip_info}
+            mpi = clip_info["mediaPoolItem"]
+            props = mpi._properties
+            source_start = int(clip_info.get(
+                "startFrame", int(props["Start"] or 0)))
+            source_end = int(clip_info.get(
+                "endFrame", int(props["End"] or 0)))
+            track_index = int(clip_info.get("trackIndex", 1))
+            record_frame = clip_info.get("recordFrame")
+            if record_frame is None:
+                record_frame = timeline._track_end("video", track_index)
+            duration = source_end - source_start + 1
+            output.append(timeline._add_item(
+                "video", track_index, mpi, record_frame, duration,
+                left_offset=source_start - int(props["Start"] or 0),
+            ))
+        return output
+
+
+class FakeProject(_FakeObject):
+    _api_type = "Project"
+
+    def __init__(self, session, name):
+        super().__init__(session)
+        self._name = name
+        self._unique_id = _new_id()
+        self._settings = {
+            "timelineFrameRate": 24.0,
+            "timelineResolutionWidth": "1920",
+            "timelineResolutionHeight": "1080",
+            "timelinePixelAspectRatio": "square",
+            "colorScienceMode": "davinciYRGB",
+        }
+        self._timelines = []
+        self._current_timeline = None
+        self._media_pool = FakeMediaPool(session, self)
+        self._render_settings = {}
+        self._render_jobs = collections.OrderedDict()
+        self._render_presets = set()
+        self._render_format_codec = {"format": "mov", "codec": "H264"}
+        self._job_counter = itertools.count(1)
+
+    def _repr_name(self):
+        return self._name
+
+    def _add_timeline(self, name, start_frame=86400):
+        timeline = FakeTimeline(self._session, self, name, start_frame)
+        self._timelines.append(timeline)
+        if self._current_timeline is None:
+            self._current_timeline = timeline
+        return timeline
+
+    def GetName(self):
+        return self._name
+
+    def GetUniqueId(self):
+        return self._unique_id
+
+    def GetMediaPool(self):
+        return self._media_pool
+
+    def GetTimelineCount(self):
+        return len(self._timelines)
+
+    def GetTimelineByIndex(self, idx):
+        return self._timelines[int(idx) - 1]
+
+    def GetCurrentTimeline(self):
+        return self._current_timeline
+
+    def SetCurrentTimeline(self, timeline):
+        if timeline not in self._timelines:
+            return False
+        self._current_timeline = timeline
+        return True
+
+    def GetSetting(self, settingName=None):
+        if settingName:
+            return self._settings.get(settingName, "")
+        return dict(self._settings)
+
+    def SetSetting(self, settingName, settingValue):
+        self._settings[settingName] = settingValue
+        return True
+
+    # Rendering
+    def GetRenderFormats(self):
+        return dict(_RENDER_FORMATS)
+
+    def GetRenderCodecs(self, renderFormat):
+        return dict(_RENDER_CODECS.get(renderFormat, {}))
+
+    def GetRenderResolutions(self, format=None, codec=None):
+        return [
+            {"Width": 1920, "Height": 1080},
+            {"Width": 3840, "Height": 2160},
+        ]
+
+    def GetCurrentRenderFormatAndCodec(self):
+        return dict(self._render_format_codec)
+
+    def SetCurrentRenderFormatAndCodec(self, format, codec):
+        if codec not in _RENDER_CODECS.get(format, {}).values():
+            return False
+        self._render_format_codec = {"format": format, "codec": codec}
+        return True
+
+    def SetRenderSettings(self, settings):
+        self._render_settings.update(settings)
+        return True
+
+    def LoadRenderPreset(self, presetName):
+        return presetName in self._render_presets
+
+    def DeleteRenderPreset(self, presetName):
+        if presetName not in self._render_presets:
+            return False
+        self._render_presets.discard(presetName)
+        return True
+
+    def GetRenderPresetList(self):
+        return sorted(self._render_presets)
+
+    def AddRenderJob(self):
+        job_id = "job{:06d}".format(next(self._job_counter))
+        settings = dict(self._render_settings)
+        settings.update(self._render_format_codec)
+        self._render_jobs[job_id] = {
+            "settings": settings,
+            "timeline": self._current_timeline,
+            "started": None,
+            "status": "Ready",
+        }
+        return job_id
+
+    def GetRenderJobList(self):
+        return [
+            {"JobId": job_id, "TargetDir": job["settings"].get("TargetDir")}
+            for job_id, job in self._render_jobs.items()
+        ]
+
+    def DeleteRenderJob(self, jobId):
+        return self._render_jobs.pop(jobId, None) is not None
+
+    def DeleteAllRenderJobs(self):
+        self._render_jobs.clear()
+        return True
+
+    def StartRendering(self, *job_ids, isInteractiveMode=False):
+        if len(job_ids) == 1 and isinstance(job_ids[0], (list, tuple)):
+            job_ids = job_ids[0]
+        job_ids = job_ids or list(self._render_jobs)
+        if not all(job_id in self._render_jobs for job_id in job_ids):
+            return False
+        started = time.monotonic()
+        for job_id in job_ids:
+            job = self._render_jobs[job_id]
+            job["started"] = started
+            job["status"] = "Rendering"
+            _write_render_output(job["settings"])
+        return True
+
+    def StopRendering(self):
+        for job in self._render_jobs.values():
+            if job["status"] == "Rendering":
+                job["status"] = "Cancelled"
+
+    def _render_progress(self, job):
+        if job["started"] is None or job["status"] == "Cancelled":
+            return 0
+        duration = self._session.render_duration
+        if not duration:
+            return 100
+        elapsed = time.monotonic() - job["started"]
+        return min(int(elapsed / duration * 100), 100)
+
+    def IsRenderingInProgress(self):
+        return any(
+            job["status"] == "Rendering" and self._render_progress(job) < 100
+            for job in self._render_jobs.values()
+        )
+
+    def GetRenderJobStatus(self, jobId):
+        job = self._render_jobs.get(jobId)
+        if job is None:
+            return {}
+        progress = self._render_progress(job)
+        status = job["status"]
+        if status == "Rendering" and progress >= 100:
+            status = job["status"] = "Complete"
+        return {"JobStatus": status, "CompletionPercentage": progress}
+
+
+class FakeProjectManager(_FakeObject):
+    _api_type = "ProjectManager"
+
+    def __init__(self, session):
+        super().__init__(session)
+        self._projects = {}
+        self._current_project = None
+        self._folders = set()
+
+    def _create_project(self, name):
+        project = FakeProject(self._session, name)
+        self._projects[name] = project
+        self._current_project = project
+        return project
+
+    def CreateProject(self, projectName, mediaLocationPath=None):
+        if projectName in self._projects:
+            return None
+        return self._create_project(projectName)
+
+    def LoadProject(self, projectName):
+        project = self._projects.get(projectName)
+        if project is not None:
+            self._current_project = project
+        return project
+
+    def GetCurrentProject(self):
+        return self._current_project
+
+    def SaveProject(self):
+        return True
+
+    def GotoRootFolder(self):
+        return True
+
+    def GetFoldersInCurrentFolder(self):
+        return {
+            float(idx + 1): name
+            for idx, name in enumerate(sorted(self._folders))
+        }
+
+    def CreateFolder(self, folderName):
+        self._folders.add(folderName)
+        return True
+
+    def OpenFolder(self, folderName):
+        return folderName in self._folders
+
+
+class FakeMediaStorage(_FakeObject):
+    _api_type = "MediaStorage"
+
+    def GetMountedVolumeList(self):
+        return []
+
+
+class FakeFusion(_FakeObject):
+    _api_type = "Fusion"
+
+    def __init__(self, session, resolve):
+        super().__init__(session)
+        self._resolve = resolve
+
+    def GetResolve(self):
+        return self._resolve
+
+
+class FakeResolve(_FakeObject):
+    """Root of the fake Resolve object model.
+
+    The instance also holds the shared session state of all the objects
+    created from it: the injected per-call latency and the call counters.
+
+    Args:
+        latency (Optional[float]): Seconds added to every API call.
+        render_duration (Optional[float]): Seconds a render job takes
+            to report completion.
+    """
+    _api_type = "Resolve"
+    EXPORT_OTIO = None
+
+    def __init__(self, latency=0.0, render_duration=0.0):
+        super().__init__(self)
+        self.latency = latency
+        self.render_duration = render_duration
+        self.call_counts = collections.Counter()
+        self._page = "edit"
+        self._project_manager = FakeProjectManager(self)
+        self._media_storage = FakeMediaStorage(self)
+        self._fusion = FakeFusion(self, self)
+
+    @property
+    def call_count(self):
+        """int: Total number of API calls made since last reset."""
+        return sum(self.call_counts.values())
+
+    def reset_call_counts(self):
+        self.call_counts.clear()
+
+    def Fusion(self):
+        return self._fusion
+
+    def GetProjectManager(self):
+        return self._project_manager
+
+    def GetMediaStorage(self):
+        return self._media_storage
+
+    def GetProductName(self):
+        return "DaVinci Resolve Studio"
+
+    def GetVersion(self):
+        return [20, 3, 2, 9, ""]
+
+    def GetVersionString(self):
+        return "20.3.2.9"
+
+    def GetCurrentPage(self):
+        return self._page
+
+    def OpenPage(self, pageName):
+        self._page = pageName.lower()
+        return True
+
+    def ImportRenderPreset(self, presetPath):
+        project = self._project_manager._current_project
+        if project is None or not os.path.isfile(presetPath):
+            return False
+        preset_name = os.path.splitext(os.path.basename(presetPath))[0]
+        project._render_presets.add(preset_name)
+        return True
+
+
+def _add_marker(markers, frame_id, color, name, note, duration, custom_data):
+    frame_id = float(frame_id)
+    if frame_id in markers:
+        return False
+    markers[frame_id] = {
+        "color": color,
+        "duration": float(duration),
+        "note": note,
+        "name": name,
+        "customData": custom_data or "",
+    }
+    return True
+
+
+def _write_render_output(settings):
+    target_dir = settings.get("TargetDir")
+    if not target_dir:
+        return
+    os.makedirs(target_dir, exist_ok=True)
+    ext = settings.get("format", "mov")
+    name = settings.get("CustomName") or "render"
+    if ext not in _SEQUENCE_EXTENSIONS:
+        open(os.path.join(target_dir, "{}.{}".format(name, ext)), "w").close()
+        return
+
+    mark_in = int(settings.get("MarkIn", 0))
+    mark_out = int(settings.get("MarkOut", mark_in))
+    for frame in range(mark_in, mark_out + 1):
+        filename = "{}.{:08d}.{}".format(name, frame, ext)
+        open(os.path.join(target_dir, filename), "w").close()
+
+
+def create_conform_project(
+    resolve,
+    name="ayon_conform",
+    shot_count=3000,
+    video_tracks=1,
+    audio_tracks=1,
+    shots_per_bin=50,
+    shot_duration=48,
+    handles=8,
+    tagged=True,
+    loaded=True,
+):
+    """Synthesize a conform project inside *resolve*.
+
+    Each shot gets an image sequence media pool item sorted into
+    `Loader/<sequence>` bins and a timeline item on every video track.
+    Audio tracks get one continuous audio clip per shot.
+
+    Args:
+        resolve (FakeResolve): Fake Resolve to create the project in.
+        name (str): Project name.
+        shot_count (int): Number of shots on the timeline.
+        video_tracks (int): Number of video tracks holding shots.
+        audio_tracks (int): Number of audio tracks.
+        shots_per_bin (int): Number of shots per media pool bin.
+        shot_duration (int): Cut length of each shot in frames.
+        handles (int): Available media handles around each cut.
+        tagged (bool): Add AYON publish markers to the hero track items.
+        loaded (bool): Imprint AYON container metadata on media pool items.
+
+    Returns:
+        FakeProject: The new current project.
+    """
+    project = resolve._project_manager._create_project(name)
+    media_pool = project._media_pool
+    loader_bin = media_pool._root._add_subfolder("Loader")
+
+    timeline = project._add_timeline("{}_conform".format(name))
+    media_pool._timeline_folder_clip(timeline, media_pool._root)
+    for _ in range(video_tracks - 1):
+        timeline._add_track("video")
+    for _ in range(audio_tracks - 1):
+        timeline._add_track("audio")
+
+    record_frame = timeline._start_frame
+    shot_bin = None
+    for shot_index in range(shot_count):
+        if shot_index % shots_per_bin == 0:
+            shot_bin = loader_bin._add_subfolder(
+                "sq{:03d}".format(shot_index // shots_per_bin + 1))
+
+        shot_name = "sh{:04d}".format((shot_index + 1) * 10)
+        for track_index in range(1, video_tracks + 1):
+            media_pool._current_folder = shot_bin
+            mpi = media_pool._import_file({
+                "FilePath": "/proj/shots/{0}/plate_v{1:03d}.%04d.exr".format(
+                    shot_name, track_index),
+                "StartIndex": 1001,
+                "EndIndex": 1001 + shot_duration + handles * 2 - 1,
+            })
+            if loaded:
+                mpi._metadata[_AYON_TAG_NAME] = json.dumps({
+                    "schema": "openpype:container-2.0",
+                    "id": "ayon.load.container",
+                    "loader": "LoadMedia",
+                    "representation": _new_id(),
+                })
+
+            item = timeline._add_item(
+                "video", track_index, mpi, record_frame, shot_duration,
+                left_offset=handles, right_offset=handles,
+            )
+            if tagged and track_index == 1:
+                item._color = "Pink"
+                frame = handles + shot_duration // 2
+                item._markers[float(frame)] = {
+                    "color": _AYON_MARKER_COLOR,
+                    "duration": 1.0,
+                    "note": json.dumps({
+                        "resolve_sub_products": {
+                            "io.ayon.creators.resolve.shot": {
+                                "folderPath": "/shots/{}".format(shot_name),
+                                "productName": "shotMain",
+                                "instance_id": _new_id(),
+                            }
+                        },
+                        "clip_index": item._unique_id,
+                        "publish": True,
+                    }),
+                    "name": _AYON_MARKER_NAME,
+                    "customData": "{}:{}".format(
+                        _AYON_MARKER_CUSTOM_DATA, _new_id()),
+                }
+
+        for track_index in range(1, audio_tracks + 1):
+            media_pool._current_folder = shot_bin
+            audio = media_pool._import_file(
+                "/proj/shots/{}/audio_a{}.wav".format(shot_name, track_index))
+            timeline._add_item(
+                "audio", track_index, audio, record_frame, shot_duration)
+
+        record_frame += shot_duration
+
+    media_pool._current_folder = media_pool._root
+    return project
+
+
+def install_fake_resolve(resolve=None, **kwargs):
+    """Register fake Resolve as `ayon_resolve.api.bmdvr`.
+
+    Args:
+        resolve (Optional[FakeResolve]): Fake Resolve to install. A new one
+            is created from *kwargs* when not provided.
+
+    Returns:
+        FakeResolve: The installed fake Resolve.
+    """
+    from ayon_resolve.api.utils import set_resolve_module
+
+    resolve = resolve or FakeResolve(**kwargs)
+    set_resolve_module(resolve, resolve.Fusion())
+    return resolve
@@ -0,0 +1,64 @@
+from ayon_resolve.api import bin_cache, operation_cache
+
+
+def _cache_path(cache, root, path):
+    """Cache all bins of the path as `lib.create_bin` does."""
+    parent = root
+    names = path.split("/")
+    for index, name in enumerate(names):
+        folder = next(
+            subfolder for subfolder in parent.GetSubFolderList()
+            if subfolder.GetName() == name
+        )
+        cache.add(None, "/".join(names[:index + 1]), folder, parent)
+        parent = folder
+    return parent
+
+
+def _move_bin(folder, parent):
+    """Move bin to another parent the way the artist does in Resolve."""
+    folder._parent._subfolders.remove(folder)
+    folder._parent = parent
+    parent._subfolders.append(folder)
+
+
+def test_cached_bin_is_returned(project):
+    root = project.GetMediaPool().GetRootFolder()
+    cache = bin_cache.BinPathCache()
+    folder = _cache_path(cache, root, "Loader/sq001")
+
+    assert cache.get(None, "Loader/sq001") is folder
+
+
+def test_bin_moved_to_another_parent_is_dropped(project):
+    root = project.GetMediaPool().GetRootFolder()
+    cache = bin_cache.BinPathCache()
+    folder = _cache_path(cache, root, "Loader/sq001")
+
+    _move_bin(folder, root)
+
+    assert cache.get(None, "Loader/sq001") is None
+    assert len(cache) == 0
+
+
+def test_bin_with_moved_parent_is_dropped(project):
+    root = project.GetMediaPool().GetRootFolder()
+    cache = bin_cache.BinPathCache()
+    _cache_path(cache, root, "Loader/sq001")
+    other_bin = root._add_subfolder("Other")
+
+    _move_bin(cache.get(None, "Loader"), other_bin)
+
+    assert cache.get(None, "Loader/sq001") is None
+
+
+def test_cached_bin_is_trusted_within_operation(resolve, project):
+    root = project.GetMediaPool().GetRootFolder()
+    cache = bin_cache.BinPathCache()
+
+    with operation_cache.operation_scope():
+        folder = _cache_path(cache, root, "Loader/sq001")
+        resolve.reset_call_counts()
+
+        assert cache.get(None, "Loader/sq001") is folder
+        assert resolve.call_count == 0
@@ -0,0 +1,67 @@
+from ayon_resolve.api import container_registry
+
+
+def _container(name, representation_id="repre-1", loader="LoadMedia"):
+    return {
+        "objectName": name,
+        "representation": representation_id,
+        "loader": loader,
+    }
+
+
+def _registry():
+    registry = container_registry.ContainerRegistry()
+    registry.set_source(container_registry.MEDIA_POOL, [
+        ("clip-1", _container("clip_1")),
+        ("clip-2", _container("clip_2", representation_id="repre-2")),
+    ])
+    registry.set_source(container_registry.TIMELINE, [
+        ("item-1", _container("item_1", loader="LoadClip")),
+    ])
+    return registry
+
+
+def test_validate_drops_only_invalid_containers_of_source():
+    registry = _registry()
+    checked = []
+
+    def is_valid(object_id, container):
+        checked.append(object_id)
+        return object_id != "clip-2"
+
+    dropped = registry.validate(container_registry.MEDIA_POOL, is_valid)
+
+    assert dropped == 1
+    assert sorted(checked) == ["clip-1", "clip-2"]
+    assert registry.get("clip-2") is None
+    assert registry.get("clip-1")["objectName"] == "clip_1"
+    # containers of other sources are not validated
+    assert registry.get("item-1")["objectName"] == "item_1"
+    assert registry.is_built(container_registry.MEDIA_POOL)
+
+
+def test_validate_updates_lookups():
+    registry = _registry()
+
+    registry.validate(
+        container_registry.MEDIA_POOL,
+        lambda object_id, container: False,
+    )
+
+    assert registry.get_by_representation("repre-2") == []
+    assert registry.get_by_loader("LoadMedia") == []
+    assert [
+        container["objectName"]
+        for container in registry.get_by_representation("repre-1")
+    ] == ["item_1"]
+    assert len(registry) == 1
+
+
+def test_get_by_representation_filters_loader():
+    registry = _registry()
+
+    containers = registry.get_by_representation(
+        "repre-1", loader="LoadClip")
+
+    assert [container["objectName"] for container in containers] == [
+        "item_1"]
@@ -0,0 +1,79 @@
+import opentimelineio as otio
+
+from ayon_resolve.otio.interval_index import TimelineIntervalIndex
+
+FPS = 24.0
+
+
+def _range(start, duration):
+    return otio.opentime.TimeRange(
+        otio.opentime.RationalTime(start, FPS),
+        otio.opentime.RationalTime(duration, FPS),
+    )
+
+
+def _timeline():
+    """Timeline with two tracks, `V1` with cuts of 10 frames."""
+    otio_timeline = otio.schema.Timeline(name="conform")
+    track = otio.schema.Track(name="V1")
+    for index in range(10):
+        track.append(otio.schema.Clip(
+            name=f"sh{index:03d}", source_range=_range(0, 10)))
+    otio_timeline.tracks.append(track)
+
+    track = otio.schema.Track(name="V2")
+    track.append(otio.schema.Gap(source_range=_range(0, 25)))
+    track.append(otio.schema.Clip(name="overlay", source_range=_range(0, 30)))
+    otio_timeline.tracks.append(track)
+    return otio_timeline
+
+
+def _names(items):
+    return [otio_clip.name for otio_clip, _ in items]
+
+
+def test_exact_lookup_returns_covering_clips_of_all_tracks():
+    index = TimelineIntervalIndex(_timeline())
+
+    assert _names(index.iter_covering(_range(30, 10), exact=True)) == [
+        "sh003", "overlay"]
+
+
+def test_exact_lookup_of_partial_range():
+    index = TimelineIntervalIndex(_timeline())
+
+    assert _names(index.iter_covering(_range(82, 3), exact=True)) == [
+        "sh008"]
+
+
+def test_lookup_without_exact_returns_candidates():
+    index = TimelineIntervalIndex(_timeline())
+
+    names = _names(index.iter_covering(_range(30, 10)))
+
+    assert "sh003" in names
+    assert "overlay" in names
+
+
+def test_lookup_limited_to_track_name():
+    index = TimelineIntervalIndex(_timeline())
+
+    assert _names(index.iter_covering(
+        _range(30, 10), track_name="V2", exact=True)) == ["overlay"]
+
+
+def test_lookup_of_range_not_covered_by_one_clip():
+    index = TimelineIntervalIndex(_timeline())
+
+    assert _names(index.iter_covering(
+        _range(5, 10), track_name="V1", exact=True)) == []
+
+
+def test_parent_range_is_returned_with_clip():
+    index = TimelineIntervalIndex(_timeline())
+
+    [(otio_clip, parent_range)] = index.iter_covering(
+        _range(70, 10), track_name="V1", exact=True)
+
+    assert otio_clip.name == "sh007"
+    assert parent_range == _range(70, 10)
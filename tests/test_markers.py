@@ -0,0 +1,82 @@
+import json
+
+import pytest
+
+from ayon_resolve.api import constants, markers, operation_cache
+
+
+@pytest.fixture
+def timeline_item(project):
+    timeline = project.GetCurrentTimeline()
+    return timeline.GetItemListInTrack("video", 1)[0]
+
+
+def _add_marker(timeline_item, frame, note, name=constants.AYON_MARKER_NAME):
+    timeline_item.AddMarker(
+        frame, constants.AYON_MARKER_COLOR, name, note, 1, "")
+
+
+def test_cached_marker_is_not_read_again_within_operation(
+        resolve, timeline_item):
+    item_id = timeline_item.GetUniqueId()
+
+    with operation_cache.operation_scope():
+        handle = markers.find_ayon_marker(timeline_item, item_id=item_id)
+        resolve.reset_call_counts()
+        cached_handle = markers.find_ayon_marker(
+            timeline_item, item_id=item_id)
+
+        assert resolve.call_count == 0
+        assert cached_handle is handle
+        assert handle.data["publish"] is True
+
+
+def test_cached_marker_is_revalidated_in_next_operation(timeline_item):
+    item_id = timeline_item.GetUniqueId()
+
+    with operation_cache.operation_scope():
+        handle = markers.find_ayon_marker(timeline_item, item_id=item_id)
+
+    # marker edited by the artist between operations
+    timeline_item.DeleteMarkerAtFrame(handle.frame)
+    _add_marker(timeline_item, handle.frame, json.dumps({"publish": False}))
+
+    with operation_cache.operation_scope():
+        handle = markers.find_ayon_marker(timeline_item, item_id=item_id)
+
+    assert handle.data == {"publish": False}
+
+
+def test_unchanged_markers_are_not_parsed_again(resolve, timeline_item):
+    item_id = timeline_item.GetUniqueId()
+    handle = markers.find_ayon_marker(timeline_item, item_id=item_id)
+
+    resolve.reset_call_counts()
+    assert markers.find_ayon_marker(
+        timeline_item, item_id=item_id) is handle
+    assert resolve.call_counts == {"TimelineItem.GetMarkers": 1}
+
+
+def test_replaced_marker_is_cached(timeline_item):
+    item_id = timeline_item.GetUniqueId()
+
+    with operation_cache.operation_scope():
+        handle = markers.find_ayon_marker(timeline_item, item_id=item_id)
+        new_handle = handle.replace({"publish": False})
+
+        assert markers.find_ayon_marker(
+            timeline_item, item_id=item_id) is new_handle
+
+    handle = markers.find_ayon_marker(timeline_item, item_id=item_id)
+    assert handle.data == {"publish": False}
+    assert len(timeline_item.GetMarkers()) == 1
+
+
+def test_invalid_and_foreign_markers_are_ignored(timeline_item):
+    item_id = timeline_item.GetUniqueId()
+    timeline_item.DeleteMarkersByColor(constants.AYON_MARKER_COLOR)
+    _add_marker(timeline_item, 1, "not json")
+    _add_marker(timeline_item, 2, json.dumps({"a": 1}), name="artist note")
+
+    assert markers.find_ayon_marker(timeline_item, item_id=item_id) is None
+    assert markers.find_ayon_marker(timeline_item) is None
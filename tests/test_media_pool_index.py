@@ -0,0 +1,76 @@
+from ayon_resolve.api import media_pool_index
+
+
+def _get_bin(media_pool, path):
+    folder = media_pool.GetRootFolder()
+    for name in path.split("/"):
+        folder = next(
+            subfolder for subfolder in folder.GetSubFolderList()
+            if subfolder.GetName() == name
+        )
+    return folder
+
+
+def test_index_is_not_stale_after_build(project):
+    index = media_pool_index.MediaPoolIndex(project.GetMediaPool())
+
+    assert not index.is_stale()
+
+
+def test_index_is_stale_after_import_outside_ayon(project):
+    media_pool = project.GetMediaPool()
+    index = media_pool_index.MediaPoolIndex(media_pool)
+
+    media_pool.SetCurrentFolder(_get_bin(media_pool, "Loader/sq001"))
+    media_pool.ImportMedia(["/proj/shots/sh0010/reference.mov"])
+
+    assert index.is_stale()
+    index.build()
+    assert not index.is_stale()
+
+
+def test_index_is_stale_after_delete_outside_ayon(project):
+    media_pool = project.GetMediaPool()
+    index = media_pool_index.MediaPoolIndex(media_pool)
+
+    shot_bin = _get_bin(media_pool, "Loader/sq002")
+    media_pool.DeleteClips(shot_bin.GetClipList()[:1])
+
+    assert index.is_stale()
+
+
+def test_index_is_stale_after_bin_deleted_outside_ayon(project):
+    media_pool = project.GetMediaPool()
+    index = media_pool_index.MediaPoolIndex(media_pool)
+
+    media_pool.DeleteFolders([_get_bin(media_pool, "Loader/sq002")])
+
+    assert index.is_stale()
+
+
+def test_index_is_not_stale_after_changes_made_by_ayon(project):
+    media_pool = project.GetMediaPool()
+    index = media_pool_index.MediaPoolIndex(media_pool)
+
+    shot_bin = _get_bin(media_pool, "Loader/sq001")
+    media_pool.SetCurrentFolder(shot_bin)
+    imported = media_pool.ImportMedia(["/proj/shots/sh0010/reference.mov"])
+    index.add(imported, shot_bin)
+
+    target_bin = _get_bin(media_pool, "Loader/sq002")
+    media_pool.MoveClips(imported, target_bin)
+    index.move(imported, target_bin)
+
+    assert not index.is_stale()
+    assert index.get_by_path(
+        "/proj/shots/sh0010/reference.mov", target_bin) == imported[0]
+
+
+def test_get_by_path_finds_sequence_by_first_frame(project):
+    index = media_pool_index.MediaPoolIndex(project.GetMediaPool())
+
+    media_pool_item = index.get_by_path(
+        "/proj/shots/sh0010/plate_v001.1001.exr")
+
+    assert media_pool_item is not None
+    assert media_pool_item.GetName() == "plate_v001.[1001-1064].exr"